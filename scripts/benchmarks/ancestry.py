@@ -0,0 +1,92 @@
+"""
+Benchmark for ancestry queries on deeply nested code.
+
+For each node we ask for its closest loop
+and whether it is inside the outermost function,
+like block and overuse visitors do.
+Compares climbing parents with positions and cached closest parents.
+
+Usage::
+
+    python scripts/benchmarks/ancestry.py [nesting_depth]
+
+"""
+
+import ast
+import sys
+import time
+
+from wemake_python_styleguide.logic import walk
+from wemake_python_styleguide.logic.nodes import get_parent
+from wemake_python_styleguide.transformations.ast_tree import transform
+
+#: Python does not allow more than 100 levels of indentation.
+_DEFAULT_DEPTH = 45
+_REPEAT = 3
+_INDENT = '    '
+
+_LEVEL_TEMPLATE = """
+{0}def function_{1}(arg):
+{0}    for item in arg:
+{0}        item = [number + {1} for number in item]
+"""
+
+
+def _build_code(depth: int) -> str:
+    levels = [
+        _LEVEL_TEMPLATE.format(_INDENT * level * 2, level)
+        for level in range(depth)
+    ]
+    last_indent = _INDENT * (depth * 2)
+    return '{0}{1}return arg'.format(''.join(levels), last_indent)
+
+
+def _legacy_queries(nodes, container):
+    for node in nodes:
+        parent = get_parent(node)
+        while parent is not None and not isinstance(parent, ast.For):
+            parent = get_parent(parent)
+
+        parent = get_parent(node)
+        while parent is not None and parent is not container:
+            parent = get_parent(parent)
+
+
+def _indexed_queries(nodes, container):
+    for node in nodes:
+        walk.get_closest_parent(node, ast.For)
+        walk.is_contained_by(node, container)
+
+
+def _measure_once(queries, code: str) -> float:
+    tree = transform(ast.parse(code))  # caches must be empty
+    nodes = list(ast.walk(tree))
+    start = time.perf_counter()
+    queries(nodes, tree.body[0])
+    return time.perf_counter() - start
+
+
+def _measure(queries, code: str) -> float:
+    return min(_measure_once(queries, code) for _ in range(_REPEAT))
+
+
+def main() -> None:
+    """Runs all strategies over the same code."""
+    depth = _DEFAULT_DEPTH
+    if len(sys.argv) > 1:
+        depth = int(sys.argv[1])
+
+    code = _build_code(depth)
+    print('depth: {0}'.format(depth))  # noqa: WPS421
+    strategies = (
+        ('parent climbing', _legacy_queries),
+        ('ancestry index', _indexed_queries),
+    )
+    for label, queries in strategies:
+        print('{0:<17}{1:.4f}s'.format(  # noqa: WPS421
+            label, _measure(queries, code),
+        ))
+
+
+if __name__ == '__main__':
+    main()
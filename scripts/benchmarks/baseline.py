@@ -0,0 +1,100 @@
+"""
+Benchmark for loading large baseline files.
+
+Baseline files of legacy projects have hundreds of thousands of violations.
+We generate a baseline file and measure:
+
+1. Loading of the whole file, it happens once per ``flake8`` run
+2. Finding known violations of every module, it happens once per module
+
+Usage::
+
+    python scripts/benchmarks/baseline.py [number_of_modules]
+
+"""
+
+import os
+import random
+import sys
+import tempfile
+import time
+
+from wemake_python_styleguide.baseline import Baseline
+
+#: About 500 thousands of violations.
+_DEFAULT_MODULES = 100000
+_VIOLATIONS_PER_MODULE = 5
+_FINGERPRINT_BITS = 64
+_REPEAT = 3
+
+
+def _make_fingerprint() -> str:
+    bits = random.getrandbits(_FINGERPRINT_BITS)  # noqa: S311
+    return '{0:016x}'.format(bits)
+
+
+def _write_baseline(baseline_path: str, modules: int) -> None:
+    with open(baseline_path, 'w') as baseline:
+        baseline.writelines(
+            '{0:040x}\tpackage/module_{1}.py\t{2}\n'.format(
+                index,
+                index,
+                ' '.join(
+                    _make_fingerprint() for _ in range(_VIOLATIONS_PER_MODULE)
+                ),
+            )
+            for index in range(modules)
+        )
+
+
+def _load(baseline_path: str, modules: int) -> None:
+    Baseline(baseline_path, 'benchmark', update=False)
+
+
+def _get_all(baseline_path: str, modules: int) -> None:
+    baseline = Baseline(baseline_path, 'benchmark', update=False)
+    for index in range(modules):
+        baseline.get('package/module_{0}.py'.format(index), '')
+
+
+def _measure_once(run, baseline_path: str, modules: int) -> float:
+    start = time.perf_counter()
+    run(baseline_path, modules)
+    return time.perf_counter() - start
+
+
+def _measure(run, baseline_path: str, modules: int) -> float:
+    return min(
+        _measure_once(run, baseline_path, modules) for _ in range(_REPEAT)
+    )
+
+
+_STRATEGIES = (
+    ('load', _load),
+    ('load + get all', _get_all),
+)
+
+
+def main() -> None:
+    """Measures loading of a large baseline file."""
+    modules = _DEFAULT_MODULES
+    if len(sys.argv) > 1:
+        modules = int(sys.argv[1])
+
+    with tempfile.TemporaryDirectory() as directory:
+        os.chdir(directory)
+        baseline_path = os.path.join(directory, 'baseline')
+        _write_baseline(baseline_path, modules)
+
+        print('modules: {0}'.format(modules))  # noqa: WPS421
+        print('size: {0} bytes'.format(  # noqa: WPS421
+            os.path.getsize(baseline_path),
+        ))
+        for label, run in _STRATEGIES:
+            print('{0:<17}{1:.4f}s'.format(  # noqa: WPS421
+                label, _measure(run, baseline_path, modules),
+            ))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,77 @@
+"""
+Benchmark for comparing expressions.
+
+Groups all the same expressions in the given files,
+like ``ExpressionOveruseVisitor`` does.
+Compares ``astor`` source generation and structural fingerprints.
+
+Usage::
+
+    python scripts/benchmarks/fingerprints.py [path ...]
+
+"""
+
+import ast
+import glob
+import sys
+import time
+from collections import defaultdict
+
+from wemake_python_styleguide.logic.fingerprints import get_fingerprint
+from wemake_python_styleguide.logic.source import node_to_string
+
+_DEFAULT_PATHS = ('wemake_python_styleguide/**/*.py',)
+_REPEAT = 3
+
+
+def _collect_expressions(filenames):
+    expressions = []
+    for filename in filenames:
+        with open(filename) as source:
+            tree = ast.parse(source.read())
+        expressions.extend(
+            node for node in ast.walk(tree) if isinstance(node, ast.expr)
+        )
+    return expressions
+
+
+def _group(expressions, group_key) -> int:
+    groups = defaultdict(list)
+    for expression in expressions:
+        groups[group_key(expression)].append(expression)
+    return len(groups)
+
+
+def _measure_once(group_key, filenames) -> float:
+    expressions = _collect_expressions(filenames)  # caches must be empty
+    start = time.perf_counter()
+    _group(expressions, group_key)
+    return time.perf_counter() - start
+
+
+def _measure(group_key, filenames) -> float:
+    return min(_measure_once(group_key, filenames) for _ in range(_REPEAT))
+
+
+def main() -> None:
+    """Runs all strategies over the same expressions."""
+    patterns = sys.argv[1:] or _DEFAULT_PATHS
+    filenames = [
+        filename
+        for pattern in patterns
+        for filename in glob.glob(pattern, recursive=True)
+    ]
+
+    print('files: {0}'.format(len(filenames)))  # noqa: WPS421
+    strategies = (
+        ('astor', node_to_string),
+        ('fingerprints', get_fingerprint),
+    )
+    for label, group_key in strategies:
+        print('{0:<17}{1:.4f}s'.format(  # noqa: WPS421
+            label, _measure(group_key, filenames),
+        ))
+
+
+if __name__ == '__main__':
+    main()
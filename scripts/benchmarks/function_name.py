@@ -0,0 +1,79 @@
+"""
+Benchmark for names of called functions.
+
+Resolves the name of every called function in the given files,
+like ``given_function_called`` does.
+Compares ``astor`` source generation and the dotted name resolver.
+
+Usage::
+
+    python scripts/benchmarks/function_name.py [path ...]
+
+"""
+
+import ast
+import glob
+import sys
+import time
+
+from wemake_python_styleguide.logic.source import node_to_string
+from wemake_python_styleguide.logic.tree.functions import get_function_name
+
+_DEFAULT_PATHS = ('wemake_python_styleguide/**/*.py',)
+_REPEAT = 3
+
+
+def _collect_calls(filenames):
+    calls = []
+    for filename in filenames:
+        with open(filename) as source:
+            tree = ast.parse(source.read())
+        calls.extend(
+            node for node in ast.walk(tree) if isinstance(node, ast.Call)
+        )
+    return calls
+
+
+def _source_names(calls):
+    for call in calls:
+        node_to_string(call.func)
+
+
+def _resolved_names(calls):
+    for call in calls:
+        get_function_name(call)
+
+
+def _measure_once(resolve, filenames) -> float:
+    calls = _collect_calls(filenames)  # caches must be empty
+    start = time.perf_counter()
+    resolve(calls)
+    return time.perf_counter() - start
+
+
+def _measure(resolve, filenames) -> float:
+    return min(_measure_once(resolve, filenames) for _ in range(_REPEAT))
+
+
+def main() -> None:
+    """Runs all strategies over the same calls."""
+    patterns = sys.argv[1:] or _DEFAULT_PATHS
+    filenames = [
+        filename
+        for pattern in patterns
+        for filename in glob.glob(pattern, recursive=True)
+    ]
+
+    print('files: {0}'.format(len(filenames)))  # noqa: WPS421
+    strategies = (
+        ('astor', _source_names),
+        ('dotted names', _resolved_names),
+    )
+    for label, resolve in strategies:
+        print('{0:<17}{1:.4f}s'.format(  # noqa: WPS421
+            label, _measure(resolve, filenames),
+        ))
+
+
+if __name__ == '__main__':
+    main()
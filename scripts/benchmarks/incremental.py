@@ -0,0 +1,109 @@
+"""
+Benchmark for incremental checks of an edited module.
+
+Editors check the same module again after each save.
+We generate a large module and change a single function in it.
+Then compare the full check with the incremental one,
+which reuses results of all other functions from the previous run.
+
+Usage::
+
+    python scripts/benchmarks/incremental.py [number_of_functions]
+
+"""
+
+import ast
+import io
+import sys
+import time
+import tokenize
+from collections import namedtuple
+
+from wemake_python_styleguide.checker import Checker
+from wemake_python_styleguide.incremental import IncrementalState
+from wemake_python_styleguide.options.config import Configuration
+
+#: About 3000 lines of code.
+_DEFAULT_FUNCTIONS = 250
+_REPEAT = 3
+
+_FUNCTION_TEMPLATE = """
+
+def function_{0}(first, second):
+    \"\"\"Docstring of the function.\"\"\"
+    numbers = [item * {1} for item in first if item]
+    if second > {1}:
+        return sum(numbers) + len(first)
+    for number in numbers:
+        print(number, second)
+    return max(numbers, default=second)
+"""
+
+
+def _parse_options():
+    all_options = (
+        *Configuration._options,  # noqa: WPS437
+        *Configuration._runtime_options,  # noqa: WPS437
+    )
+    default_values = {
+        option.long_option_name[2:].replace('-', '_'): option.default
+        for option in all_options
+    }
+    options = namedtuple('options', default_values.keys())
+    Checker.parse_options(options(**default_values))
+
+
+def _build_code(functions: int, edited: int) -> str:
+    return 'import os\n{0}'.format(''.join(
+        _FUNCTION_TEMPLATE.format(index, index + int(index == edited))
+        for index in range(functions)
+    ))
+
+
+def _check(code: str, incremental_state) -> int:
+    checker = Checker(
+        ast.parse(code),
+        list(tokenize.generate_tokens(io.StringIO(code).readline)),
+        'benchmark.py',
+        code.splitlines(keepends=True),
+    )
+    checker.incremental_state = incremental_state
+    return len(list(checker.run()))
+
+
+def _measure_once(functions: int, incremental_state) -> float:
+    # We check the original module first to fill the state:
+    _check(_build_code(functions, edited=-1), incremental_state)
+    edited_code = _build_code(functions, edited=functions // 2)
+    start = time.perf_counter()
+    _check(edited_code, incremental_state)
+    return time.perf_counter() - start
+
+
+def _measure(functions: int, state_factory) -> float:
+    return min(
+        _measure_once(functions, state_factory())
+        for _ in range(_REPEAT)
+    )
+
+
+def main() -> None:
+    """Compares full and incremental checks after a single edit."""
+    functions = _DEFAULT_FUNCTIONS
+    if len(sys.argv) > 1:
+        functions = int(sys.argv[1])
+
+    _parse_options()
+    print('functions: {0}'.format(functions))  # noqa: WPS421
+    strategies = (
+        ('full check', lambda: None),
+        ('incremental', IncrementalState),
+    )
+    for label, state_factory in strategies:
+        print('{0:<17}{1:.4f}s'.format(  # noqa: WPS421
+            label, _measure(functions, state_factory),
+        ))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,86 @@
+"""
+Benchmark for subtree queries on deeply nested code.
+
+Asks whether each node contains an ``ast.Lambda``, like loop visitors do.
+Compares plain tree walking, the node type index,
+and the subtree summary from ``logic/index.py``.
+
+Usage::
+
+    python scripts/benchmarks/nested.py [nesting_depth]
+
+"""
+
+import ast
+import sys
+import timeit
+
+from wemake_python_styleguide.logic import walk
+from wemake_python_styleguide.transformations.ast_tree import transform
+
+#: Python does not allow more than 100 levels of indentation.
+_DEFAULT_DEPTH = 45
+_INDENT = '    '
+
+_LEVEL_TEMPLATE = """
+{0}def function_{1}(arg):
+{0}    for item in arg:
+{0}        item = [number + {1} for number in item]
+"""
+
+
+def _build_code(depth: int) -> str:
+    levels = [
+        _LEVEL_TEMPLATE.format(_INDENT * level * 2, level)
+        for level in range(depth)
+    ]
+    last_indent = _INDENT * (depth * 2)
+    return '{0}{1}return arg'.format(''.join(levels), last_indent)
+
+
+def _build_nodes(depth: int):
+    tree = transform(ast.parse(_build_code(depth)))
+    return list(ast.walk(tree))
+
+
+def _walk_query(nodes):
+    for node in nodes:
+        any(isinstance(sub, ast.Lambda) for sub in ast.walk(node))
+
+
+def _index_query(nodes):
+    for node in nodes:
+        next(walk.get_subnodes(node, ast.Lambda), None)
+
+
+def _summary_query(nodes):
+    for node in nodes:
+        walk.is_contained(node, ast.Lambda)
+
+
+def _measure(query, nodes) -> float:
+    return min(timeit.repeat(lambda: query(nodes), number=1, repeat=3))
+
+
+def main() -> None:
+    """Runs all strategies over the same nodes."""
+    depth = _DEFAULT_DEPTH
+    if len(sys.argv) > 1:
+        depth = int(sys.argv[1])
+
+    nodes = _build_nodes(depth)
+    print('depth: {0}, nodes: {1}'.format(depth, len(nodes)))  # noqa: WPS421
+
+    strategies = (
+        ('ast.walk', _walk_query),
+        ('type index', _index_query),
+        ('subtree summary', _summary_query),
+    )
+    for label, query in strategies:
+        print('{0:<17}{1:.4f}s'.format(  # noqa: WPS421
+            label, _measure(query, nodes),
+        ))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,99 @@
+"""
+Benchmark for modules that are read ahead of their checks.
+
+Modules are read from a slow file system, like a network one.
+We emulate it with a delay on each read.
+Then we compare checks that read each module on their own
+with checks of modules that are read in background threads.
+
+Usage::
+
+    python scripts/benchmarks/prefetch.py [read_delay_in_seconds]
+
+Latency is the time it takes to check the first module.
+
+"""
+
+import collections
+import functools
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+from flake8 import processor
+
+from wemake_python_styleguide.linter import prefetch
+from wemake_python_styleguide.linter.linter import Linter
+
+_MODULES = 200
+_READ_DELAY = 0.005
+
+_MODULE_TEMPLATE = """
+
+def function_{0}(first, second):
+    \"\"\"Docstring of the function.\"\"\"
+    numbers = [item * {0} for item in first if item]
+    if second > {0}:
+        return sum(numbers) + len(first)
+    return max(numbers, default=second)
+"""
+
+
+def _slow_reads(read_lines, delay):
+    @functools.wraps(read_lines)
+    def read_lines_slowly(self):  # noqa: WPS430
+        time.sleep(delay)
+        return read_lines(self)
+    return read_lines_slowly
+
+
+def _check_in_place(linter, filenames):
+    for filename in filenames:
+        linter.check_module(filename)
+        yield
+
+
+def _check_read_ahead(linter, filenames):
+    read_modules = prefetch.read_modules(linter.options, filenames)
+    for filename, read_module in read_modules:
+        linter.check_module(filename, read_module=read_module)
+        yield
+
+
+def _measure(name, checks) -> None:
+    start = time.perf_counter()
+    next(checks)
+    latency = time.perf_counter() - start
+    collections.deque(checks, maxlen=0)  # runs the rest of checks
+    print('{0:<11}total {1:.3f}s, latency {2:.4f}s'.format(  # noqa: WPS421
+        name, time.perf_counter() - start, latency,
+    ))
+
+
+def main() -> None:
+    """Compares checks of modules that are read in place and ahead."""
+    delay = _READ_DELAY
+    if len(sys.argv) > 1:
+        delay = float(sys.argv[1])
+
+    linter = Linter(['--isolated'])
+    linter.prepare()
+    processor.FileProcessor.read_lines = _slow_reads(
+        processor.FileProcessor.read_lines, delay,
+    )
+    with tempfile.TemporaryDirectory() as directory:
+        filenames = []
+        for index in range(_MODULES):
+            filenames.append(str(Path(directory, 'm{0}.py'.format(index))))
+            Path(filenames[-1]).write_text(_MODULE_TEMPLATE.format(index))
+
+        print('modules: {0}, read delay: {1}s'.format(  # noqa: WPS421
+            _MODULES, delay,
+        ))
+        _measure('in place', _check_in_place(linter, filenames))
+        _measure('read ahead', _check_read_ahead(linter, filenames))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,106 @@
+"""
+Benchmark for workers that are forked from a warmed up parent.
+
+Each worker checks a module and reports its memory.
+Resident memory includes pages shared with the parent,
+private memory is what a worker has copied or allocated on its own.
+Start latency is the time it takes to start workers
+and to check the first module in each of them.
+
+Usage::
+
+    python scripts/benchmarks/prefork.py [number_of_jobs]
+
+It reads ``/proc``, so it works on Linux only.
+
+"""
+
+import contextlib
+import functools
+import multiprocessing
+import os
+import statistics
+import sys
+import time
+
+from wemake_python_styleguide.linter import prefork
+from wemake_python_styleguide.linter.linter import Linter
+from wemake_python_styleguide.linter.modules import check_module
+
+_MODULE = 'wemake_python_styleguide/checker.py'
+_REPEAT = 5
+
+
+def _read_memory() -> tuple:
+    """Returns resident and private memory of this process in kilobytes."""
+    sizes = {}
+    with open('/proc/self/smaps_rollup') as smaps:
+        for line in smaps:
+            field = line.split()
+            if len(field) == 3:
+                sizes[field[0]] = int(field[1])
+    return (
+        sizes['Rss:'],
+        sizes['Private_Clean:'] + sizes['Private_Dirty:'],
+    )
+
+
+def _check(options, filename) -> tuple:
+    check_module(options, filename)
+    return os.getpid(), _read_memory()
+
+
+def _start_pool(jobs, *, warm):
+    if not warm:
+        return multiprocessing.Pool(jobs)
+    prefork.warm_up()
+    with prefork.frozen_objects():
+        return multiprocessing.Pool(jobs)
+
+
+def _measure_once(options, jobs, *, warm) -> tuple:
+    start = time.perf_counter()
+    pool = _start_pool(jobs, warm=warm)
+    with contextlib.closing(pool):
+        memory = dict(pool.map(
+            functools.partial(_check, options),
+            [_MODULE for _ in range(jobs)],
+            chunksize=1,
+        ))
+        latency = time.perf_counter() - start
+    pool.join()
+    return latency, memory.values()
+
+
+def _measure(options, jobs, *, warm) -> None:
+    runs = [
+        _measure_once(options, jobs, warm=warm)
+        for _ in range(_REPEAT)
+    ]
+    memory = [
+        worker_memory for run in runs for worker_memory in run[1]
+    ]
+    print('{0:<6}start {1:.4f}s, rss {2:.0f}kB, private {3:.0f}kB'.format(  # noqa: WPS421, E501
+        'warm' if warm else 'cold',
+        min(run[0] for run in runs),
+        statistics.mean(worker_memory[0] for worker_memory in memory),
+        statistics.mean(worker_memory[1] for worker_memory in memory),
+    ))
+
+
+def main() -> None:
+    """Compares workers forked from cold and warmed up parents."""
+    jobs = multiprocessing.cpu_count()
+    if len(sys.argv) > 1:
+        jobs = int(sys.argv[1])
+
+    linter = Linter(['--isolated'])
+    linter.prepare()
+    print('jobs: {0}'.format(jobs))  # noqa: WPS421
+    # Warmed up state can not be dropped, so cold workers go first:
+    _measure(linter.options, jobs, warm=False)
+    _measure(linter.options, jobs, warm=True)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,57 @@
+"""
+Counts how often nodes are converted back to the source code.
+
+Runs ``flake8`` with our plugin in a single process
+and reports how many ``node_to_string`` calls were made,
+for how many unique nodes, and how many real conversions happened.
+
+Usage::
+
+    python scripts/benchmarks/rendering.py [path ...]
+
+"""
+
+import sys
+
+import astor
+from flake8.main.application import Application
+
+from wemake_python_styleguide.logic import source
+
+_DEFAULT_PATHS = ('wemake_python_styleguide',)
+
+_requested_nodes = []
+_converted_nodes = []
+
+
+def _track(requested, function):
+    def factory(node, *args, **kwargs):
+        requested.append(node)  # we keep nodes alive to have unique ids
+        return function(node, *args, **kwargs)
+    return factory
+
+
+def main() -> None:
+    """Runs ``flake8`` and prints the cache hit rate."""
+    paths = sys.argv[1:] or list(_DEFAULT_PATHS)
+
+    source.node_to_string = _track(  # noqa: WPS121
+        _requested_nodes, source.node_to_string,
+    )
+    astor.to_source = _track(_converted_nodes, astor.to_source)
+    Application().run(['--select=WPS', '--jobs=1', '--exit-zero', *paths])
+
+    requests = len(_requested_nodes)
+    hits = requests - len(_converted_nodes)
+    print(  # noqa: WPS421
+        'requests: {0}, unique nodes: {1}, hits: {2}, hit rate: {3:.1%}'.format(
+            requests,
+            len({id(node) for node in _requested_nodes}),
+            hits,
+            hits / requests if requests else 0,
+        ),
+    )
+
+
+if __name__ == '__main__':
+    main()
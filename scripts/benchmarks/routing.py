@@ -0,0 +1,84 @@
+"""
+Micro-benchmark for the per-node routing cost of ``ast`` visitors.
+
+Compares the old routing (string formatting and ``getattr`` for each node)
+with the dispatch tables from ``compat/routing.py``.
+
+Usage::
+
+    python scripts/benchmarks/routing.py [number_of_nodes]
+
+"""
+
+import ast
+import sys
+import timeit
+
+from wemake_python_styleguide.compat.routing import (
+    get_handler_name,
+    get_visit_method,
+)
+from wemake_python_styleguide.presets.types import tree
+
+_DEFAULT_NODES = 100000
+_NANOSECONDS = 10 ** 9
+
+_MODULE_TEMPLATE = """
+def function_{0}(arg, *args, **kwargs):
+    if arg > {0} and arg is not None:
+        return [item.attr['key'] for item in args if item]
+    return kwargs.get('name', 'default') + str({0}.5)
+"""
+
+
+def _build_nodes(number_of_nodes: int):
+    nodes = []
+    index = 0
+    while len(nodes) < number_of_nodes:
+        nodes.extend(ast.walk(ast.parse(_MODULE_TEMPLATE.format(index))))
+        index += 1
+    return nodes[:number_of_nodes]
+
+
+def _legacy_route(visitor_class, nodes):
+    for node in nodes:
+        getattr(visitor_class, get_handler_name(node), None)
+
+
+def _table_route(visitor_class, nodes):
+    for node in nodes:
+        get_visit_method(visitor_class, node)
+
+
+def _measure(route, nodes) -> float:
+    def factory():
+        for visitor_class in tree.PRESET:
+            route(visitor_class, nodes)
+
+    factory()  # warm up, also fills dispatch tables
+    elapsed = min(timeit.repeat(factory, number=1, repeat=5))
+    return elapsed / len(nodes) / len(tree.PRESET) * _NANOSECONDS
+
+
+def main() -> None:
+    """Runs both routing strategies over the same nodes."""
+    number_of_nodes = _DEFAULT_NODES
+    if len(sys.argv) > 1:
+        number_of_nodes = int(sys.argv[1])
+    nodes = _build_nodes(number_of_nodes)
+
+    print('nodes: {0}, visitors: {1}'.format(  # noqa: WPS421
+        len(nodes), len(tree.PRESET),
+    ))
+    strategies = (
+        ('format + getattr', _legacy_route),
+        ('dispatch table', _table_route),
+    )
+    for label, route in strategies:
+        print('{0:<18}{1:.1f} ns per node and visitor'.format(  # noqa: WPS421
+            label, _measure(route, nodes),
+        ))
+
+
+if __name__ == '__main__':
+    main()
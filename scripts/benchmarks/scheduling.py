@@ -0,0 +1,128 @@
+"""
+Benchmark for scheduling of modules between worker processes.
+
+Real projects have a few huge modules, like generated ones,
+and a lot of small modules. We generate such a skewed project,
+where the huge module is found last. Then compare the discovery order
+of modules with the largest first order of our parallel runner.
+
+Usage::
+
+    python scripts/benchmarks/scheduling.py [number_of_jobs]
+
+Use the number of cores, there is no gain when workers share cores.
+So, we also simulate both orders with timings of each module,
+that are measured in a single process.
+
+"""
+
+import heapq
+import itertools
+import multiprocessing
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+from wemake_python_styleguide.linter import parallel
+from wemake_python_styleguide.linter.linter import Linter
+
+_SMALL_MODULES = 600
+_LARGE_MODULE_FUNCTIONS = 1000
+_REPEAT = 3
+
+_FUNCTION_TEMPLATE = """
+
+def function_{0}(first, second):
+    \"\"\"Docstring of the function.\"\"\"
+    numbers = [item * {0} for item in first if item]
+    if second > {0}:
+        return sum(numbers) + len(first)
+    return max(numbers, default=second)
+"""
+
+
+def _discovery_order(filenames, jobs):
+    batch_size = max(len(filenames) // (jobs * 4), 1)
+    return [
+        list(batch)
+        for _, batch in itertools.groupby(
+            enumerate(filenames),
+            key=lambda indexed_module: indexed_module[0] // batch_size,
+        )
+    ]
+
+
+def _build_project(directory: Path) -> list:
+    filenames = []
+    for index in range(_SMALL_MODULES):
+        filenames.append(str(directory / 'small_{0}.py'.format(index)))
+        Path(filenames[-1]).write_text(''.join(
+            _FUNCTION_TEMPLATE.format(function) for function in range(5)
+        ))
+
+    # About 7000 lines, it is found last:
+    filenames.append(str(directory / 'generated.py'))
+    Path(filenames[-1]).write_text(''.join(
+        _FUNCTION_TEMPLATE.format(function)
+        for function in range(_LARGE_MODULE_FUNCTIONS)
+    ))
+    return filenames
+
+
+def _measure_modules(filenames) -> list:
+    linter = Linter(['--isolated'])
+    linter.prepare()
+    timings = []
+    for filename in filenames:
+        start = time.perf_counter()
+        linter.check_module(filename)
+        timings.append(time.perf_counter() - start)
+    return timings
+
+
+def _simulate(batches, timings, jobs) -> float:
+    """Each batch is sent to the first free worker, like pools do."""
+    workers = [0.0 for _ in range(jobs)]
+    for batch in batches:
+        heapq.heapreplace(workers, workers[0] + sum(
+            timings[index] for index, _ in batch
+        ))
+    return max(workers)
+
+
+def _measure_once(argv) -> float:
+    start = time.perf_counter()
+    Linter(argv).run()
+    return time.perf_counter() - start
+
+
+def _compare(filenames, jobs) -> None:
+    argv = ['--isolated', '--jobs', str(jobs), *filenames]
+    timings = _measure_modules(filenames)
+    schedules = (
+        ('largest first', parallel._schedule),  # noqa: WPS437
+        ('discovery order', _discovery_order),
+    )
+    for label, schedule in schedules:
+        parallel._schedule = schedule  # noqa: WPS437
+        print('{0:<17}{1:.4f}s, simulated {2:.4f}s'.format(  # noqa: WPS421
+            label,
+            min(_measure_once(argv) for _ in range(_REPEAT)),
+            _simulate(schedule(filenames, jobs), timings, jobs),
+        ))
+
+
+def main() -> None:
+    """Compares the discovery order with the largest first order."""
+    jobs = multiprocessing.cpu_count()
+    if len(sys.argv) > 1:
+        jobs = int(sys.argv[1])
+
+    print('jobs: {0}'.format(jobs))  # noqa: WPS421
+    with tempfile.TemporaryDirectory() as directory:
+        _compare(_build_project(Path(directory)), jobs)
+
+
+if __name__ == '__main__':
+    main()
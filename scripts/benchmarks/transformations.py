@@ -0,0 +1,159 @@
+"""
+Benchmark for caching transformed trees.
+
+Compares the regular ``transform`` call with a side table cache.
+Side table stores all annotations of each node in pre-order,
+references to other nodes are stored as their positions.
+It is serialised with ``pickle`` to be shared between processes.
+
+Loading the side table still needs a full walk over a fresh tree
+to resolve positions, to set attributes, and to rebuild the index.
+So, we compare:
+
+1. Transformation without any cache
+2. Transformation and dumping of side tables on cache misses
+3. Loading and applying side tables on cache hits
+
+Usage::
+
+    python scripts/benchmarks/transformations.py [path ...]
+
+"""
+
+import ast
+import pickle  # noqa: S403
+import sys
+import time
+from pathlib import Path
+
+from wemake_python_styleguide.logic.index import NodeIndex
+from wemake_python_styleguide.logic.source import SourceSegments
+from wemake_python_styleguide.transformations.ast_tree import transform
+
+_DEFAULT_PATHS = ('wemake_python_styleguide/**/*.py',)
+_REPEAT = 3
+
+_NODE_ATTRIBUTES = ('wps_parent', 'wps_context', 'wps_if_chain')
+_VALUE_ATTRIBUTES = ('wps_if_chained', 'function_type', 'lineno', 'col_offset')
+
+
+class _SideTable(object):
+    """Annotations of all nodes in the same order as ``transform`` uses."""
+
+    def __init__(self, rows) -> None:
+        self.rows = rows
+
+    @classmethod
+    def capture(cls, tree) -> '_SideTable':
+        nodes = [node for node, _, _ in cls._walk(tree)]
+        positions = {id(node): position for position, node in enumerate(nodes)}
+        return cls([
+            (
+                tuple(
+                    positions.get(id(getattr(node, attribute, None)), -1)
+                    for attribute in _NODE_ATTRIBUTES
+                ),
+                tuple(
+                    getattr(node, attribute, None)
+                    for attribute in _VALUE_ATTRIBUTES
+                ),
+            )
+            for node in nodes
+        ])
+
+    def apply(self, tree, lines) -> None:
+        nodes = self._index(tree)
+        for node, row in zip(nodes, self.rows):
+            self._apply_row(node, nodes, *row)
+        setattr(  # noqa: B010
+            tree, 'wps_source_segments', SourceSegments(lines),
+        )
+
+    @classmethod
+    def _walk(cls, tree):
+        pending = [tree]
+        while pending:
+            node = pending.pop()
+            children = list(ast.iter_child_nodes(node))
+            yield node, children, len(pending)
+            pending.extend(reversed(children))
+
+    def _index(self, tree):
+        index = NodeIndex()
+        nodes = []
+        for node, children, pending in self._walk(tree):
+            index.add(node, is_leaf=not children, pending=pending)
+            nodes.append(node)
+        return nodes
+
+    def _apply_row(self, node, nodes, references, attribute_values) -> None:
+        for attribute, position in zip(_NODE_ATTRIBUTES, references):
+            if position >= 0:
+                setattr(node, attribute, nodes[position])
+        for name, attribute_value in zip(_VALUE_ATTRIBUTES, attribute_values):
+            if attribute_value is not None:
+                setattr(node, name, attribute_value)
+
+
+def _transform(trees, lines, serialised) -> None:
+    for tree, module_lines in zip(trees, lines):
+        transform(tree, module_lines)
+
+
+def _transform_and_dump(trees, lines, serialised) -> bytes:
+    return pickle.dumps([
+        _SideTable.capture(transform(tree, module_lines)).rows
+        for tree, module_lines in zip(trees, lines)
+    ])
+
+
+def _load_and_apply(trees, lines, serialised) -> None:
+    side_tables = pickle.loads(serialised)  # noqa: S301
+    for tree, rows, module_lines in zip(trees, side_tables, lines):
+        _SideTable(rows).apply(tree, module_lines)
+
+
+def _measure_once(run, sources, serialised) -> float:
+    trees = [ast.parse(source) for source in sources]
+    lines = [source.splitlines(keepends=True) for source in sources]
+    start = time.perf_counter()
+    run(trees, lines, serialised)
+    return time.perf_counter() - start
+
+
+def _measure(run, sources, serialised) -> float:
+    return min(
+        _measure_once(run, sources, serialised) for _ in range(_REPEAT)
+    )
+
+
+_STRATEGIES = (
+    ('transform', _transform),
+    ('transform + dump', _transform_and_dump),
+    ('load + apply', _load_and_apply),
+)
+
+
+def main() -> None:
+    """Compares the transformation with side tables."""
+    sources = [
+        path.read_text()
+        for pattern in sys.argv[1:] or _DEFAULT_PATHS
+        for path in Path().glob(pattern)
+    ]
+    serialised = _transform_and_dump(
+        [ast.parse(source) for source in sources],
+        [source.splitlines(keepends=True) for source in sources],
+        b'',
+    )
+
+    print('files: {0}'.format(len(sources)))  # noqa: WPS421
+    print('side tables: {0} bytes'.format(len(serialised)))  # noqa: WPS421
+    for label, run in _STRATEGIES:
+        print('{0:<17}{1:.4f}s'.format(  # noqa: WPS421
+            label, _measure(run, sources, serialised),
+        ))
+
+
+if __name__ == '__main__':
+    main()
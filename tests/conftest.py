@@ -3,6 +3,7 @@ from collections import namedtuple
 
 import pytest
 
+from wemake_python_styleguide.checker import Checker
 from wemake_python_styleguide.options.config import Configuration
 
 pytest_plugins = [
@@ -25,9 +26,13 @@ def absolute_path():
 @pytest.fixture(scope='session')
 def options():
     """Returns the options builder."""
+    all_options = (
+        *Configuration._options,  # noqa: WPS437
+        *Configuration._runtime_options,  # noqa: WPS437
+    )
     default_values = {
         option.long_option_name[2:].replace('-', '_'): option.default
-        for option in Configuration._options  # noqa: WPS437
+        for option in all_options
     }
 
     Options = namedtuple('options', default_values.keys())
@@ -44,3 +49,10 @@ def options():
 def default_options(options):  # noqa: WPS442
     """Returns the default options."""
     return options()
+
+
+@pytest.fixture()
+def reset_checker(default_options):  # noqa: WPS442
+    """Restores options of the checker, some tests change them."""
+    yield
+    Checker.parse_options(default_options)
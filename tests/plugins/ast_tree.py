@@ -30,6 +30,9 @@ def parse_ast_tree():
             # that are validated after the `ast` is processed:
             # like double arguments or `break` outside of loops.
             compile(code_to_parse, '<filename>', 'exec')  # noqa: WPS421
-        return transform(ast.parse(code_to_parse))
+        return transform(
+            ast.parse(code_to_parse),
+            code_to_parse.splitlines(keepends=True),
+        )
 
     return factory
@@ -0,0 +1,32 @@
+import ast
+
+import pytest
+
+from wemake_python_styleguide.baseline import Baseline
+from wemake_python_styleguide.violations.base import ASTViolation
+
+
+class _Violation(ASTViolation):
+    error_template = 'Found {0}'
+    code = 1
+
+
+@pytest.fixture()
+def make_violation():
+    """Returns a function to create a violation of a name."""
+    def factory(name):
+        return _Violation(ast.Name(id=name))
+    return factory
+
+
+@pytest.fixture()
+def record_baseline():
+    """Returns a function to write a baseline file with a single module."""
+    def factory(baseline_path, filename, source, violations=()):
+        baseline = Baseline(str(baseline_path), 'namespace', update=True)
+        module_baseline = baseline.get(filename, source)
+        assert all(
+            module_baseline.is_known(violation) for violation in violations
+        )
+        baseline.save(filename, source, module_baseline)
+    return factory
@@ -0,0 +1,63 @@
+import pytest
+
+from wemake_python_styleguide.baseline import Baseline
+
+_SOURCE = 'x = 1\n'
+
+
+def test_missing_baseline(tmp_path, make_violation):
+    """Ensures that missing baseline files have no known violations."""
+    baseline = Baseline(str(tmp_path / 'missing'), 'namespace', update=False)
+    module_baseline = baseline.get('test.py', _SOURCE)
+
+    assert not baseline.key
+    assert not module_baseline.is_known(make_violation('x'))
+    baseline.save('test.py', _SOURCE, module_baseline)
+    assert not (tmp_path / 'missing').exists()
+
+
+def test_disabled_baseline(make_violation):
+    """Ensures that empty file name disables the baseline."""
+    baseline = Baseline('', 'namespace', update=True)
+    module_baseline = baseline.get('test.py', _SOURCE)
+
+    assert not module_baseline.is_known(make_violation('x'))
+
+
+def test_unchanged_module(tmp_path, record_baseline):
+    """Ensures that unchanged modules are found by their hash."""
+    baseline_path = tmp_path / 'baseline'
+    record_baseline(baseline_path, str(tmp_path / 'test.py'), _SOURCE)
+    baseline = Baseline(str(baseline_path), 'namespace', update=False)
+
+    assert baseline.key
+    assert baseline.get(str(tmp_path / 'test.py'), _SOURCE) is None
+    assert baseline.get(str(tmp_path / 'test.py'), 'y = 2\n') is not None
+    assert baseline.get(str(tmp_path / 'other.py'), _SOURCE) is not None
+    assert Baseline(
+        str(baseline_path), 'other', update=False,
+    ).get(str(tmp_path / 'test.py'), _SOURCE) is not None
+
+
+def test_relative_paths(tmp_path, monkeypatch, record_baseline):
+    """Ensures that modules are stored relative to the baseline."""
+    (tmp_path / 'nested').mkdir()
+    monkeypatch.chdir(tmp_path / 'nested')
+    record_baseline(tmp_path / 'baseline', 'test.py', _SOURCE)
+    monkeypatch.chdir(tmp_path)
+
+    baseline = Baseline('baseline', 'namespace', update=False)
+
+    assert (tmp_path / 'baseline').read_text().split('\t')[1] == (
+        'nested/test.py'
+    )
+    assert baseline.get('nested/test.py', _SOURCE) is None
+
+
+def test_broken_baseline(tmp_path):
+    """Ensures that broken baseline files are not ignored."""
+    baseline_path = tmp_path / 'baseline'
+    baseline_path.write_text('broken\n')
+
+    with pytest.raises(ValueError, match='substring not found'):
+        Baseline(str(baseline_path), 'namespace', update=False)
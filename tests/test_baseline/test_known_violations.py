@@ -0,0 +1,46 @@
+from wemake_python_styleguide.baseline import Baseline
+
+_SOURCE = 'x = 1\n'
+_CHANGED_SOURCE = 'changed = 1\n'
+
+
+def test_known_violations(tmp_path, make_violation, record_baseline):
+    """Ensures that each known violation is matched only once."""
+    baseline_path = tmp_path / 'baseline'
+    record_baseline(baseline_path, 'test.py', _SOURCE, violations=[
+        make_violation('x'),
+        make_violation('x'),
+        make_violation('y'),
+    ])
+    module_baseline = Baseline(
+        str(baseline_path), 'namespace', update=False,
+    ).get('test.py', _CHANGED_SOURCE)
+
+    assert [
+        module_baseline.is_known(make_violation(name))
+        for name in ('x', 'z', 'x', 'x', 'y', 'y')
+    ] == [True, False, True, False, True, False]
+
+
+def test_last_record(tmp_path, make_violation, record_baseline):
+    """Ensures that the last record of a module is used."""
+    baseline_path = tmp_path / 'baseline'
+    record_baseline(baseline_path, 'test.py', _SOURCE, violations=[
+        make_violation('x'),
+    ])
+    first_records = baseline_path.read_text()
+    record_baseline(baseline_path, 'test.py', _CHANGED_SOURCE)
+    baseline_path.write_text(first_records + baseline_path.read_text())
+
+    baseline = Baseline(str(baseline_path), 'namespace', update=False)
+
+    assert baseline.get('test.py', _CHANGED_SOURCE) is None
+    assert not baseline.get('test.py', _SOURCE).is_known(make_violation('x'))
+
+
+def test_wrong_paths(tmp_path, record_baseline):
+    """Ensures that paths with new lines are not recorded."""
+    baseline_path = tmp_path / 'baseline'
+    record_baseline(baseline_path, 'wrong\nname.py', _SOURCE)
+
+    assert not baseline_path.read_text()
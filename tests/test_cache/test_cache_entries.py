@@ -0,0 +1,83 @@
+import json
+import os
+
+import pytest
+
+from wemake_python_styleguide.cache import ResultsCache
+
+_CODE = 'print(1)\n'
+_VIOLATIONS = {  # noqa: WPS407
+    'visitor': [(1, 0, 'WPS100 Some long enough violation message')],
+}
+
+_MAX_SIZE = 100
+_EVICTION_INTERVAL = 100
+
+
+def _cache_entries(directory):
+    return [
+        os.path.join(shard, entry)
+        for shard, _, entries in os.walk(directory)
+        for entry in entries
+    ]
+
+
+@pytest.mark.parametrize('entry_content', [
+    '',
+    '{"invalid": "entry"}',
+    '[[1, 2]]',
+])
+def test_results_cache_corrupted(tmp_path, entry_content):
+    """Ensures that broken entries are treated as misses."""
+    cache = ResultsCache(str(tmp_path), max_size=_MAX_SIZE, namespace=())
+    cache.set('test.py', _CODE, _VIOLATIONS)
+    with open(_cache_entries(tmp_path)[0], 'w') as entry:
+        entry.write(entry_content)
+
+    assert not cache.get('test.py', _CODE)
+
+
+def test_results_cache_write_error(tmp_path):
+    """Ensures that write errors are ignored."""
+    directory = tmp_path / 'file'
+    directory.write_text('')
+    cache = ResultsCache(str(directory), max_size=_MAX_SIZE, namespace=())
+    cache.set('test.py', _CODE, _VIOLATIONS)
+
+    assert not cache.get('test.py', _CODE)
+
+
+def test_results_cache_partial_write(tmp_path, monkeypatch):
+    """Ensures that partially written entries are removed."""
+    def factory(*args, **kwargs):
+        raise OSError('No space left on device')
+
+    monkeypatch.setattr(json, 'dump', factory)
+    cache = ResultsCache(str(tmp_path), max_size=_MAX_SIZE, namespace=())
+    cache.set('test.py', _CODE, _VIOLATIONS)
+
+    assert not _cache_entries(tmp_path)
+
+
+def test_results_cache_eviction(tmp_path):
+    """Ensures that least recently used entries are removed."""
+    cache = ResultsCache(str(tmp_path), max_size=_MAX_SIZE, namespace=())
+    (tmp_path / 'not-a-shard').write_text('')
+
+    cache.set('first.py', _CODE, _VIOLATIONS)
+    os.utime(_cache_entries(tmp_path)[0], (0, 0))
+    for index in range(_EVICTION_INTERVAL - 1):
+        cache.set('{0}.py'.format(index), _CODE, _VIOLATIONS)
+    cache.set('last.py', _CODE, _VIOLATIONS)  # triggers the eviction
+
+    assert not cache.get('first.py', _CODE)
+    assert cache.get('last.py', _CODE) == _VIOLATIONS
+    assert len(_cache_entries(tmp_path)) <= 2
+
+
+def test_results_cache_eviction_all(tmp_path):
+    """Ensures that entries larger than the cache are removed."""
+    cache = ResultsCache(str(tmp_path), max_size=0, namespace=())
+    cache.set('test.py', _CODE, _VIOLATIONS)
+
+    assert not _cache_entries(tmp_path)
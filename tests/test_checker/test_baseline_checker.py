@@ -0,0 +1,68 @@
+import ast
+
+import pytest
+
+from wemake_python_styleguide.checker import Checker
+from wemake_python_styleguide.incremental import IncrementalState
+
+_CODE = 'x = 1\ny = x\n'
+_EDITED_CODE = '\n\ny = 1\nz = y\nx = z\n'
+
+
+@pytest.fixture()
+def run_checker(options, default_options, tmp_path):
+    """Returns a function to run the checker with the baseline file."""
+    def factory(code=_CODE, **option_values):
+        Checker.parse_options(options(
+            baseline=str(tmp_path / 'baseline'),
+            results_cache_dir=str(tmp_path / 'cache'),
+            **option_values,
+        ))
+        checker = Checker(
+            tree=ast.parse(code),
+            file_tokens=[],
+            filename=str(tmp_path / 'test.py'),
+            lines=code.splitlines(keepends=True),
+        )
+        checker.incremental_state = IncrementalState()
+        return [violation[:3] for violation in checker.run()]
+
+    yield factory
+    Checker.parse_options(default_options)
+
+
+def test_baseline_update(run_checker):  # noqa: WPS442
+    """Ensures that all violations are recorded and not reported."""
+    assert run_checker()
+    assert not run_checker(baseline_update=True)
+    assert not run_checker()
+
+
+def test_unchanged_module(run_checker, monkeypatch):  # noqa: WPS442
+    """Ensures that unchanged modules are not checked."""
+    run_checker(baseline_update=True)
+    executed = []
+
+    def factory(checker, visitor_classes):
+        executed.extend(visitor_classes)
+        return {}
+
+    monkeypatch.setattr(Checker, '_run_checks', factory)
+
+    assert not run_checker()
+    assert not executed
+    assert not run_checker(max_line_complexity=1)
+    assert executed
+
+
+def test_new_violations(run_checker):  # noqa: WPS442
+    """Ensures that only new violations are reported."""
+    run_checker(baseline_update=True)
+
+    assert run_checker(_EDITED_CODE) == [
+        (4, 0, 'WPS111 Found too short name: z < 2'),
+    ]
+    # Results from the cache use the same baseline:
+    assert run_checker(_EDITED_CODE) == [
+        (4, 0, 'WPS111 Found too short name: z < 2'),
+    ]
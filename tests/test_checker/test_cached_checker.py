@@ -0,0 +1,99 @@
+import ast
+
+import pytest
+
+from wemake_python_styleguide.checker import Checker
+from wemake_python_styleguide.visitors.ast.complexity.jones import (
+    JonesComplexityVisitor,
+)
+from wemake_python_styleguide.visitors.base import BaseNodeVisitor
+
+_CODE = 'x = 1  # noqa\n'
+
+
+class _BrokenVisitor(BaseNodeVisitor):
+    def visit_Call(self, node: ast.Call) -> None:  # noqa: N802
+        raise ValueError('Message from visitor')
+
+
+@pytest.fixture()
+def cached_checker(options, default_options, tmp_path):
+    """Enables the results cache and returns checker factory."""
+    def factory(code=_CODE, filename='test.py', **option_values):
+        Checker.parse_options(options(
+            results_cache_dir=str(tmp_path),
+            **option_values,
+        ))
+        return Checker(
+            tree=ast.parse(code),
+            file_tokens=[],
+            filename=filename,
+            lines=code.splitlines(keepends=True),
+        )
+
+    yield factory
+    Checker.parse_options(default_options)
+
+
+def _run_checker(checker):
+    """Returns violations and visitors that were executed."""
+    run_checks = checker._run_checks  # noqa: WPS437
+    executed = []
+
+    def factory(visitor_classes):
+        executed.extend(visitor_classes)
+        return run_checks(visitor_classes)
+
+    checker._run_checks = factory  # noqa: WPS437
+    return list(checker.run()), executed
+
+
+def test_results_cache_hit(cached_checker):  # noqa: WPS442
+    """Ensures that unchanged modules are not checked again."""
+    first_run, _ = _run_checker(cached_checker())
+    second_run, executed = _run_checker(cached_checker())
+
+    assert first_run
+    assert second_run == first_run
+    assert not executed
+
+
+def test_results_cache_options(cached_checker):  # noqa: WPS442
+    """Ensures that only visitors with changed options are executed again."""
+    first_run, _ = _run_checker(cached_checker())
+    second_run, executed = _run_checker(cached_checker(max_line_complexity=1))
+
+    assert executed == [JonesComplexityVisitor]
+    assert len(second_run) == len(first_run) + 1
+
+
+@pytest.mark.parametrize(('first_options', 'second_options'), [
+    ({}, {'code': 'x = 2  # noqa\n'}),
+    ({}, {'filename': 'other.py'}),
+    ({'code': ''}, {'code': ''}),
+])
+def test_results_cache_miss(
+    cached_checker,  # noqa: WPS442
+    first_options,
+    second_options,
+):
+    """Ensures that changed modules and modules without lines are checked."""
+    _run_checker(cached_checker(**first_options))
+    _, executed = _run_checker(cached_checker(**second_options))
+
+    assert executed == list(Checker._visitors)  # noqa: WPS437
+
+
+def test_results_cache_skips_errors(cached_checker, capsys):  # noqa: WPS442
+    """Ensures that visitors with internal errors are not cached."""
+    def factory():
+        checker = cached_checker('print(1)\n')
+        checker._visitors = [  # noqa: WPS437
+            _BrokenVisitor,
+            JonesComplexityVisitor,
+        ]
+        return _run_checker(checker)[1]
+
+    assert factory() == [_BrokenVisitor, JonesComplexityVisitor]
+    assert factory() == [_BrokenVisitor]
+    assert capsys.readouterr().out.count('ValueError: Message') == 2
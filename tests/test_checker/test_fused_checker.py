@@ -0,0 +1,112 @@
+import ast
+import inspect
+from textwrap import dedent
+
+import pytest
+
+from wemake_python_styleguide.checker import Checker
+from wemake_python_styleguide.compat.constants import PY38
+from wemake_python_styleguide.violations.system import InternalErrorViolation
+from wemake_python_styleguide.visitors.base import BaseNodeVisitor
+
+_NOQA_FIXTURES = (
+    'noqa.py',
+    'noqa_controlled.py',
+    pytest.param(
+        'noqa38.py',
+        marks=pytest.mark.skipif(not PY38, reason='python3.8+ syntax'),
+    ),
+    pytest.param(
+        'noqa_pre38.py',
+        marks=pytest.mark.skipif(PY38, reason='python3.7- syntax'),
+    ),
+)
+
+
+class _BrokenVisitor(BaseNodeVisitor):
+    def visit_Call(self, node: ast.Call) -> None:  # noqa: N802
+        raise ValueError('Message from visitor')
+
+
+class _BrokenPostVisitVisitor(BaseNodeVisitor):
+    def _post_visit(self) -> None:
+        raise ValueError('Message from post visit')
+
+
+def _run_checker(filename, file_tokens, options, *, fused: bool):
+    with open(filename, encoding='utf-8') as fixture:
+        tree = ast.parse(fixture.read())
+    Checker.parse_options(options(fused_visitors=fused))
+    return list(Checker(tree, file_tokens, filename).run())
+
+
+def _visit_methods(visitor_class):
+    for method_name, method in inspect.getmembers(visitor_class):
+        is_visit_method = (
+            method_name == 'visit' or method_name.startswith('visit_')
+        )
+        if is_visit_method:
+            if method.__qualname__.startswith(visitor_class.__name__):
+                yield method
+
+
+@pytest.mark.parametrize('filename', _NOQA_FIXTURES)
+def test_fused_visitors_same_violations(
+    filename,
+    absolute_path,
+    options,
+    parse_file_tokens,
+):
+    """Ensures that the fused walk produces exactly the same violations."""
+    filename = absolute_path('fixtures', 'noqa', filename)
+    file_tokens = parse_file_tokens(filename)
+
+    regular = _run_checker(filename, file_tokens, options, fused=False)
+    fused = _run_checker(filename, file_tokens, options, fused=True)
+
+    assert regular
+    assert regular == fused
+
+
+@pytest.mark.parametrize('visitor_class', [
+    visitor_class
+    for visitor_class in Checker._visitors  # noqa: WPS437
+    if issubclass(visitor_class, BaseNodeVisitor)
+])
+def test_visit_methods_are_preorder(visitor_class):
+    """Ensures that ``generic_visit`` is the last step of each method."""
+    for method in _visit_methods(visitor_class):
+        function = ast.parse(dedent(inspect.getsource(method))).body[0]
+        generic_visits = [
+            node
+            for node in ast.walk(function)
+            if isinstance(node, ast.Attribute) and node.attr == 'generic_visit'
+        ]
+
+        assert len(generic_visits) <= 1, method.__qualname__
+        if generic_visits:
+            last_statement = set(ast.walk(function.body[-1]))
+            assert generic_visits[0] in last_statement, method.__qualname__
+
+
+def test_fused_checker_error_handling(default_options, options, capsys):
+    """Ensures that checker reports internal errors in fused mode."""
+    Checker.parse_options(options(fused_visitors=True))
+    checker = Checker(
+        tree=ast.parse('print(1)'), file_tokens=[], filename='test.py',
+    )
+    checker._visitors = [  # noqa: WPS437
+        _BrokenVisitor,
+        _BrokenPostVisitVisitor,
+    ]
+
+    violations = list(checker.run())
+    Checker.parse_options(default_options)
+
+    assert len(violations) == 2
+    for violation in violations:
+        assert violation[2][7:] == InternalErrorViolation.error_template
+
+    captured = capsys.readouterr()
+    assert 'ValueError: Message from visitor' in captured.out
+    assert 'ValueError: Message from post visit' in captured.out
@@ -0,0 +1,168 @@
+import ast
+from collections import Counter
+
+import pytest
+
+from wemake_python_styleguide import incremental
+from wemake_python_styleguide.checker import Checker
+from wemake_python_styleguide.compat.constants import PY38
+from wemake_python_styleguide.options.config import Configuration
+from wemake_python_styleguide.visitors.base import BaseNodeVisitor
+
+_NOQA_FIXTURES = (
+    'noqa.py',
+    'noqa_controlled.py',
+    'noqa38.py' if PY38 else 'noqa_pre38.py',
+)
+
+_EDITED_CODE = """
+def first():
+    return 1
+
+
+@decorator
+def second(): ...
+"""
+
+#: Every complexity check is reported with these thresholds.
+_LOWEST_THRESHOLDS = {  # noqa: WPS407
+    option.long_option_name[2:].replace('-', '_'): 1
+    for option in Configuration._options  # noqa: WPS437
+    if option.long_option_name.startswith('--max-')
+}
+_LOWEST_THRESHOLDS['max_annotation_complexity'] = 2
+
+#: Lines are shifted for all definitions, the last one is changed.
+_EDIT_TEMPLATE = '\n\n{0}\ndef _edited():\n    return 2\n'
+
+#: Some violations are reported once per module, not once per definition.
+_REPEATED_CODE = """
+def first():
+    yield 1
+    yield 2
+
+
+def second():
+    yield 1
+    yield 2
+"""
+
+
+class _BrokenVisitor(BaseNodeVisitor):
+    def visit_Return(self, node: ast.Return) -> None:  # noqa: N802
+        raise ValueError('Message from visitor')
+
+
+@pytest.fixture()
+def run_checker(options, default_options, parse_file_tokens, tmp_path):
+    """Returns a function to run the checker and to count violations."""
+    def factory(code, incremental_state=None, **option_values):
+        Checker.parse_options(options(**option_values))
+        filename = tmp_path / 'test.py'
+        filename.write_text(code)
+        checker = Checker(
+            tree=ast.parse(code),
+            file_tokens=parse_file_tokens(str(filename)),
+            filename=str(filename),
+            lines=code.splitlines(keepends=True),
+        )
+        checker.incremental_state = incremental_state
+        return Counter(violation[:3] for violation in checker.run())
+
+    yield factory
+    Checker.parse_options(default_options)
+
+
+@pytest.mark.parametrize('filename', _NOQA_FIXTURES)
+@pytest.mark.parametrize('option_values', [
+    {},
+    _LOWEST_THRESHOLDS,
+])
+def test_incremental_violations(
+    filename,
+    option_values,
+    absolute_path,
+    run_checker,  # noqa: WPS442
+):
+    """Ensures that incremental runs find the same violations as full runs."""
+    with open(absolute_path('fixtures', 'noqa', filename)) as fixture:
+        code = fixture.read()
+    edited_code = _EDIT_TEMPLATE.format(code)
+    state = incremental.IncrementalState()
+
+    assert run_checker(code, state, **option_values) == run_checker(
+        code, **option_values,
+    )
+    assert run_checker(edited_code, state, **option_values) == run_checker(
+        edited_code, **option_values,
+    )
+
+
+def test_repeated_violations(
+    run_checker,  # noqa: WPS442
+):
+    """Ensures that module violations are not repeated in definitions."""
+    state = incremental.IncrementalState()
+    full_run = run_checker(_REPEATED_CODE)
+
+    assert sum(full_run.values()) == 1
+    assert run_checker(_REPEATED_CODE, state) == full_run
+    assert run_checker(_EDIT_TEMPLATE.format(_REPEATED_CODE), state) == (
+        run_checker(_EDIT_TEMPLATE.format(_REPEATED_CODE))
+    )
+
+
+def test_changed_definitions(
+    monkeypatch,
+    run_checker,  # noqa: WPS442
+):
+    """Ensures that only changed definitions are visited again."""
+    checked_definitions = Counter()
+    check_definition = incremental._check_definition  # noqa: WPS437
+
+    def factory(visitor, definition):
+        checked_definitions[definition.node.name] += 1
+        return check_definition(visitor, definition)
+
+    monkeypatch.setattr(incremental, '_check_definition', factory)
+    state = incremental.IncrementalState()
+    run_checker(_EDITED_CODE, state)
+    checked_definitions.clear()
+    run_checker(_EDITED_CODE.replace('1', '2'), state)
+
+    assert set(checked_definitions) == {'first'}
+    assert checked_definitions['first'] == len([
+        visitor_class
+        for visitor_class in Checker._visitors  # noqa: WPS437
+        if issubclass(visitor_class, BaseNodeVisitor) and (
+            not visitor_class.module_scoped
+        )
+    ])
+
+
+def test_changed_options(
+    run_checker,  # noqa: WPS442
+):
+    """Ensures that the state is reset when options are changed."""
+    state = incremental.IncrementalState()
+    run_checker(_EDITED_CODE, state)
+
+    changed_run = run_checker(_EDITED_CODE, state, max_line_complexity=1)
+
+    assert changed_run == run_checker(_EDITED_CODE, max_line_complexity=1)
+
+
+def test_failed_visitors(
+    monkeypatch,
+    capsys,
+    run_checker,  # noqa: WPS442
+):
+    """Ensures that results of failed visitors are not reused."""
+    monkeypatch.setattr(Checker, '_visitors', (_BrokenVisitor,))
+    state = incremental.IncrementalState()
+    first_run = run_checker(_EDITED_CODE, state)
+    second_run = run_checker(_EDITED_CODE, state)
+
+    assert first_run == second_run
+    assert sum(first_run.values()) == 1
+    assert capsys.readouterr().out.count('ValueError: Message') == 2
@@ -0,0 +1,90 @@
+import ast
+from collections import defaultdict
+
+import pytest
+
+from wemake_python_styleguide.checker import Checker
+from wemake_python_styleguide.compat.constants import PY38
+from wemake_python_styleguide.options.config import Configuration
+from wemake_python_styleguide.options.validation import validate_options
+from wemake_python_styleguide.transformations.ast_tree import transform
+
+_NOQA_FIXTURES = (
+    'noqa.py',
+    'noqa_controlled.py',
+    'noqa38.py' if PY38 else 'noqa_pre38.py',
+)
+
+
+class _RecordingOptions(object):
+    """Remembers names of all options that were read."""
+
+    def __init__(self, options) -> None:
+        self.used_options = set()
+        self._options = options
+
+    def __getattr__(self, option_name: str):
+        self.used_options.add(option_name)
+        return getattr(self._options, option_name)
+
+
+def _make_checker(filename, file_tokens):
+    with open(filename, encoding='utf-8') as fixture:
+        code = fixture.read()
+    checker = Checker(
+        ast.parse(code),
+        file_tokens,
+        filename,
+        code.splitlines(keepends=True),
+    )
+    checker.tree = transform(checker.tree, checker.lines)
+    return checker
+
+
+@pytest.fixture(scope='module')
+def read_options(absolute_path, parse_file_tokens, default_options):
+    """Runs all visitors and returns options they have read."""
+    validated_options = validate_options(default_options)
+    visitor_options = defaultdict(set)
+    for filename in _NOQA_FIXTURES:
+        filename = absolute_path('fixtures', 'noqa', filename)
+        checker = _make_checker(filename, parse_file_tokens(filename))
+        for visitor_class in Checker._visitors:  # noqa: WPS437
+            checker.options = _RecordingOptions(validated_options)
+            visitor_class.from_checker(checker).run()
+            visitor_options[visitor_class].update(
+                checker.options.used_options,
+            )
+    return visitor_options
+
+
+@pytest.mark.parametrize('visitor_class', Checker._visitors)  # noqa: WPS437
+def test_used_options_are_declared(
+    visitor_class,
+    read_options,  # noqa: WPS442
+):
+    """Ensures that visitors declare exactly the options they read."""
+    assert read_options[visitor_class] == visitor_class.used_options
+
+
+def test_all_options_are_used():
+    """Ensures that all options are declared by some visitor."""
+    declared_options = set().union(*(
+        visitor_class.used_options
+        for visitor_class in Checker._visitors  # noqa: WPS437
+    ))
+
+    assert declared_options == {
+        option.dest or option.long_option_name[2:].replace('-', '_')
+        for option in Configuration._options  # noqa: WPS437
+    }
+
+
+def test_visitor_names_are_unique():
+    """Ensures that cached violations of visitors do not collide."""
+    visitor_names = [
+        visitor_class.__qualname__
+        for visitor_class in Checker._visitors  # noqa: WPS437
+    ]
+
+    assert len(visitor_names) == len(set(visitor_names))
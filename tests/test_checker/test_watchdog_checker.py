@@ -0,0 +1,108 @@
+import ast
+import threading
+import time
+
+import pytest
+
+from wemake_python_styleguide.checker import Checker
+from wemake_python_styleguide.incremental import IncrementalState
+from wemake_python_styleguide.violations.best_practices import (
+    RaiseNotImplementedViolation,
+)
+from wemake_python_styleguide.violations.system import TimeoutViolation
+from wemake_python_styleguide.visitors.ast.keywords import WrongRaiseVisitor
+from wemake_python_styleguide.visitors.base import BaseNodeVisitor
+
+#: Seconds of the time budget in these tests.
+_BUDGET = 0.05
+
+#: Slow visitors never finish in time.
+_SLEEP = 10
+
+_TIMEOUT = 'WPS00{0} '.format(TimeoutViolation.code)
+_RAISE = 'WPS{0} '.format(RaiseNotImplementedViolation.code)
+
+
+class _SlowVisitor(BaseNodeVisitor):
+    sleep = _SLEEP
+
+    def visit_Module(self, node: ast.Module) -> None:  # noqa: N802
+        time.sleep(self.sleep)
+
+
+class _NotSoSlowVisitor(_SlowVisitor):
+    sleep = _BUDGET * 2
+
+
+def _run_checker(options, visitors, incremental_state=None):
+    Checker.parse_options(options)
+    checker = Checker(
+        tree=ast.parse('raise NotImplemented\n'),
+        file_tokens=[],
+        filename='test.py',
+    )
+    checker._visitors = visitors  # noqa: WPS437
+    checker.incremental_state = incremental_state
+    return [violation[2] for violation in checker.run()]
+
+
+@pytest.mark.usefixtures('reset_checker')
+def test_module_out_of_time(options):
+    """Ensures that visitors are stopped when the module is out of time."""
+    start = time.monotonic()
+    messages = _run_checker(
+        options(max_module_time=_BUDGET),
+        [WrongRaiseVisitor, _SlowVisitor, _NotSoSlowVisitor],
+    )
+
+    assert time.monotonic() - start < _SLEEP
+    assert messages[0].startswith(_RAISE)
+    assert messages[1].startswith(_TIMEOUT)
+    assert '_NotSoSlowVisitor' in messages[2]
+
+
+@pytest.mark.usefixtures('reset_checker')
+@pytest.mark.parametrize('budget', [
+    {'max_visitor_time': _BUDGET},
+    {'max_module_time': _BUDGET},
+])
+@pytest.mark.parametrize(('mode', 'expected'), [
+    ('separate', [_RAISE, _TIMEOUT]),
+    ('incremental', [_RAISE, _TIMEOUT]),
+    ('fused', [_TIMEOUT, _TIMEOUT]),  # both visitors are still walking
+])
+def test_slow_visitor_is_stopped(options, budget, mode, expected):
+    """Ensures that other visitors still check the module, unless fused."""
+    start = time.monotonic()
+    messages = _run_checker(
+        options(fused_visitors=mode == 'fused', **budget),
+        [WrongRaiseVisitor, _SlowVisitor],
+        incremental_state=IncrementalState() if mode == 'incremental' else None,
+    )
+
+    prefixes = [message[:len(_TIMEOUT)] for message in messages]
+    assert time.monotonic() - start < _SLEEP
+    assert '_SlowVisitor' in messages[1]
+    assert prefixes == expected
+
+
+@pytest.mark.usefixtures('reset_checker')
+def test_no_time_budget(default_options):
+    """Ensures that visitors are not stopped by default."""
+    messages = _run_checker(default_options, [_NotSoSlowVisitor])
+
+    assert not messages
+
+
+@pytest.mark.usefixtures('reset_checker')
+def test_other_threads(options):
+    """Ensures that visitors are not stopped outside of the main thread."""
+    messages = []
+    thread = threading.Thread(target=lambda: messages.extend(_run_checker(
+        options(max_visitor_time=_BUDGET),
+        [_NotSoSlowVisitor],
+    )))
+    thread.start()
+    thread.join()
+
+    assert not messages
@@ -0,0 +1,33 @@
+import threading
+
+import pytest
+
+from wemake_python_styleguide import daemon
+from wemake_python_styleguide.checker import Checker
+
+
+@pytest.fixture()
+def project(tmp_path, monkeypatch):
+    """Creates a project with a single module and enters it."""
+    monkeypatch.chdir(tmp_path)
+    (tmp_path / 'short.py').write_text('x = 1\n')
+    return tmp_path
+
+
+@pytest.fixture()
+def running_daemon(project, default_options):  # noqa: WPS442
+    """Serves requests in a thread, returns the socket path."""
+    socket_path = str(project / 'test.sock')
+    thread = threading.Thread(
+        target=daemon.main,
+        args=(['serve', '--socket', socket_path],),
+        daemon=True,
+    )
+    thread.start()
+    while not daemon.request(socket_path, 'ping'):
+        thread.join(daemon._START_POLL_INTERVAL)  # noqa: WPS437
+
+    yield socket_path
+    daemon.request(socket_path, 'stop')
+    thread.join()
+    Checker.parse_options(default_options)
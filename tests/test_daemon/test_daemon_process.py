@@ -0,0 +1,31 @@
+import os
+import subprocess
+import time
+
+from wemake_python_styleguide import daemon
+
+
+def test_start_and_stop(tmp_path):
+    """Ensures that the daemon process is started and stopped."""
+    socket_path = str(tmp_path / 'test.sock')
+    (tmp_path / 'test.sock').write_text('left by a killed daemon')
+    (tmp_path / 'short.py').write_text('x = 1\n')
+
+    assert daemon.main(['start', '--socket', socket_path]) == 0
+    assert daemon.request(
+        socket_path, 'check', [str(tmp_path / 'short.py')],
+    ) is not None
+    assert daemon.main(['start', '--socket', socket_path]) == 0
+    assert daemon.main(['stop', '--socket', socket_path]) == 0
+
+    while os.path.exists(socket_path):
+        time.sleep(daemon._START_POLL_INTERVAL)  # noqa: WPS437
+    assert daemon.request(socket_path, 'check') is None
+
+
+def test_start_timeout(project, monkeypatch):
+    """Ensures that daemons that do not start in time are reported."""
+    monkeypatch.setattr(subprocess, 'Popen', lambda *args, **kwargs: None)
+    monkeypatch.setattr(daemon, '_START_TIMEOUT', 0)
+
+    assert daemon.main(['start', '--socket', str(project / 'test.sock')]) == 1
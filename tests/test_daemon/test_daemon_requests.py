@@ -0,0 +1,101 @@
+import socket
+
+import pytest
+
+from wemake_python_styleguide import daemon
+from wemake_python_styleguide.linter import linter
+
+_VIOLATION = './short.py:1:1: WPS111 Found too short name: x < 2\n'
+
+
+@pytest.fixture()
+def created_linters(monkeypatch):
+    """Records arguments of all linters that the daemon creates."""
+    linters_arguments = []
+
+    def factory(*args, **kwargs):
+        linters_arguments.append(args)
+        return linter.Linter(*args, **kwargs)
+
+    monkeypatch.setattr(daemon, 'Linter', factory)
+    return linters_arguments
+
+
+def test_check_by_daemon(running_daemon, created_linters):
+    """Ensures that the daemon checks modules and keeps its linters."""
+    assert daemon.request(running_daemon, 'check') == (_VIOLATION, 1)
+    assert daemon.request(running_daemon, 'check') == (_VIOLATION, 1)
+    assert daemon.request(running_daemon, 'check', ['--exit-zero']) == (
+        _VIOLATION, 0,
+    )
+    assert len(created_linters) == 2
+
+
+def test_different_paths(running_daemon, project, created_linters):
+    """Ensures that requests with different paths share the same linter."""
+    (project / 'other.py').write_text('y = 1\n')
+
+    assert daemon.request(running_daemon, 'check', ['short.py']) == (
+        _VIOLATION.replace('./', ''), 1,
+    )
+    assert daemon.request(running_daemon, 'check', ['other.py', '-q']) == (
+        'other.py\n', 1,
+    )
+    output, _ = daemon.request(running_daemon, 'check', ['-q'])
+    assert sorted(output.splitlines()) == ['./other.py', './short.py']
+    assert len(created_linters) == 2
+
+
+def test_least_recently_used(running_daemon, created_linters, monkeypatch):
+    """Ensures that only a few recently used linters are kept."""
+    monkeypatch.setattr(daemon, '_MAX_LINTERS', 1)
+
+    daemon.request(running_daemon, 'check')
+    daemon.request(running_daemon, 'check', ['--exit-zero'])
+    daemon.request(running_daemon, 'check')
+
+    assert len(created_linters) == 3
+
+
+def test_changed_config(running_daemon, project):
+    """Ensures that options are parsed again when config files change."""
+    assert daemon.request(running_daemon, 'check') == (_VIOLATION, 1)
+
+    (project / 'setup.cfg').write_text('[flake8]\nmin-name-length = 1\n')
+
+    assert daemon.request(running_daemon, 'check') == ('', 0)
+
+
+def test_failed_request(running_daemon):
+    """Ensures that requests with invalid options fail."""
+    assert daemon.request(running_daemon, 'check', ['--wrong']) is None
+    assert daemon.request(running_daemon, 'check') == (_VIOLATION, 1)
+
+
+def test_missing_daemon(project):
+    """Ensures that requests fail without a daemon."""
+    assert daemon.request(str(project / 'missing.sock'), 'check') is None
+
+
+def test_missing_unix_sockets(project, monkeypatch):
+    """Ensures that requests fail on platforms without Unix sockets."""
+    monkeypatch.delattr(socket, 'AF_UNIX')
+
+    assert daemon.request(str(project / 'test.sock'), 'check') is None
+
+
+@pytest.mark.parametrize(('argv', 'output'), [
+    ([], _VIOLATION),
+    (['--socket', 'missing.sock'], _VIOLATION),
+    (['-'], _VIOLATION.replace('./short.py', 'stdin')),
+    (['-', '--stdin-display-name', './short.py'], _VIOLATION),
+    (['-', '--stdin-display-name', 'short.py', '--exclude', 'short.py'], ''),
+])
+def test_check_command(argv, output, running_daemon, capsys, monkeypatch):
+    """Ensures that modules are checked with or without the daemon."""
+    with open('short.py') as stdin:
+        monkeypatch.setattr('sys.stdin', stdin)
+        status = daemon.main(['check', '--socket', running_daemon, *argv])
+
+    assert status == int(bool(output))
+    assert capsys.readouterr().out == output
@@ -0,0 +1,22 @@
+import subprocess
+
+import pytest
+
+
+@pytest.fixture()
+def git_repository(tmp_path, monkeypatch):
+    """Creates a committed repository and returns a function to run `git`."""
+    def factory(*args):
+        subprocess.run(  # noqa: S603, S607
+            ['git', '-c', 'user.name=test', '-c', 'user.email=t@t', *args],
+            check=True,
+            stdout=subprocess.DEVNULL,
+        )
+
+    monkeypatch.chdir(tmp_path)
+    factory('init')
+    (tmp_path / 'unchanged.py').write_text('x = 1\n')
+    (tmp_path / 'changed.py').write_text('first = 1\nsecond = 2\n')
+    factory('add', '.')
+    factory('commit', '-m', 'initial')
+    return factory
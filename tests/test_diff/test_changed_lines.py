@@ -0,0 +1,48 @@
+import subprocess
+
+import pytest
+
+from wemake_python_styleguide.diff import get_changed_lines
+
+
+def test_changed_lines(git_repository, tmp_path):  # noqa: WPS442
+    """Ensures that changed and untracked files are found."""
+    (tmp_path / 'changed.py').write_text('first = 1\nsecond = 3\nthird = 3\n')
+    (tmp_path / 'untracked.py').write_text('x = 1\n')
+    changed_lines = get_changed_lines('HEAD')
+
+    assert changed_lines.get('unchanged.py') is None
+    assert 1 not in changed_lines.get('changed.py')
+    assert 3 in changed_lines.get(str(tmp_path / 'changed.py'))
+    assert 100 in changed_lines.get('untracked.py')
+
+
+def test_committed_changes(git_repository, tmp_path):  # noqa: WPS442
+    """Ensures that committed changes are found."""
+    (tmp_path / 'changed.py').write_text('first = 2\nsecond = 2\n')
+    git_repository('commit', '-am', 'change')
+
+    assert not get_changed_lines('HEAD').get('changed.py')
+    assert 1 in get_changed_lines('HEAD~1').get('changed.py')
+
+
+@pytest.mark.parametrize('diff_config', [
+    'diff.noprefix',
+    'diff.mnemonicPrefix',
+])
+def test_diff_prefixes(
+    git_repository,  # noqa: WPS442
+    tmp_path,
+    diff_config,
+):
+    """Ensures that prefixes of file names in configs are ignored."""
+    git_repository('config', diff_config, 'true')
+    (tmp_path / 'changed.py').write_text('first = 1\nsecond = 3\n')
+
+    assert 2 in get_changed_lines('HEAD').get('changed.py')
+
+
+def test_wrong_revision(git_repository):  # noqa: WPS442
+    """Ensures that `git` errors are not hidden."""
+    with pytest.raises(subprocess.CalledProcessError):
+        get_changed_lines('missing-revision')
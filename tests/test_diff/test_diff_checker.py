@@ -0,0 +1,71 @@
+import ast
+from pathlib import Path
+
+import pytest
+
+from wemake_python_styleguide.checker import Checker
+
+_ORIGINAL_CODE = """x = 1
+first = 2
+"""
+
+_CHANGED_CODE = """x = 1
+first = 2
+y = 3
+"""
+
+
+@pytest.fixture()
+def run_checker(options, default_options, parse_file_tokens):
+    """Returns a function to run the checker on a file with changes only."""
+    def factory(filename):
+        Checker.parse_options(options(diff_against='HEAD'))
+        with open(filename) as module:
+            code = module.read()
+        checker = Checker(
+            tree=ast.parse(code),
+            file_tokens=parse_file_tokens(filename),
+            filename=filename,
+            lines=code.splitlines(keepends=True),
+        )
+        return {
+            (line_number, message.split(' ')[0])
+            for line_number, _, message, _ in checker.run()
+        }
+
+    yield factory
+    Checker.parse_options(default_options)
+
+
+def test_unchanged_module(
+    git_repository,
+    run_checker,  # noqa: WPS442
+):
+    """Ensures that unchanged modules are not checked."""
+    Path('unchanged.py').write_text(_ORIGINAL_CODE)
+    git_repository('commit', '-am', 'violations')
+
+    assert not run_checker('unchanged.py')
+
+
+def test_changed_lines_only(
+    git_repository,
+    run_checker,  # noqa: WPS442
+):
+    """Ensures that only violations on changed lines are reported."""
+    Path('changed.py').write_text(_ORIGINAL_CODE)
+    git_repository('commit', '-am', 'violations')
+    Path('changed.py').write_text(_CHANGED_CODE)
+
+    assert run_checker('unchanged.py') == set()
+    assert run_checker('changed.py') == {(3, 'WPS111')}
+
+
+def test_untracked_module(
+    git_repository,
+    run_checker,  # noqa: WPS442
+):
+    """Ensures that untracked modules are reported as a whole."""
+    Path('untracked.py').write_text(_ORIGINAL_CODE)
+
+    assert run_checker('untracked.py') == {(1, 'WPS111')}
@@ -0,0 +1,67 @@
+import pytest
+
+from wemake_python_styleguide.diff import LineRanges, parse_diff
+
+_MODIFIED_FILE = """diff --git a/first.py b/first.py
+index 1b2c3d4..5e6f7a8 100644
+--- a/first.py
++++ b/first.py
+@@ -1 +1 @@
+-old
++new
+@@ -10,0 +11,2 @@ def function():
++@@ -1 +1 @@
++++ b/second.py
+"""
+
+_RENAMED_FILE = """diff --git a/old.py b/new.py
+similarity index 90%
+rename from old.py
+rename to new.py
+--- a/old.py
++++ b/new.py
+@@ -5,2 +5,0 @@
+-removed
+-lines
+"""
+
+_REMOVED_FILE = """diff --git a/removed.py b/removed.py
+deleted file mode 100644
+--- a/removed.py
++++ /dev/null
+@@ -1,2 +0,0 @@
+-removed
+-lines
+"""
+
+
+@pytest.mark.parametrize(('diff_output', 'changes'), [
+    ('', {}),
+    (_MODIFIED_FILE, {'first.py': [(1, 1), (11, 12)]}),
+    (_RENAMED_FILE, {'new.py': []}),
+    (_REMOVED_FILE, {}),
+    (
+        _REMOVED_FILE + _MODIFIED_FILE,
+        {'first.py': [(1, 1), (11, 12)]},
+    ),
+    ('diff --git a/x.py b/x.py\n+++ b/x.py\n@@ wrong @@\n', {'x.py': []}),
+])
+def test_parse_diff(diff_output, changes):
+    """Ensures that only new lines of hunks are changed."""
+    assert parse_diff(diff_output) == changes
+
+
+@pytest.mark.parametrize(('line_number', 'is_changed'), [
+    (0, True),
+    (1, False),
+    (2, True),
+    (3, True),
+    (4, False),
+    (10, True),
+    (11, False),
+])
+def test_line_ranges(line_number, is_changed):
+    """Ensures that lines are found inside ranges."""
+    line_ranges = LineRanges([(10, 10), (2, 3)])
+
+    assert is_changed == (line_number in line_ranges)
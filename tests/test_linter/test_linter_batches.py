@@ -0,0 +1,44 @@
+import pytest
+
+from wemake_python_styleguide.linter import parallel
+
+
+def test_largest_modules_first(tmp_path):
+    """Ensures that expensive modules go first, and small ones together."""
+    filenames = [str(tmp_path / 'missing.py')]
+    for index in range(3):
+        filenames.append(str(tmp_path / 'small{0}.py'.format(index)))
+        (tmp_path / filenames[-1]).write_text('x = 1\n')
+    filenames.append(str(tmp_path / 'large.py'))
+    (tmp_path / 'large.py').write_text('x = 1\n' * 100)
+
+    assert parallel._schedule(filenames, jobs=1) == [  # noqa: WPS437
+        [(4, filenames[4])],
+        [(position, filenames[position]) for position in (1, 2, 3, 0)],
+    ]
+
+
+@pytest.mark.parametrize(('modules', 'module_size'), [
+    (1000, 1),
+    (200, 100 * 1024),
+    (3, 1024 * 1024 * 2),
+])
+def test_bounded_batches(tmp_path, modules, module_size):
+    """Ensures that batches are limited, whatever the size of the project."""
+    filenames = []
+    for index in range(modules):
+        filenames.append(str(tmp_path / 'module{0}.py'.format(index)))
+        with open(filenames[-1], 'wb') as module:
+            module.truncate(module_size)  # files are sparse, to be fast
+
+    batches = parallel._schedule(filenames, jobs=1)  # noqa: WPS437
+    batch_size = max(map(len, batches))
+
+    assert sorted(
+        indexed_module for batch in batches for indexed_module in batch
+    ) == list(enumerate(filenames))
+    assert batch_size <= parallel._MAX_BATCH_MODULES  # noqa: WPS437
+    assert batch_size * module_size <= max(
+        parallel._MAX_BATCH_COST,  # noqa: WPS437
+        module_size,
+    )
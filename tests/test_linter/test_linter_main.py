@@ -0,0 +1,41 @@
+import subprocess
+import sys
+
+import pytest
+
+from wemake_python_styleguide.__main__ import main
+
+_ARGV = (
+    '--isolated',
+    '--select',
+    'WPS',
+    './tests/fixtures/noqa/noqa.py',
+    './tests/fixtures/noqa/noqa_controlled.py',
+)
+
+
+def _run(*command):
+    return subprocess.run(
+        [sys.executable, '-m', *command, *_ARGV],
+        stdout=subprocess.PIPE,
+        universal_newlines=True,
+        encoding='utf-8',
+        check=False,
+    )
+
+
+def test_same_as_flake8():
+    """Ensures that our runner prints the same output as `flake8`."""
+    flake8_run = _run('flake8')
+    our_run = _run('wemake_python_styleguide')
+
+    assert flake8_run.stdout
+    assert our_run.stdout == flake8_run.stdout
+    assert our_run.returncode == flake8_run.returncode
+
+
+@pytest.mark.usefixtures('reset_checker')
+def test_main(capsys):
+    """Ensures that the output is printed and the status is returned."""
+    assert main(_ARGV) == 1
+    assert 'WPS' in capsys.readouterr().out
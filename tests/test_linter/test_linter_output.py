@@ -0,0 +1,75 @@
+import subprocess
+import sys
+
+import pytest
+
+from wemake_python_styleguide.linter.linter import Linter
+
+_FIXTURES = (
+    './tests/fixtures/noqa/noqa.py',
+    './tests/fixtures/noqa/noqa_controlled.py',
+)
+
+
+def _run_flake8(*argv):
+    return subprocess.run(
+        [sys.executable, '-m', 'flake8', *argv],
+        stdout=subprocess.PIPE,
+        stderr=subprocess.PIPE,
+        universal_newlines=True,
+        encoding='utf-8',
+        check=False,
+    )
+
+
+@pytest.mark.usefixtures('reset_checker')
+@pytest.mark.parametrize('argv', [
+    ['--select', 'WPS'],
+    ['--select', 'WPS', '--format', 'pylint', '--show-source'],
+    ['--select', 'WPS', '--format', '%(code)s at %(row)d'],
+    ['--select', 'WPS', '--count', '--statistics', '--max-line-complexity=4'],
+    ['--select', 'WPS1,WPS2', '--ignore', 'WPS226', '--exit-zero'],
+    ['--select', 'WPS', '--per-file-ignores', '*/noqa.py:WPS1', '-q'],
+    ['--select', 'WPS', '--disable-noqa', '-qq'],
+])
+def test_same_as_flake8(argv):
+    """Ensures that output is the same as `flake8` output."""
+    argv = ['--isolated', *argv, *_FIXTURES]
+    flake8_run = _run_flake8(*argv)
+
+    assert Linter(argv).run() == (flake8_run.stdout, flake8_run.returncode)
+
+
+@pytest.mark.usefixtures('reset_checker')
+def test_broken_modules(tmp_path):
+    """Ensures that broken and missing modules are reported like `flake8`."""
+    (tmp_path / 'syntax.py').write_text('def x(:\n')
+    (tmp_path / 'parse.py').write_text('x = = 1\n')
+    (tmp_path / 'ignored.py').write_text('# flake8: noqa\nx = 1\n')
+    argv = [
+        '--isolated',
+        '--select',
+        'WPS,E9',
+        str(tmp_path),
+        str(tmp_path / 'missing.py'),
+    ]
+    flake8_run = _run_flake8(*argv)
+
+    assert Linter(argv).run() == (flake8_run.stdout, flake8_run.returncode)
+
+
+@pytest.mark.usefixtures('reset_checker')
+def test_output_file(tmp_path, monkeypatch):
+    """Ensures that output files are written like `flake8` does."""
+    monkeypatch.chdir(tmp_path)
+    (tmp_path / 'short.py').write_text('x = 1\n')
+    linter = Linter(['--output-file', 'output.txt'])
+
+    assert linter.run() == ('', 1)
+    assert (tmp_path / 'output.txt').read_text() == (
+        './short.py:1:1: WPS111 Found too short name: x < 2\n'
+    )
+    assert linter.run(['--tee', 'short.py'])[0] == ''
+    assert Linter(['--output-file', 'output.txt', '--tee']).run()[0] == (
+        './short.py:1:1: WPS111 Found too short name: x < 2\n'
+    )
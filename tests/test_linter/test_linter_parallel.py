@@ -0,0 +1,93 @@
+import multiprocessing
+
+import pytest
+
+from wemake_python_styleguide.linter import parallel
+from wemake_python_styleguide.linter.linter import Linter
+
+_ARGV = (
+    '--isolated',
+    '--max-line-complexity=4',
+    '--max-module-members=1',
+    'wemake_python_styleguide/logic/tree',
+)
+
+
+@pytest.mark.usefixtures('reset_checker')
+@pytest.mark.parametrize('argv', [
+    ['--select', 'WPS'],
+    ['--select', 'WPS', '--show-source'],
+    ['--select', 'WPS', '--disable-noqa'],
+])
+def test_same_as_serial(argv):
+    """Ensures that parallel runs have the same output as serial ones."""
+    serial_run = Linter(['--jobs', '1', *argv, *_ARGV]).run()
+
+    assert serial_run[0]
+    assert Linter(['--jobs', '2', *argv, *_ARGV]).run() == serial_run
+
+
+@pytest.mark.usefixtures('reset_checker')
+@pytest.mark.parametrize('comment', [
+    '# NOQA: WPS111',
+    '# NoQA',
+    '# noqa:WPS111',
+])
+def test_noqa_comments(tmp_path, comment):
+    """Ensures that parallel runs keep `noqa` comments in any case."""
+    for module_name in ('first.py', 'second.py'):
+        (tmp_path / module_name).write_text('x = 1  {0}\ny = 2\n'.format(
+            comment,
+        ))
+    argv = ['--isolated', '--select', 'WPS', str(tmp_path)]
+    serial_run = Linter(['--jobs', '1', *argv]).run()
+
+    assert serial_run[0].count('\n') == 2
+    assert Linter(['--jobs', '2', *argv]).run() == serial_run
+
+
+@pytest.mark.parametrize(('argv', 'jobs'), [
+    (['--jobs', '3', 'first.py', 'second.py'], 3),
+    (['--jobs', '0', 'first.py', 'second.py'], 1),
+    (['--jobs', '3', 'package'], 3),
+    (['--jobs', '3', 'first.py', '-'], 1),
+])
+def test_jobs(argv, jobs):
+    """Ensures that parallel runs are used like `flake8` uses them."""
+    linter = Linter(['--isolated', *argv])
+
+    assert parallel.get_jobs(linter.options, linter.paths) == jobs
+
+
+@pytest.mark.usefixtures('reset_checker')
+def test_single_module(tmp_path, monkeypatch):
+    """Ensures that a single module is checked without workers."""
+    (tmp_path / 'module.py').write_text('x = 1\n')
+    serial_run = Linter(['--isolated', '--jobs', '1', str(tmp_path)]).run()
+    monkeypatch.setattr(multiprocessing, 'Pool', None)
+
+    assert serial_run[0]
+    assert Linter(['--isolated', '--jobs', '2', str(tmp_path)]).run() == (
+        serial_run
+    )
+
+
+def test_auto_jobs(monkeypatch):
+    """Ensures that processes are started for all cores by default."""
+    paths = ['first.py', 'second.py']
+    linter = Linter(['--isolated'])
+    cores = multiprocessing.cpu_count()
+
+    assert parallel.get_jobs(linter.options, paths) == cores
+
+    monkeypatch.setattr(multiprocessing, 'cpu_count', _raise_not_implemented)
+
+    assert parallel.get_jobs(linter.options, paths) == 1
+
+    monkeypatch.setattr(multiprocessing, 'get_start_method', lambda: 'spawn')
+
+    assert parallel.get_jobs(linter.options, paths) == 1
+
+
+def _raise_not_implemented():
+    raise NotImplementedError()
@@ -0,0 +1,84 @@
+import pytest
+
+from wemake_python_styleguide.linter import prefetch
+from wemake_python_styleguide.linter.linter import Linter
+
+#: More modules than we read ahead.
+_MODULES = 40
+
+#: Correct and broken modules.
+_CODES = (
+    'x = 1\n',
+    'x = (\n',
+    'def function():\n  x = 1\n y = 2\n',
+)
+
+
+def _find_modules(tmp_path, found_modules):
+    for index in range(_MODULES):
+        filename = tmp_path / 'module{0}.py'.format(index)
+        filename.write_text('x = {0}\n'.format(index))
+        found_modules.append(str(filename))
+        yield str(filename)
+
+
+def test_read_modules(tmp_path):
+    """Ensures that modules are read ahead, and kept in the same order."""
+    found_modules = []
+    read_modules = prefetch.read_modules(
+        Linter(['--isolated']).options,
+        _find_modules(tmp_path, found_modules),
+    )
+
+    filename, read_module = next(read_modules)
+    assert read_module.lines == ['x = 0\n']
+    assert read_module.file_tokens
+    assert len(found_modules) < _MODULES
+
+    filenames = [filename]
+    filenames.extend(next_module[0] for next_module in read_modules)
+    assert filenames == found_modules
+    assert len(found_modules) == _MODULES
+
+
+@pytest.mark.usefixtures('reset_checker')
+@pytest.mark.parametrize('code', [None, *_CODES[1:]])
+def test_broken_modules(tmp_path, code):
+    """Ensures that modules that are not read are reported as usual."""
+    filename = tmp_path / 'module.py'
+    if code is not None:
+        filename.write_text(code)
+    linter = Linter(['--isolated', '--select', 'E,WPS'])
+    linter.prepare()
+    read_modules = list(prefetch.read_modules(linter.options, [filename]))
+
+    assert linter.check_module(
+        str(filename), read_module=read_modules[0][1],
+    ) == linter.check_module(str(filename))
+
+
+@pytest.fixture()
+def filenames(tmp_path):
+    """Creates correct, broken, and missing modules."""
+    module_names = [str(tmp_path / 'missing.py')]
+    for index, code in enumerate(_CODES * 3):
+        module_names.append(str(tmp_path / 'module{0}.py'.format(index)))
+        (tmp_path / module_names[-1]).write_text(code)
+    return module_names
+
+
+@pytest.mark.usefixtures('reset_checker')
+def test_read_batches(filenames, monkeypatch):  # noqa: WPS442
+    """Ensures that workers check modules that are read by the parent."""
+    argv = ['--isolated', '--select', 'E,WPS', *filenames]
+    serial_run = Linter(['--jobs', '1', *argv]).run()
+
+    read_filenames = []
+    read_lines = prefetch._read_lines  # noqa: WPS437
+    monkeypatch.setattr(prefetch, '_read_lines', lambda options, filename: (
+        read_filenames.append(filename) or read_lines(options, filename)
+    ))
+
+    assert 'E902' in serial_run[0]
+    assert Linter(['--jobs', '2', *argv]).run() == serial_run
+    assert sorted(read_filenames) == sorted(filenames)
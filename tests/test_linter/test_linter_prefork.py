@@ -0,0 +1,27 @@
+import gc
+
+import pytest
+
+from wemake_python_styleguide.checker import Checker
+from wemake_python_styleguide.linter import prefork
+from wemake_python_styleguide.logic.naming.rules import naming_rules_from
+
+
+@pytest.mark.usefixtures('reset_checker')
+def test_warm_up(default_options):
+    """Ensures that workers get naming rules that are already built."""
+    Checker.parse_options(default_options)
+    prefork.warm_up()
+    cached_rules = naming_rules_from.cache_info()
+    naming_rules_from(Checker.options)
+
+    assert naming_rules_from.cache_info().hits == cached_rules.hits + 1
+    assert naming_rules_from.cache_info().misses == cached_rules.misses
+
+
+def test_frozen_objects():
+    """Ensures that objects are frozen only while workers are forked."""
+    with prefork.frozen_objects():
+        assert gc.get_freeze_count()
+
+    assert not gc.get_freeze_count()
@@ -0,0 +1,94 @@
+import os
+
+import pytest
+
+from wemake_python_styleguide.linter.linter import Linter
+
+_CODE = 'x = 1\n'
+
+
+@pytest.mark.usefixtures('reset_checker')
+def test_incremental_runs(tmp_path, monkeypatch):
+    """Ensures that incremental runs find the same violations."""
+    monkeypatch.chdir(tmp_path)
+    (tmp_path / 'short.py').write_text(_CODE)
+    linter = Linter(['--isolated'], incremental=True)
+
+    assert linter.run() == linter.run() == Linter(['--isolated']).run()
+
+
+@pytest.mark.usefixtures('reset_checker')
+def test_lines_of_module(tmp_path, monkeypatch):
+    """Ensures that passed lines are checked instead of the file."""
+    monkeypatch.chdir(tmp_path)
+    linter = Linter(['--isolated'])
+    linter.prepare()
+
+    assert linter.check_module('missing.py', [_CODE]) == [
+        ('WPS111', 1, 0, 'Found too short name: x < 2', _CODE),
+    ]
+    assert linter.check_module('missing.py', ['x = = 1\n'])[0][0] == 'E999'
+
+
+@pytest.mark.parametrize('config_file', [
+    'setup.cfg',
+    'tox.ini',
+    '.flake8',
+])
+def test_changed_config_files(config_file, tmp_path, monkeypatch):
+    """Ensures that new and changed config files are found."""
+    monkeypatch.chdir(tmp_path)
+    config_path = tmp_path / config_file
+    linter = Linter()
+
+    assert not linter.is_outdated()
+
+    config_path.write_text('[flake8]\nmin-name-length = 1\n')
+    linter = Linter()
+
+    assert linter.options.min_name_length == 1
+    assert not linter.is_outdated()
+
+    stat = config_path.stat()
+    os.utime(config_path, (stat.st_atime, stat.st_mtime + 1))
+
+    assert linter.is_outdated()
+
+
+def test_explicit_config_files(tmp_path, monkeypatch):
+    """Ensures that only explicit config files are watched."""
+    monkeypatch.chdir(tmp_path)
+    config_path = tmp_path / 'custom.cfg'
+    config_path.write_text('[flake8]\n')
+    linter = Linter(['--config', str(config_path)])
+    isolated_linter = Linter(['--isolated'])
+    (tmp_path / 'setup.cfg').write_text('[flake8]\n')
+
+    assert not linter.is_outdated()
+    assert not isolated_linter.is_outdated()
+
+    config_path.write_text('[flake8]\nmin-name-length = 1\n')
+    os.utime(config_path, (0, 0))
+
+    assert linter.is_outdated()
+
+
+@pytest.mark.usefixtures('reset_checker')
+def test_found_modules(tmp_path, monkeypatch):
+    """Ensures that modules are found like `flake8` finds them."""
+    monkeypatch.chdir(tmp_path)
+    (tmp_path / 'excluded').mkdir()
+    (tmp_path / 'excluded' / 'module.py').write_text(_CODE)
+    (tmp_path / 'extended.py').write_text(_CODE)
+    (tmp_path / 'module.py').write_text(_CODE)
+    (tmp_path / 'script').write_text(_CODE)
+    linter = Linter([
+        '--isolated',
+        '--exclude',
+        'excluded',
+        '--extend-exclude',
+        'extended.py',
+    ])
+
+    assert list(linter.find_modules()) == ['./module.py']
+    assert list(linter.find_modules(['script', 'excluded'])) == ['script']
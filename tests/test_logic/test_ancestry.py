@@ -0,0 +1,105 @@
+import ast
+
+import pytest
+
+from wemake_python_styleguide.compat.aliases import ForNodes, FunctionNodes
+from wemake_python_styleguide.logic import walk
+from wemake_python_styleguide.logic.nodes import get_parent
+
+_LOOPS = (*ForNodes, ast.While)
+_ANNOTATED = (ast.AnnAssign, ast.arg, *FunctionNodes)
+
+code_with_nested_functions = """
+class Test(object):
+    def method(self, arg: List[int]) -> Dict[str, int]:
+        for item in arg:
+            while item:
+                print(lambda: [-x for x in item], *arg)
+        return []
+
+@decorator(first, second)
+def function():
+    x: Tuple[int, int] = (1, 2)
+"""
+
+
+def _parse_with_parents(code):
+    tree = ast.parse(code)
+    for parent in ast.walk(tree):
+        for child in ast.iter_child_nodes(parent):
+            child.wps_parent = parent
+    return tree
+
+
+def _legacy_closest_parent(node, parents):
+    parent = get_parent(node)
+    while parent is not None and not isinstance(parent, parents):
+        parent = get_parent(parent)
+    return parent
+
+
+def _legacy_is_contained_by(node, container):
+    parent = get_parent(node)
+    while parent is not None:
+        if parent is container:
+            return True
+        parent = get_parent(parent)
+    return False
+
+
+@pytest.mark.parametrize('parents', [
+    FunctionNodes,
+    ast.ClassDef,
+    ast.Lambda,
+    _LOOPS,
+    _ANNOTATED,
+])
+@pytest.mark.parametrize('transform', [True, False])
+def test_closest_parent(parse_ast_tree, parents, transform):
+    """Ensures that cached closest parents are correct."""
+    if transform:
+        tree = parse_ast_tree(code_with_nested_functions)
+    else:
+        tree = _parse_with_parents(code_with_nested_functions)
+    all_nodes = [
+        node
+        for node in ast.walk(tree)
+        if not isinstance(node, (ast.expr_context, ast.operator, ast.unaryop))
+    ]
+
+    for node_to_cache in all_nodes:
+        walk.get_closest_parent(node_to_cache, parents)
+
+    for node in all_nodes:
+        assert walk.get_closest_parent(
+            node, parents,
+        ) is _legacy_closest_parent(node, parents)
+
+
+@pytest.mark.parametrize('transform', [True, False])
+def test_is_contained_by(parse_ast_tree, transform):
+    """Ensures that positions are compared correctly."""
+    if transform:
+        tree = parse_ast_tree(code_with_nested_functions)
+    else:
+        tree = _parse_with_parents(code_with_nested_functions)
+
+    all_nodes = [
+        node
+        for node in ast.walk(tree)
+        if not isinstance(node, (ast.expr_context, ast.operator, ast.unaryop))
+    ]
+    for node in all_nodes:
+        for container in all_nodes:
+            assert walk.is_contained_by(
+                node, container,
+            ) is _legacy_is_contained_by(node, container)
+
+
+def test_is_contained_by_other_tree(parse_ast_tree):
+    """Ensures that nodes from different trees are not compared."""
+    klass = parse_ast_tree(code_with_nested_functions).body[0]
+    other_klass = parse_ast_tree(code_with_nested_functions).body[0]
+
+    assert not walk.is_contained_by(klass.body[0], other_klass)
+    assert walk.is_contained_by(klass.body[0], klass)
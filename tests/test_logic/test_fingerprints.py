@@ -0,0 +1,68 @@
+import ast
+from collections import defaultdict
+
+import pytest
+
+from wemake_python_styleguide.logic import fingerprints
+from wemake_python_styleguide.logic.source import node_to_string
+
+
+def _group_by_source(tree):
+    groups = defaultdict(set)
+    for node in ast.walk(tree):
+        # `astor` can't render `FormattedValue` without `JoinedStr`:
+        if isinstance(node, ast.FormattedValue):
+            continue
+        if isinstance(node, ast.expr):
+            groups[node_to_string(node)].add(fingerprints.get_fingerprint(node))
+    return groups
+
+
+@pytest.mark.parametrize('filename', [
+    'noqa.py',
+    'noqa_controlled.py',
+])
+def test_same_as_full_convert(filename, absolute_path):
+    """Ensures that the same source code has the same fingerprint."""
+    with open(absolute_path('fixtures', 'noqa', filename)) as fixture:
+        tree = ast.parse(fixture.read())
+
+    assert all(
+        len(same_source) == 1
+        for same_source in _group_by_source(tree).values()
+    )
+
+
+@pytest.mark.parametrize(('code', 'is_same'), [
+    ('x = x', True),
+    ('x = (x)', True),
+    ('x.y = x.y', True),
+    ('x = 0x1 and 1', True),
+    ('x = "a" and \'a\'', True),
+    ('x = "a" and u"a"', True),
+    ('x = (1 + 2) * 3 and 3 * (1 + 2)', False),
+    ('x = 1 and 1.0', False),
+    ('x = 1 and True', False),
+    ('x = "a" and b"a"', False),
+    ('x = y', False),
+    ('x = x[0]', False),
+])
+def test_fingerprints_compare(code, is_same):
+    """Ensures that fingerprints ignore formatting and contexts."""
+    assign = ast.parse(code).body[0]
+    compared = [assign.targets[0], assign.value]
+    if isinstance(assign.value, ast.BoolOp):
+        compared = assign.value.values
+
+    assert fingerprints.is_same(*compared) is is_same
+
+
+def test_deep_expression():
+    """Ensures that deep expressions do not cause recursion errors."""
+    code = ' + '.join('x' for _ in range(5000))  # noqa: WPS432
+    first = ast.parse(code).body[0].value
+    second = ast.parse(code).body[0].value
+
+    assert fingerprints.is_same(first, second)
+    assert not fingerprints.is_same(first, second.left)
+    assert fingerprints.is_same(first.left.right, second.right)
@@ -0,0 +1,40 @@
+import ast
+
+import pytest
+
+from wemake_python_styleguide.logic.source import node_to_string
+from wemake_python_styleguide.logic.tree.functions import get_function_name
+
+
+@pytest.mark.parametrize('filename', [
+    'noqa.py',
+    'noqa_controlled.py',
+])
+def test_same_as_full_convert(filename, absolute_path):
+    """Ensures that names of called functions are resolved correctly."""
+    with open(absolute_path('fixtures', 'noqa', filename)) as fixture:
+        tree = ast.parse(fixture.read())
+
+    for node in ast.walk(tree):
+        if isinstance(node, ast.Call):
+            assert get_function_name(node) == node_to_string(node.func)
+
+
+@pytest.mark.parametrize('code', [
+    'print(1)',
+    'self.some.method()',
+    '(first).second()',
+    '"".join([])',
+    'call()()',
+    'items[0]()',
+    '(1).real()',
+])
+def test_function_name_cache(code):
+    """Ensures that names are calculated once for each node."""
+    call = ast.parse(code).body[0].value
+
+    function_name = get_function_name(call)
+    assert function_name == node_to_string(call.func)
+
+    call.func = ast.Name(id='other', ctx=ast.Load())
+    assert get_function_name(call) is function_name
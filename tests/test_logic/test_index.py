@@ -0,0 +1,102 @@
+import ast
+
+import pytest
+
+from wemake_python_styleguide.compat.constants import PY38
+from wemake_python_styleguide.logic import index, walk
+from wemake_python_styleguide.logic.index import NodeIndex
+
+code_with_nested_functions = """
+def first(arg):
+    if arg:
+        return -1
+
+    def second():
+        return [-x for x in arg]
+
+    return arg + 1
+
+def third():
+    return 0
+"""
+
+
+@pytest.mark.parametrize('node_types', [
+    (ast.Return,),
+    (ast.USub,),
+    (ast.stmt,),
+    (ast.Return, ast.Name),
+    (ast.ListComp, ast.comprehension, ast.FunctionDef),
+])
+def test_index_same_as_walk(parse_ast_tree, node_types):
+    """Ensures that index returns the same nodes in the same order."""
+    tree = parse_ast_tree(code_with_nested_functions)
+
+    for node in ast.walk(tree):
+        indexed = list(walk.get_subnodes(node, node_types))
+        assert indexed == [
+            subnode
+            for subnode in ast.walk(node)
+            if isinstance(subnode, node_types)
+        ]
+        assert walk.is_contained(node, node_types) == bool(indexed)
+
+
+def test_index_fallback():
+    """Ensures that nodes without index are walked."""
+    tree = ast.parse(code_with_nested_functions)
+
+    assert len(list(walk.get_subnodes_by_type(tree, ast.Return))) == 4
+    assert walk.is_contained(tree, ast.USub)
+    assert not walk.is_contained(tree, ast.While)
+
+
+def test_index_with_other_tree(parse_ast_tree):
+    """Ensures that shared nodes do not leak between different trees."""
+    tree = parse_ast_tree(code_with_nested_functions)
+    other_tree = parse_ast_tree('print(-1)')
+
+    assert not walk.is_contained(tree.body[1], ast.USub)
+    assert walk.is_contained(other_tree, ast.USub)
+
+
+def test_index_new_types():
+    """Ensures that index can be queried while it is built."""
+    node_index = NodeIndex()
+    name = ast.Name(id='x', ctx=ast.Load())
+
+    node_index.add(name, is_leaf=False, pending=0)
+    assert list(node_index.get_subnodes(ast.expr, 0, 1)) == [name]
+
+    call = ast.Call(func=name, args=[], keywords=[])
+    node_index.add(call, is_leaf=True, pending=0)
+    assert list(node_index.get_subnodes(ast.expr, 0, 1)) == [name, call]
+    assert len(node_index) == 2
+
+
+@pytest.mark.parametrize(('node_types', 'expected'), [
+    ((ast.USub,), True),
+    ((ast.While,), False),
+    ((ast.While, ast.ListComp), True),
+    ((ast.stmt,), True),
+    ((ast.excepthandler,), False),
+])
+def test_subtree_types(parse_ast_tree, node_types, expected):
+    """Ensures that subtree summary is correct."""
+    tree = parse_ast_tree(code_with_nested_functions)
+
+    assert index.may_contain(tree, node_types) is expected
+    assert walk.is_contained(tree, node_types) is expected
+    assert index.may_contain(tree.body[1], node_types) is (
+        expected and ast.stmt in node_types
+    )
+
+
+def test_deprecated_types(parse_ast_tree):
+    """Ensures that types with custom ``isinstance`` are not indexed."""
+    tree = parse_ast_tree(code_with_nested_functions)
+
+    types_mask = index.get_types_mask(ast.Num)
+    assert PY38 is (types_mask is None)
+    assert walk.is_contained(tree, ast.Num)
+    assert len(list(walk.get_subnodes_by_type(tree, ast.Num))) == 3
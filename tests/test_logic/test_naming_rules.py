@@ -0,0 +1,97 @@
+import itertools
+
+import pytest
+
+from wemake_python_styleguide.constants import (
+    SPECIAL_ARGUMENT_NAMES_WHITELIST,
+    UNREADABLE_CHARACTER_COMBINATIONS,
+    VARIABLE_NAMES_BLACKLIST,
+)
+from wemake_python_styleguide.logic.naming import (
+    access,
+    alphabet,
+    builtins,
+    logical,
+    rules,
+)
+
+_MIN_LENGTH = 2
+_MAX_LENGTH = 12
+
+#: All names made of these parts, up to three parts in each name.
+_NAME_PARTS = (
+    '_', '__', 'x', 'data', 'cls', 'list', 'O0', '1l', '1', '23', 'П',
+)
+
+_NAMES = (
+    '',
+    '__import__',
+    '__private__value',
+    'star_wars_episode_2',
+    'some_name_that_is_too_long',
+    *(
+        ''.join(parts)
+        for name_length in range(1, 4)
+        for parts in itertools.product(_NAME_PARTS, repeat=name_length)
+    ),
+)
+
+
+def _check_with_functions(name, is_first_argument):
+    unreadable = alphabet.get_unreadable_characters(
+        name, sorted(UNREADABLE_CHARACTER_COMBINATIONS),
+    )
+    predicates = (
+        (rules.BUILTIN_SHADOWING, builtins.is_builtin_name(name)),
+        (rules.TRAILING_UNDERSCORE, builtins.is_wrong_alias(name)),
+        (rules.PRIVATE, access.is_private(name)),
+        (rules.UNICODE, alphabet.does_contain_unicode(name)),
+        (
+            rules.UNDERSCORED_NUMBER,
+            alphabet.does_contain_underscored_number(name),
+        ),
+        (
+            rules.CONSECUTIVE_UNDERSCORES,
+            alphabet.does_contain_consecutive_underscores(name),
+        ),
+        (rules.TOO_SHORT, logical.is_too_short_name(name, _MIN_LENGTH)),
+        (rules.TOO_LONG, logical.is_too_long_name(name, _MAX_LENGTH)),
+        (rules.WRONG_NAME, logical.is_wrong_name(
+            name, VARIABLE_NAMES_BLACKLIST,
+        )),
+        (rules.RESERVED_ARGUMENT, not is_first_argument and (
+            logical.is_wrong_name(name, SPECIAL_ARGUMENT_NAMES_WHITELIST)
+        )),
+        (
+            rules.WRONG_UNUSED_NAME,
+            access.is_unused(name) and len(name) > 1,
+        ),
+        (rules.UNREADABLE, bool(unreadable)),
+    )
+    return sum(rule for rule, is_failed in predicates if is_failed)
+
+
+@pytest.mark.parametrize('is_first_argument', [True, False])
+def test_same_as_functions(is_first_argument):
+    """Ensures that compiled rules find the same violations as functions."""
+    naming_rules = rules.NamingRules(
+        _MIN_LENGTH, _MAX_LENGTH, VARIABLE_NAMES_BLACKLIST,
+    )
+
+    for name in _NAMES:
+        failed, unreadable = naming_rules.check(
+            name, is_first_argument=is_first_argument,
+        )
+
+        assert failed == _check_with_functions(name, is_first_argument), name
+        assert bool(failed & rules.UNREADABLE) == bool(unreadable)
+        assert unreadable in {'', *UNREADABLE_CHARACTER_COMBINATIONS}
+
+
+def test_rules_from_options(default_options):
+    """Ensures that rules are compiled once for each options object."""
+    naming_rules = rules.naming_rules_from(default_options)
+
+    assert rules.naming_rules_from(default_options) is naming_rules
+    assert naming_rules.min_length == default_options.min_name_length
+    assert naming_rules.max_length == default_options.max_name_length
@@ -0,0 +1,68 @@
+import ast
+
+import pytest
+
+from wemake_python_styleguide.compat.constants import PY38
+from wemake_python_styleguide.logic.source import (
+    SourceSegments,
+    get_source_segment,
+    node_to_string,
+)
+
+code_with_segments = """
+first = some.attr(1, *args)  # comment
+second = 'юникод' + other[ 1 ]
+third = (
+    'multi'
+    'line' if first else [
+        second
+    ]
+)
+fourth = f'{first + second!r}'
+fifth = 1, 2
+"""
+
+
+def _get_values(tree):
+    return [assign.value for assign in tree.body]
+
+
+def _get_formatted_value(tree):
+    return _get_values(tree)[3].values[0].value
+
+
+@pytest.mark.skipif(not PY38, reason='end positions were added in 3.8')
+def test_source_segments(parse_ast_tree):
+    """Ensures that original source code is returned."""
+    tree = parse_ast_tree(code_with_segments)
+    first, second, third, fourth = _get_values(tree)[:4]
+
+    assert get_source_segment(tree, first) == 'some.attr(1, *args)'
+    assert get_source_segment(tree, second) == "'юникод' + other[ 1 ]"
+    assert get_source_segment(tree, second.right) == 'other[ 1 ]'
+    assert get_source_segment(tree, third.orelse) == (
+        '[\n        second\n    ]'
+    )
+    assert get_source_segment(tree, fourth) == "f'{first + second!r}'"
+
+
+@pytest.mark.parametrize('node_getter', [
+    _get_formatted_value,
+    lambda tree: _get_values(tree)[4],  # tuple
+    lambda tree: ast.Name(id='some', ctx=ast.Load()),  # no positions
+])
+def test_source_segments_fallback(parse_ast_tree, node_getter):
+    """Ensures that nodes without reliable positions are converted."""
+    tree = parse_ast_tree(code_with_segments)
+    node = node_getter(tree)
+
+    assert get_source_segment(tree, node) == node_to_string(node)
+
+
+def test_source_segments_without_lines():
+    """Ensures that trees without source lines are converted."""
+    tree = ast.parse(code_with_segments)
+    node = tree.body[0].value
+
+    assert get_source_segment(tree, node) == node_to_string(node)
+    assert SourceSegments([]).get_segment(node) is None
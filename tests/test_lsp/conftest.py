@@ -0,0 +1,90 @@
+import functools
+import os
+import threading
+
+import pytest
+
+from wemake_python_styleguide.checker import Checker
+from wemake_python_styleguide.linter.linter import Linter
+from wemake_python_styleguide.lsp.protocol import JsonRpcStream
+from wemake_python_styleguide.lsp.server import LanguageServer
+
+
+def _open_pipe():
+    read_fd, write_fd = os.pipe()
+    return os.fdopen(read_fd, 'rb'), os.fdopen(write_fd, 'wb')
+
+
+class _ScriptedClient(object):
+    """Sends messages to a server, like editors do."""
+
+    def __init__(self, argv, debounce):
+        server_reader, client_writer = _open_pipe()
+        client_reader, server_writer = _open_pipe()
+        self.writer = client_writer
+        self.stream = JsonRpcStream(client_reader, client_writer)
+        self.thread = threading.Thread(
+            target=LanguageServer(
+                JsonRpcStream(server_reader, server_writer),
+                functools.partial(Linter, argv, incremental=True),
+                debounce=debounce,
+            ).serve,
+            daemon=True,
+        )
+        self.thread.start()
+
+    def open_document(self, uri, text):
+        self.stream.write({
+            'method': 'textDocument/didOpen',
+            'params': {'textDocument': {
+                'uri': uri,
+                'languageId': 'python',
+                'version': 1,
+                'text': text,
+            }},
+        })
+
+    def change_document(self, uri, text, version):
+        self.stream.write({
+            'method': 'textDocument/didChange',
+            'params': {
+                'textDocument': {'uri': uri, 'version': version},
+                'contentChanges': [{'text': text}],
+            },
+        })
+
+    def close_document(self, uri):
+        self.stream.write({
+            'method': 'textDocument/didClose',
+            'params': {'textDocument': {'uri': uri}},
+        })
+
+    def read_diagnostics(self):
+        """Returns the next published version and its codes."""
+        method_params = self.stream.read()['params']
+        return method_params['version'], [
+            diagnostic['code'] for diagnostic in method_params['diagnostics']
+        ]
+
+
+@pytest.fixture()
+def document(tmp_path, monkeypatch):
+    """Enters an empty project, returns the uri of its module."""
+    monkeypatch.chdir(tmp_path)
+    return (tmp_path / 'short.py').as_uri()
+
+
+@pytest.fixture()
+def lsp_client(document, default_options):  # noqa: WPS442
+    """Serves scripted clients in threads, returns the client factory."""
+    clients = []
+
+    def factory(argv=('--isolated',), debounce=0):
+        clients.append(_ScriptedClient(argv, debounce))
+        return clients[-1]
+
+    yield factory
+    for client in clients:  # servers stop when their input is closed
+        client.writer.close()
+        client.thread.join()
+    Checker.parse_options(default_options)
@@ -0,0 +1,84 @@
+import ast
+import threading
+
+from wemake_python_styleguide.checker import Checker
+from wemake_python_styleguide.linter.linter import Linter
+from wemake_python_styleguide.visitors.base import BaseNodeVisitor
+
+_DEBOUNCE = 0.2
+
+
+class _BrokenVisitor(BaseNodeVisitor):
+    def visit_Assign(self, node: ast.Assign) -> None:  # noqa: N802
+        raise ValueError('Message from visitor')
+
+
+def test_stale_versions(lsp_client, document):
+    """Ensures that only the latest versions of documents are published."""
+    client = lsp_client(debounce=_DEBOUNCE)
+    client.open_document(document, 'x = 1\n')
+    client.change_document(document, 'y = 1\n', 2)
+    client.change_document(document, 'answer = 1\n', 3)
+
+    assert client.read_diagnostics() == (3, [])
+
+    client.close_document(document)
+
+    assert client.read_diagnostics() == (None, [])
+
+
+def test_changed_while_checked(lsp_client, document, monkeypatch):
+    """Ensures that versions changed while they are checked are dropped."""
+    check_module = Linter.check_module
+    is_checked = threading.Event()
+    is_changed = threading.Event()
+
+    def factory(linter, filename, lines):
+        is_checked.set()
+        is_changed.wait()
+        return check_module(linter, filename, lines)
+
+    monkeypatch.setattr(Linter, 'check_module', factory)
+    client = lsp_client()
+    client.open_document(document, 'x = 1\n')
+    is_checked.wait()  # the first version is being checked
+    client.change_document(document, 'answer = 1\n', 2)
+    client.stream.write({'id': 1, 'method': 'unknown'})
+
+    assert client.stream.read()['id'] == 1  # the change is received
+
+    is_changed.set()
+
+    assert client.read_diagnostics() == (2, [])
+
+
+def test_failed_check(lsp_client, document, monkeypatch, caplog):
+    """Ensures that failed checks do not stop other checks."""
+    check_module = Linter.check_module
+
+    def factory(linter, filename, lines):
+        if filename.endswith('broken.py'):
+            raise ValueError(filename)
+        return check_module(linter, filename, lines)
+
+    monkeypatch.setattr(Linter, 'check_module', factory)
+    client = lsp_client()
+    client.open_document(document.replace('short', 'broken'), 'x = 1\n')
+    client.open_document(document, 'x = 1\n')
+
+    assert client.read_diagnostics() == (1, ['WPS111'])
+    assert 'broken.py' in caplog.text
+
+
+def test_failed_visitor(lsp_client, document, monkeypatch, capsys):
+    """Ensures that tracebacks of failed visitors are not sent as messages."""
+    monkeypatch.setattr(Checker, '_visitors', (_BrokenVisitor,))
+    client = lsp_client()
+    client.open_document(document, 'x = 1\n')
+
+    assert client.read_diagnostics() == (1, ['WPS000'])
+
+    captured = capsys.readouterr()
+
+    assert not captured.out
+    assert 'ValueError: Message from visitor' in captured.err
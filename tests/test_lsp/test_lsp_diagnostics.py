@@ -0,0 +1,60 @@
+import pytest
+
+from wemake_python_styleguide.version import pkg_version
+
+
+def test_open_document(lsp_client, document):
+    """Ensures that opened documents are checked."""
+    client = lsp_client()
+    client.open_document(document, 'x = 1\n')
+
+    assert client.stream.read() == {
+        'jsonrpc': '2.0',
+        'method': 'textDocument/publishDiagnostics',
+        'params': {
+            'uri': document,
+            'version': 1,
+            'diagnostics': [{
+                'range': {
+                    'start': {'line': 0, 'character': 0},
+                    'end': {'line': 0, 'character': 5},
+                },
+                'severity': 2,
+                'code': 'WPS111',
+                'codeDescription': {'href': ''.join((
+                    'https://wemake-python-stylegui.de/en/',
+                    pkg_version,
+                    '/pages/usage/violations/naming.html',
+                ))},
+                'source': 'wemake-python-styleguide',
+                'message': 'Found too short name: x < 2',
+            }],
+        },
+    }
+
+
+@pytest.mark.parametrize(('text', 'codes'), [
+    ('x = 1  # noqa: WPS111\n', []),
+    ('', ['WPS411']),
+    ('x = = 1\n', ['E999']),
+    ('def some(:\n', ['E902']),
+])
+def test_unsaved_text(lsp_client, document, text, codes):
+    """Ensures that unsaved text is checked like `flake8` checks files."""
+    client = lsp_client(argv=['--isolated', '--select', 'WPS,E9'])
+    client.open_document(document, text)
+
+    assert client.read_diagnostics() == (1, codes)
+
+
+def test_changed_config(lsp_client, document, tmp_path):
+    """Ensures that options are parsed again when config files change."""
+    client = lsp_client(argv=[])
+    client.open_document(document, 'x = 1\n')
+
+    assert client.read_diagnostics() == (1, ['WPS111'])
+
+    (tmp_path / 'setup.cfg').write_text('[flake8]\nmin-name-length = 1\n')
+    client.change_document(document, 'x = 2\n', 2)
+
+    assert client.read_diagnostics() == (2, [])
@@ -0,0 +1,96 @@
+import io
+import subprocess
+import sys
+
+from wemake_python_styleguide.linter.linter import Linter
+from wemake_python_styleguide.lsp.protocol import JsonRpcStream
+from wemake_python_styleguide.lsp.server import LanguageServer
+
+_METHOD_NOT_FOUND = -32601
+
+
+def _script(*messages):
+    script = io.BytesIO()
+    stream = JsonRpcStream(io.BytesIO(), script)
+    for message in messages:
+        stream.write(message)
+    return script.getvalue()
+
+
+def _serve(script):
+    output = io.BytesIO()
+    status = LanguageServer(
+        JsonRpcStream(io.BytesIO(script), output),
+        lambda: Linter(['--isolated']),
+    ).serve()
+
+    responses = JsonRpcStream(io.BytesIO(output.getvalue()), io.BytesIO())
+    return status, list(iter(responses.read, None))
+
+
+def test_lifecycle():
+    """Ensures that the server answers requests until the exit."""
+    status, responses = _serve(_script(
+        {'id': 1, 'method': 'initialize', 'params': {}},
+        {'method': 'initialized', 'params': {}},
+        {'method': '$/cancelRequest', 'params': {'id': 1}},
+        {'id': 2, 'method': 'textDocument/hover', 'params': {}},
+        {'id': 3, 'result': None},
+        {'id': 4, 'method': 'shutdown'},
+        {'method': 'exit'},
+        {'id': 5, 'method': 'shutdown'},
+    ))
+
+    assert status == 0
+    assert [response['id'] for response in responses] == [1, 2, 4]
+    assert responses[0]['result']['capabilities']['textDocumentSync'] == {
+        'openClose': True,
+        'change': 1,
+    }
+    assert responses[1]['error']['code'] == _METHOD_NOT_FOUND
+    assert responses[2] == {'jsonrpc': '2.0', 'id': 4, 'result': None}
+
+
+def test_exit_without_shutdown():
+    """Ensures that the server fails when its client is gone."""
+    script = b''.join((
+        b'Content-Type: application/vscode-jsonrpc\r\n',
+        _script({'id': 1, 'method': 'initialize', 'params': {}}),
+    ))
+
+    status, responses = _serve(script)
+
+    assert status == 1
+    assert len(responses) == 1
+
+
+def test_server_process(tmp_path):
+    """Ensures that the server process speaks over standard streams."""
+    uri = (tmp_path / 'short.py').as_uri()
+    process = subprocess.run(
+        [
+            sys.executable,
+            '-m',
+            'wemake_python_styleguide.lsp.server',
+            '--isolated',
+        ],
+        input=_script(
+            {'id': 1, 'method': 'initialize', 'params': {}},
+            {'method': 'textDocument/didOpen', 'params': {'textDocument': {
+                'uri': uri, 'version': 1, 'text': 'x = 1\n',
+            }}},
+            {'method': 'textDocument/didClose', 'params': {'textDocument': {
+                'uri': uri,
+            }}},
+            {'id': 2, 'method': 'shutdown'},
+            {'method': 'exit'},
+        ),
+        stdout=subprocess.PIPE,
+        check=True,
+    )
+
+    responses = JsonRpcStream(io.BytesIO(process.stdout), io.BytesIO())
+    assert responses.read()['id'] == 1
+    assert list(iter(responses.read, None))[-1] == {
+        'jsonrpc': '2.0', 'id': 2, 'result': None,
+    }
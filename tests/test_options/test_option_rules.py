@@ -1,16 +1,21 @@
 from wemake_python_styleguide.options import config
 
+_ALL_OPTIONS = (
+    *config.Configuration._options,  # noqa: WPS437
+    *config.Configuration._runtime_options,  # noqa: WPS437
+)
+
 
 def test_option_docs():
     """Ensures that all options are documented."""
-    for option in config.Configuration._options:  # noqa: WPS437
+    for option in _ALL_OPTIONS:
         option_name = '``{0}``'.format(option.long_option_name[2:])
         assert option_name in config.__doc__
 
 
 def test_option_help():
     """Ensures that all options has help."""
-    for option in config.Configuration._options:  # noqa: WPS437
+    for option in _ALL_OPTIONS:
         assert len(option.help) > 10
         assert '%default' in option.help
         assert option.help.split(' Defaults to:')[0].endswith('.')
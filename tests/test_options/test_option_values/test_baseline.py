@@ -0,0 +1,16 @@
+def test_parsing_baseline(option_parser):
+    """Ensures that baseline options can be parsed."""
+    args, _ = option_parser.parse_args([
+        '--baseline',
+        '.wps_baseline',
+        '--baseline-update',
+    ])
+    assert args.baseline == '.wps_baseline'
+    assert args.baseline_update
+
+
+def test_baseline_default(option_parser):
+    """Ensures that baseline is disabled by default."""
+    args, _ = option_parser.parse_args([])
+    assert args.baseline == ''
+    assert not args.baseline_update
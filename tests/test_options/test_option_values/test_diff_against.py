@@ -0,0 +1,10 @@
+def test_parsing_diff_against(option_parser):
+    """Ensures that ``git`` revision can be parsed."""
+    args, _ = option_parser.parse_args(['--diff-against', 'origin/master'])
+    assert args.diff_against == 'origin/master'
+
+
+def test_diff_against_default(option_parser):
+    """Ensures that all lines are checked by default."""
+    args, _ = option_parser.parse_args([])
+    assert args.diff_against == ''
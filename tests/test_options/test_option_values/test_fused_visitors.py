@@ -0,0 +1,10 @@
+def test_parsing_fused_visitors(option_parser):
+    """Ensures that ``fused_visitors`` can be parsed."""
+    args, _ = option_parser.parse_args(['--fused-visitors'])
+    assert args.fused_visitors is True
+
+
+def test_fused_visitors_default(option_parser):
+    """Ensures that ``fused_visitors`` is disabled by default."""
+    args, _ = option_parser.parse_args([])
+    assert args.fused_visitors is False
@@ -0,0 +1,17 @@
+def test_parsing_results_cache(option_parser):
+    """Ensures that results cache options can be parsed."""
+    args, _ = option_parser.parse_args([
+        '--results-cache-dir',
+        '.wps_cache',
+        '--results-cache-size',
+        '10',
+    ])
+    assert args.results_cache_dir == '.wps_cache'
+    assert args.results_cache_size == 10
+
+
+def test_results_cache_default(option_parser):
+    """Ensures that results cache is disabled by default."""
+    args, _ = option_parser.parse_args([])
+    assert args.results_cache_dir == ''
+    assert args.results_cache_size > 0
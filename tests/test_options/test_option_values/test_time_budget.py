@@ -0,0 +1,17 @@
+def test_parsing_time_budget(option_parser):
+    """Ensures that time budget options can be parsed."""
+    args, _ = option_parser.parse_args([
+        '--max-visitor-time',
+        '0.5',
+        '--max-module-time',
+        '10',
+    ])
+    assert args.max_visitor_time == 0.5
+    assert args.max_module_time == 10
+
+
+def test_time_budget_default(option_parser):
+    """Ensures that time budgets are disabled by default."""
+    args, _ = option_parser.parse_args([])
+    assert args.max_visitor_time == 0
+    assert args.max_module_time == 0
@@ -0,0 +1,128 @@
+"""
+We used to transform the tree with many separate tree walks.
+
+Now we do it in a single one.
+This module contains the old implementation to compare the results.
+
+Note, that contexts and operators are singletons shared between all nodes,
+so their attributes are meaningless and we do not compare them.
+"""
+
+import ast
+
+import pytest
+from pep8ext_naming import NamingChecker
+
+from wemake_python_styleguide.compat.constants import PY38
+from wemake_python_styleguide.transformations.ast_tree import transform
+
+_SINGLETONS = (
+    ast.expr_context,
+    ast.boolop,
+    ast.operator,
+    ast.unaryop,
+    ast.cmpop,
+)
+_CONTEXTS = (ast.Module, ast.ClassDef, ast.FunctionDef, ast.AsyncFunctionDef)
+_ASYNC_NODES = (ast.AsyncFor, ast.AsyncWith, ast.AsyncFunctionDef)
+_ATTRIBUTES = (
+    'wps_parent',
+    'wps_context',
+    'wps_if_chain',
+    'wps_if_chained',
+    'function_type',
+    'lineno',
+    'col_offset',
+)
+
+_NOQA_FIXTURES = (
+    'noqa.py',
+    'noqa_controlled.py',
+    pytest.param(
+        'noqa38.py',
+        marks=pytest.mark.skipif(not PY38, reason='python3.8+ syntax'),
+    ),
+    pytest.param(
+        'noqa_pre38.py',
+        marks=pytest.mark.skipif(PY38, reason='python3.7- syntax'),
+    ),
+)
+
+
+def _legacy_fixes(node, naming):
+    if isinstance(node, ast.ClassDef):
+        naming.tag_class_functions(node)
+    if isinstance(node, _ASYNC_NODES):
+        node.col_offset -= 6 if node.col_offset % 4 else 0
+    if isinstance(node, ast.Tuple):
+        parent_lineno = getattr(node.wps_parent, 'lineno', None)
+        if parent_lineno and parent_lineno < node.lineno:
+            node.lineno -= 1
+
+
+def _legacy_enhancements(node, naming):
+    context = getattr(node, 'wps_parent', None)
+    while context is not None and not isinstance(context, _CONTEXTS):
+        context = getattr(context, 'wps_parent', None)
+    node.wps_context = context
+
+    if isinstance(node, ast.If):
+        for if_child in node.orelse:
+            if isinstance(if_child, ast.If):
+                node.wps_if_chained = True
+                if_child.wps_if_chain = node
+
+
+def _legacy_transform(tree):
+    for parent in ast.walk(tree):
+        for child in ast.iter_child_nodes(parent):
+            child.wps_parent = parent
+
+    naming = NamingChecker(tree, 'stdin')
+    for transformation in (_legacy_fixes, _legacy_enhancements):
+        for node in ast.walk(tree):
+            transformation(node, naming)
+    return tree
+
+
+def _comparable_value(node, attribute, positions):
+    node_value = getattr(node, attribute, None)
+    if isinstance(node_value, ast.AST):
+        return positions[node_value]
+    return node_value
+
+
+def _describe(code: str, transformation):
+    nodes = [
+        node
+        for node in ast.walk(transformation(ast.parse(code)))
+        if not isinstance(node, _SINGLETONS)
+    ]
+    positions = {node: index for index, node in enumerate(nodes)}
+    return [
+        [
+            _comparable_value(node, attribute, positions)
+            for attribute in _ATTRIBUTES
+        ]
+        for node in nodes
+    ]
+
+
+@pytest.mark.parametrize('filename', _NOQA_FIXTURES)
+def test_same_attributes_as_legacy(filename, absolute_path):
+    """Ensures that single pass sets the same attributes."""
+    with open(absolute_path('fixtures', 'noqa', filename)) as fixture:
+        code = fixture.read()
+
+    assert _describe(code, transform) == _describe(code, _legacy_transform)
+
+
+@pytest.mark.parametrize('code', [
+    'print((\n    1, 2,\n))',
+    'async def test():\n    async for _ in some:\n        ...',
+    'class Test(type):\n    def method(cls):\n        ...',
+    'if first:\n    ...\nelif second:\n    ...\nelse:\n    ...',
+])
+def test_special_cases_as_legacy(code):
+    """Ensures that single pass applies all transformations."""
+    assert _describe(code, transform) == _describe(code, _legacy_transform)
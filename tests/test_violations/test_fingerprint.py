@@ -0,0 +1,70 @@
+import ast
+import tokenize
+
+import pytest
+
+from wemake_python_styleguide.violations.base import (
+    ASTViolation,
+    SimpleViolation,
+    TokenizeViolation,
+)
+
+
+class _ASTViolation(ASTViolation):
+    error_template = '{0}'
+    code = 1
+
+
+class _OtherASTViolation(ASTViolation):
+    error_template = '{0}'
+    code = 2
+
+
+class _TokenizeViolation(TokenizeViolation):
+    error_template = '{0}'
+    code = 3
+
+
+class _SimpleViolation(SimpleViolation):
+    error_template = '{0}'
+    code = 4
+
+
+def _parse_statement(code):
+    return ast.parse(code).body[-1]
+
+
+@pytest.mark.parametrize(('first', 'second'), [
+    ('x = 1', 'y = 2\n\nx = 1'),
+    ('def function():\n    return 1', 'def function():\n    return 2'),
+    ('class Test:\n    x = 1', '@decorator\nclass Test:\n    ...'),
+    ('for x in y:\n    ...', 'for z in w:\n    print()'),
+])
+def test_same_fingerprint(first, second):
+    """Ensures that locations and bodies of nodes are not used."""
+    first_violation = _ASTViolation(_parse_statement(first), text='text')
+    second_violation = _ASTViolation(_parse_statement(second), text='text')
+
+    assert first_violation.fingerprint() == second_violation.fingerprint()
+
+
+@pytest.mark.parametrize(('first', 'second'), [
+    (_ASTViolation(ast.Name(id='x')), _ASTViolation(ast.Name(id='y'))),
+    (_ASTViolation(ast.Name(id='x')), _OtherASTViolation(ast.Name(id='x'))),
+    (
+        _ASTViolation(ast.Name(id='x'), text='1'),
+        _ASTViolation(ast.Name(id='x'), text='2'),
+    ),
+    (
+        _ASTViolation(_parse_statement('def first(): ...')),
+        _ASTViolation(_parse_statement('def second(): ...')),
+    ),
+    (
+        _TokenizeViolation(tokenize.TokenInfo(1, 'x', (1, 0), (1, 1), 'x')),
+        _TokenizeViolation(tokenize.TokenInfo(1, 'y', (1, 0), (1, 1), 'y')),
+    ),
+    (_SimpleViolation(text='x'), _SimpleViolation(text='y')),
+])
+def test_different_fingerprint(first, second):
+    """Ensures that codes, texts, and nodes change fingerprints."""
+    assert first.fingerprint() != second.fingerprint()
@@ -51,6 +51,16 @@ class Test(object):
         ...
 """
 
+conditional_methods = """
+class Test(object):
+    if sys.version_info > (3, 8):
+        def {1}(self):
+            ...
+
+    def {0}(self):
+        ...
+"""
+
 class_template = """
 class Template(object):
     def {0}(self):
@@ -81,6 +91,10 @@ def test_correct_method_order(
     assert_errors(visitor, [])
 
 
+@pytest.mark.parametrize('template', [
+    class_template,
+    conditional_methods,
+])
 @pytest.mark.parametrize(('first', 'second'), [
     ('__init__', '__new__'),
     ('__call__', '__init__'),
@@ -116,12 +130,13 @@ def test_incorrect_method_order(
     assert_errors,
     parse_ast_tree,
     default_options,
+    template,
     first,
     second,
     mode,
 ):
     """Testing that incorrect method order is prohibited."""
-    tree = parse_ast_tree(mode(class_template.format(first, second)))
+    tree = parse_ast_tree(mode(template.format(first, second)))
 
     visitor = ClassMethodOrderVisitor(default_options, tree=tree)
     visitor.run()
@@ -95,6 +95,12 @@ def some_function():
         print(_ex)
 """
 
+wrong_function_with_used_with = """
+def some_function():
+    with open(make(_value)) as _value:
+        ...
+"""
+
 wrong_function_with_for = """
 def some_function():
     for _key_item in some():
@@ -146,6 +152,7 @@ def test_correct_variables(
     wrong_function2,
     wrong_function_with_exception,
     wrong_function_with_with,
+    wrong_function_with_used_with,
     wrong_function_with_for,
     wrong_method,
     pytest.param(
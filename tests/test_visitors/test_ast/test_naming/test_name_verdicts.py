@@ -0,0 +1,56 @@
+from wemake_python_styleguide.logic.naming import rules
+from wemake_python_styleguide.violations.naming import (
+    TooShortNameViolation,
+    WrongVariableNameViolation,
+)
+from wemake_python_styleguide.visitors.ast.naming import WrongNameVisitor
+
+_CODE = """
+def function(self, value):
+    result = value
+    return result
+"""
+
+
+def test_verdicts_are_shared(parse_ast_tree, default_options):
+    """Ensures that names are checked once for all modules."""
+    rules.get_verdicts.cache_clear()
+
+    modules = [parse_ast_tree(_CODE), parse_ast_tree(_CODE)]
+    for tree in (parse_ast_tree(_CODE), *modules):
+        WrongNameVisitor(default_options, tree=tree).run()
+
+    cache_info = rules.get_verdicts.cache_info()
+    assert cache_info.misses == 4
+    assert cache_info.hits == len(modules) * 4
+
+
+def test_verdicts_with_options(
+    assert_errors,
+    parse_ast_tree,
+    options,
+    default_options,
+):
+    """Ensures that verdicts depend on options."""
+    visitor = WrongNameVisitor(
+        default_options, tree=parse_ast_tree(_CODE),
+    )
+    visitor.run()
+    assert_errors(visitor, [
+        WrongVariableNameViolation,
+        WrongVariableNameViolation,
+    ])
+
+    option_values = options(
+        min_name_length=7,
+        allowed_domain_names=('value', 'result'),
+    )
+    visitor = WrongNameVisitor(
+        option_values, tree=parse_ast_tree(_CODE),
+    )
+    visitor.run()
+    assert_errors(visitor, [
+        TooShortNameViolation,
+        TooShortNameViolation,
+        TooShortNameViolation,
+    ])
@@ -0,0 +1,57 @@
+import ast
+
+from wemake_python_styleguide.visitors.base import BaseNodeVisitor
+from wemake_python_styleguide.visitors.fused import FusedWalker
+
+
+class _NameCollector(BaseNodeVisitor):
+    def __init__(self, *args, **kwargs) -> None:
+        super().__init__(*args, **kwargs)
+        self.names = []
+
+    def visit_Name(self, node: ast.Name) -> None:  # noqa: N802
+        self.names.append(node.id)
+        self.generic_visit(node)
+
+
+class _PrunedNameCollector(_NameCollector):
+    def visit_Call(self, node: ast.Call) -> None:  # noqa: N802
+        """Does not go into calls."""
+
+
+class _BrokenVisitor(BaseNodeVisitor):
+    def visit_Call(self, node: ast.Call) -> None:  # noqa: N802
+        raise ValueError('Message from visitor')
+
+
+class _BrokenPostVisitVisitor(BaseNodeVisitor):
+    def _post_visit(self) -> None:
+        raise ValueError('Message from post visit')
+
+
+def test_fused_walker_prunes_subtrees(parse_ast_tree, default_options):
+    """Ensures that visitors do not get nodes they did not descend into."""
+    tree = parse_ast_tree('first(second(third), fourth)')
+    regular = _NameCollector(default_options, tree=tree)
+    pruned = _PrunedNameCollector(default_options, tree=tree)
+
+    FusedWalker([regular, pruned], on_error=print).run(tree)
+
+    assert regular.names == ['first', 'second', 'third', 'fourth']
+    assert not pruned.names
+
+
+def test_fused_walker_error_handling(parse_ast_tree, default_options):
+    """Ensures that broken visitors do not affect other ones."""
+    tree = parse_ast_tree('first(second(third))')
+    visitors = [
+        _BrokenVisitor(default_options, tree=tree),
+        _NameCollector(default_options, tree=tree),
+        _BrokenPostVisitVisitor(default_options, tree=tree),
+    ]
+    failed = []
+
+    FusedWalker(visitors, on_error=failed.append).run(tree)
+
+    assert failed == [visitors[0], visitors[2]]
+    assert visitors[1].names == ['first', 'second', 'third']
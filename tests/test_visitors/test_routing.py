@@ -0,0 +1,89 @@
+import ast
+
+import pytest
+
+from wemake_python_styleguide.compat.constants import PY38
+from wemake_python_styleguide.compat.routing import (
+    fill_dispatch_table,
+    get_visit_method,
+)
+from wemake_python_styleguide.visitors.base import BaseNodeVisitor
+from wemake_python_styleguide.visitors.decorators import alias
+
+
+@alias('visit_any_import', (
+    'visit_Import',
+    'visit_ImportFrom',
+))
+class _RecordingVisitor(BaseNodeVisitor):
+    def __init__(self, *args, **kwargs) -> None:
+        super().__init__(*args, **kwargs)
+        self.visited = []
+
+    def visit_any_import(self, node: ast.AST) -> None:
+        self.visited.append(type(node).__name__)
+        self.generic_visit(node)
+
+    def visit_Num(self, node: ast.AST) -> None:  # noqa: N802
+        self.visited.append('Num')
+        self.generic_visit(node)
+
+    def visit_Str(self, node: ast.AST) -> None:  # noqa: N802
+        self.visited.append('Str')
+        self.generic_visit(node)
+
+
+class _FilledVisitor(_RecordingVisitor):
+    """Its dispatch table is filled before any nodes are visited."""
+
+
+def test_routes_aliases_and_constants(parse_ast_tree, default_options):
+    """Ensures that aliased methods and constants are routed correctly."""
+    tree = parse_ast_tree("""
+    import os
+    from sys import path
+    print(1, 'a', b'c')
+    """)
+    visitor = _RecordingVisitor(default_options, tree=tree)
+    visitor.run()
+
+    assert visitor.visited == ['Import', 'ImportFrom', 'Num', 'Str']
+
+
+@pytest.mark.skipif(not PY38, reason='python3.8+ has only `Constant` nodes')
+def test_constants_are_routed_by_value_type():
+    """Ensures that constants of different value types do not clash."""
+    number = ast.Constant(value=1)
+    string = ast.Constant(value='a')
+    raw_bytes = ast.Constant(value=b'a')
+
+    assert get_visit_method(_RecordingVisitor, number) is (
+        _RecordingVisitor.visit_Num
+    )
+    assert get_visit_method(_RecordingVisitor, string) is (
+        _RecordingVisitor.visit_Str
+    )
+    assert get_visit_method(_RecordingVisitor, raw_bytes) is None
+
+
+def test_missing_methods_are_cached():
+    """Ensures that missing methods are cached as ``None``."""
+    node = ast.Pass()
+
+    assert get_visit_method(_RecordingVisitor, node) is None
+    assert get_visit_method(_RecordingVisitor, node) is None
+
+
+def test_filled_dispatch_table(parse_ast_tree, default_options):
+    """Ensures that filled dispatch tables route nodes like lazy ones."""
+    tree = parse_ast_tree("""
+    import os
+    from sys import path
+    print(1, 'a', b'c')
+    """)
+    fill_dispatch_table(_FilledVisitor)
+    visitor = _FilledVisitor(default_options, tree=tree)
+    visitor.run()
+
+    assert visitor.visited == ['Import', 'ImportFrom', 'Num', 'Str']
+    assert get_visit_method(_FilledVisitor, ast.Pass()) is None
@@ -0,0 +1,22 @@
+"""
+Checks modules with our checker only, see :ref:`linter <linter>`.
+
+Accepts the same arguments as ``flake8``, prints the same output.
+"""
+
+import sys
+from typing import Optional, Sequence
+
+from wemake_python_styleguide.linter.linter import Linter
+
+
+def main(argv: Optional[Sequence[str]] = None) -> int:
+    """Checks modules, returns the exit status."""
+    flake8_argv = sys.argv[1:] if argv is None else argv
+    output, status = Linter(flake8_argv).run()
+    sys.stdout.write(output)
+    return status
+
+
+if __name__ == '__main__':  # pragma: no cover
+    sys.exit(main())
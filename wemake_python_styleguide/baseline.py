@@ -0,0 +1,184 @@
+"""
+Known violations of legacy code.
+
+Adopting our style guide in a large project usually means
+thousands of violations in the existing code.
+Baseline file stores them, so only new violations are reported.
+
+Run ``flake8`` once with ``--baseline`` and ``--baseline-update`` options
+to record all violations. Later runs with the same ``--baseline`` option
+do not report recorded violations.
+
+Violations are recorded by their fingerprints, not by their locations,
+see :meth:`wemake_python_styleguide.violations.base.BaseViolation.fingerprint`.
+So, adding or removing lines above a violation does not make it new.
+Each fingerprint is counted: copying a line with a known violation
+reports the copy.
+
+Each module also has a hash of its source code,
+the plugin version, and values of all options.
+Modules that match their hash are not checked at all.
+Known violations of other modules are dropped before formatting messages.
+
+Baseline is a text file with a line for each module:
+its hash, its path relative to the baseline file, and fingerprints.
+These parts are separated by tabs, fingerprints are separated by spaces.
+Each ``flake8`` process appends lines with a single write,
+the last line wins when the same module is recorded twice.
+
+Baseline files of large projects have hundreds of thousands of fingerprints.
+So, only paths are found when the file is loaded.
+Hashes and fingerprints are parsed only for modules that are checked.
+
+.. _baseline:
+
+Baseline API
+------------
+
+.. autoclass:: Baseline
+   :no-undoc-members:
+
+.. autoclass:: ModuleBaseline
+   :no-undoc-members:
+
+"""
+
+import os
+from collections import Counter
+from typing import Dict, Iterable, List, Optional
+
+from typing_extensions import Final, final
+
+from wemake_python_styleguide.cache import make_key
+from wemake_python_styleguide.violations.base import BaseViolation
+
+_TAB: Final = '\t'
+
+
+@final
+class ModuleBaseline(object):
+    """Known violations of a single module."""
+
+    def __init__(self, fingerprints: Iterable[str], update: bool) -> None:
+        """
+        Counts known fingerprints.
+
+        Arguments:
+            fingerprints: fingerprints of known violations.
+            update: whether to record all violations as known.
+
+        """
+        self.fingerprints: List[str] = []
+        self._known = Counter(fingerprints)
+        self._update = update
+
+    def is_known(self, violation: BaseViolation) -> bool:
+        """
+        Tells whether the violation is known, each known one matches once.
+
+        All violations are known and recorded to ``fingerprints``
+        when the baseline is updated.
+        """
+        if not self._known and not self._update:
+            return False
+
+        fingerprint = violation.fingerprint()
+        if self._update:
+            self.fingerprints.append(fingerprint)
+            return True
+        if self._known[fingerprint]:
+            self._known[fingerprint] -= 1
+            return True
+        return False
+
+
+@final
+class Baseline(object):
+    """
+    Known violations of all modules from the baseline file.
+
+    Unlike cache, baseline changes reported violations.
+    So, broken baseline files are not ignored.
+    """
+
+    def __init__(self, filename: str, namespace: str, update: bool) -> None:
+        """
+        Loads the baseline file, missing file is an empty baseline.
+
+        Arguments:
+            filename: path to the baseline file, empty to disable it.
+            namespace: hash of the plugin version and options.
+            update: whether to write all violations to a new file.
+
+        """
+        self.key = ''
+        self._filename = filename
+        self._directory = os.path.dirname(os.path.realpath(filename))
+        self._namespace = namespace
+        self._update = update and bool(filename)
+        self._records: Dict[str, str] = {}
+
+        if self._update:
+            open(filename, 'w').close()  # noqa: WPS515
+        elif filename:
+            self._load()
+
+    def get(self, filename: str, source: str) -> Optional[ModuleBaseline]:
+        """Returns known violations, ``None`` when the module is unchanged."""
+        record = self._records.get(self._get_path(filename))
+        if record is None:
+            return ModuleBaseline((), update=self._update)
+
+        source_hash = record[:record.index(_TAB)]
+        if source_hash == make_key((self._namespace, source)):
+            return None
+        return ModuleBaseline(
+            record[record.rindex(_TAB) + 1:].split(),
+            update=self._update,
+        )
+
+    def save(
+        self,
+        filename: str,
+        source: str,
+        module_baseline: ModuleBaseline,
+    ) -> None:
+        """Appends recorded violations of a module, only when updating."""
+        if not self._update:
+            return
+
+        path = self._get_path(filename)
+        if '\n' in path:  # it would break our line based format
+            return
+
+        record = _TAB.join((
+            make_key((self._namespace, source)),
+            path,
+            ' '.join(sorted(module_baseline.fingerprints)),
+        ))
+        # Single unbuffered write of a line is never mixed with other ones:
+        with open(self._filename, 'ab', buffering=0) as baseline:
+            baseline.write('{0}\n'.format(record).encode(
+                'utf-8', errors='surrogateescape',
+            ))
+
+    def _get_path(self, filename: str) -> str:
+        return os.path.relpath(
+            os.path.realpath(filename), self._directory,
+        ).replace(os.sep, '/')
+
+    def _load(self) -> None:
+        try:
+            with open(
+                self._filename, encoding='utf-8', errors='surrogateescape',
+            ) as baseline:
+                baseline_source = baseline.read()
+        except FileNotFoundError:
+            return
+
+        self.key = make_key((baseline_source,))
+        self._records = {
+            record[record.index(_TAB) + 1:record.rindex(_TAB)]: record
+            for record in baseline_source.split('\n')
+            if record
+        }
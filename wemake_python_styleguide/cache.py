@@ -0,0 +1,180 @@
+"""
+Persistent cache of violations found in modules.
+
+Most files do not change between two runs of the linter.
+So, we store violations of each checked module on the disk
+and return them without parsing options, transforming the tree,
+and running any :term:`visitors <visitor>` on the next run.
+
+Each module has its own cache entry. Entry key is a hash of:
+
+1. The plugin version
+2. Module file name and its source code
+
+Entries store violations of each visitor separately.
+Visitor key is a hash of its name and values of all options it reads.
+So, when some option changes, only visitors that read it are executed again.
+
+Cache entries are small ``json`` files.
+They are written to temporary files first and then atomically renamed,
+so several ``flake8`` processes can safely share the same directory.
+
+Cache has a size limit. When it is exceeded,
+the least recently used entries are removed.
+Entries are marked as used by updating their modification time.
+
+.. _cache-api:
+
+Cache API
+---------
+
+.. autoclass:: ResultsCache
+   :no-undoc-members:
+
+"""
+
+import hashlib
+import json
+import os
+import tempfile
+from contextlib import suppress
+from typing import Dict, Iterable, List, Mapping, Sequence, Tuple
+
+from typing_extensions import Final, final
+
+#: Violations are stored as `(line, column, message)` tuples.
+CachedResult = Tuple[int, int, str]
+
+#: Violations of visitors that were executed for a module, by visitor keys.
+CacheEntry = Dict[str, List[CachedResult]]
+
+#: We check the size of the cache only once in this amount of writes.
+_EVICTION_INTERVAL: Final = 100
+
+#: Size of keys in bytes, collisions are not realistic with this size.
+_KEY_SIZE: Final = 20
+
+_ENTRY_SUFFIX: Final = '.json'
+
+
+def make_key(parts: Sequence[str]) -> str:
+    """
+    Returns the hash of the given strings.
+
+    Lengths of strings are hashed too,
+    so ``('ab', 'c')`` and ``('a', 'bc')`` have different keys.
+    """
+    hasher = hashlib.blake2b(digest_size=_KEY_SIZE)
+    for part in parts:
+        encoded = part.encode('utf-8', errors='surrogatepass')
+        hasher.update(len(encoded).to_bytes(8, 'little'))
+        hasher.update(encoded)
+    return hasher.hexdigest()
+
+
+def _load_violations(violations: Iterable[CachedResult]) -> List[CachedResult]:
+    # `json` stores tuples as lists:
+    return [
+        (line, column, message)
+        for line, column, message in violations
+    ]
+
+
+@final
+class ResultsCache(object):
+    """
+    Stores violations of modules in a directory.
+
+    Cache is never required for the correct work:
+    all file system errors are ignored and treated as cache misses.
+    """
+
+    def __init__(
+        self,
+        directory: str,
+        max_size: int,
+        namespace: Sequence[str],
+    ) -> None:
+        """
+        Creates new cache instance.
+
+        Arguments:
+            directory: where cache entries are stored.
+            max_size: maximum size of all entries in bytes.
+            namespace: strings that change all entries, like the version.
+
+        """
+        self._directory = directory
+        self._max_size = max_size
+        self._namespace = make_key(namespace)
+        self._writes = 0
+
+    def get(self, filename: str, source: str) -> CacheEntry:
+        """Returns cached violations of visitors, empty if nothing is cached."""
+        entry_path = self._get_entry_path(filename, source)
+        try:
+            return self._read_entry(entry_path)
+        except (OSError, ValueError, TypeError, AttributeError):
+            return {}
+
+    def set(  # noqa: WPS125
+        self,
+        filename: str,
+        source: str,
+        visitor_violations: Mapping[str, Sequence[CachedResult]],
+    ) -> None:
+        """Stores violations of visitors, replaces the previous entry."""
+        entry_path = self._get_entry_path(filename, source)
+        with suppress(OSError):
+            self._write_entry(entry_path, visitor_violations)
+            self._writes += 1
+            if self._writes % _EVICTION_INTERVAL == 1:
+                self._evict()
+
+    def _get_entry_path(self, filename: str, source: str) -> str:
+        key = make_key((self._namespace, filename, source))
+        return os.path.join(self._directory, key[:2], key + _ENTRY_SUFFIX)
+
+    def _read_entry(self, entry_path: str) -> CacheEntry:
+        with open(entry_path, encoding='utf-8') as entry:
+            visitor_violations = json.load(entry)
+        os.utime(entry_path)  # marks entry as recently used
+        return {
+            visitor_key: _load_violations(violations)
+            for visitor_key, violations in visitor_violations.items()
+        }
+
+    def _write_entry(
+        self,
+        entry_path: str,
+        visitor_violations: Mapping[str, Sequence[CachedResult]],
+    ) -> None:
+        entry_directory = os.path.dirname(entry_path)
+        os.makedirs(entry_directory, exist_ok=True)
+
+        # Other processes must never see partially written entries:
+        file_descriptor, temp_path = tempfile.mkstemp(dir=entry_directory)
+        try:
+            with os.fdopen(file_descriptor, 'w', encoding='utf-8') as entry:
+                json.dump(visitor_violations, entry)
+        except OSError:
+            with suppress(OSError):
+                os.remove(temp_path)
+            raise
+        os.replace(temp_path, entry_path)
+
+    def _evict(self) -> None:
+        entries = sorted(
+            (entry.stat().st_mtime, entry.stat().st_size, entry.path)
+            for shard in os.scandir(self._directory)
+            if shard.is_dir()
+            for entry in os.scandir(shard.path)
+            if entry.name.endswith(_ENTRY_SUFFIX)
+        )
+        cache_size = sum(entry_size for _, entry_size, _ in entries)
+        for _, entry_size, entry_path in entries:
+            if cache_size <= self._max_size:
+                break
+            with suppress(OSError):  # other process might remove it first
+                os.remove(entry_path)
+            cache_size -= entry_size
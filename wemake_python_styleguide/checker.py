@@ -39,13 +39,17 @@ Checker API
 import ast
 import tokenize
 import traceback
-from typing import ClassVar, Iterator, Sequence, Type
+from typing import ClassVar, Dict, Iterator, List, Optional, Sequence, Set, Type
 
 from flake8.options.manager import OptionManager
 from typing_extensions import final
 
 from wemake_python_styleguide import constants, types
 from wemake_python_styleguide import version as pkg_version
+from wemake_python_styleguide.baseline import Baseline, ModuleBaseline
+from wemake_python_styleguide.cache import CachedResult, ResultsCache, make_key
+from wemake_python_styleguide.diff import ChangedLines, get_changed_lines
+from wemake_python_styleguide.incremental import IncrementalState
 from wemake_python_styleguide.options.config import Configuration
 from wemake_python_styleguide.options.validation import validate_options
 from wemake_python_styleguide.presets.types import file_tokens as tokens_preset
@@ -54,10 +58,25 @@ from wemake_python_styleguide.presets.types import tree as tree_preset
 from wemake_python_styleguide.transformations.ast_tree import transform
 from wemake_python_styleguide.violations import system
 from wemake_python_styleguide.visitors import base
+from wemake_python_styleguide.visitors.fused import FusedWalker
+from wemake_python_styleguide.watchdog import Watchdog
 
 VisitorClass = Type[base.BaseVisitor]
 
 
+def _get_visitor_key(
+    visitor_class: VisitorClass,
+    options: types.ConfigurationOptions,
+) -> str:
+    return make_key((
+        visitor_class.__qualname__,
+        *(
+            '{0}={1!r}'.format(option, getattr(options, option))
+            for option in sorted(visitor_class.used_options)
+        ),
+    ))
+
+
 @final
 class Checker(object):
     """
@@ -77,6 +96,12 @@ class Checker(object):
 
         visitors: :term:`preset` of visitors that are run by this checker.
 
+        incremental_state: state of the previous run for the same module.
+        When it is set, only changed top-level definitions are visited,
+        see :ref:`incremental <incremental>`.
+
+    .. versionchanged:: 0.15.0
+
     """
 
     name: ClassVar[str] = pkg_version.pkg_name
@@ -91,11 +116,16 @@ class Checker(object):
         *tokens_preset.PRESET,
     )
 
+    _baseline: ClassVar[Baseline]
+    _results_cache: ClassVar[Optional[ResultsCache]] = None
+    _changed_lines: ClassVar[Optional[ChangedLines]] = None
+
     def __init__(
         self,
         tree: ast.AST,
         file_tokens: Sequence[tokenize.TokenInfo],
         filename: str = constants.STDIN,
+        lines: Sequence[str] = (),
     ) -> None:
         """
         Creates new checker instance.
@@ -111,11 +141,19 @@ class Checker(object):
             tree: ``ast`` tree parsed by ``flake8``.
             file_tokens: ``tokenize.tokenize`` parsed file tokens.
             filename: module file name, might be empty if piping is used.
+            lines: module source lines, used to show code and to find cache.
+
+        .. versionchanged:: 0.15.0
 
         """
-        self.tree = transform(tree)
+        self.tree = tree
         self.filename = filename
         self.file_tokens = file_tokens
+        self.lines = lines
+        self.incremental_state: Optional[IncrementalState] = None
+        self._failed_visitors: Set[VisitorClass] = set()
+        self._watchdog = Watchdog(self.options)
+        self._module_baseline = ModuleBaseline((), update=False)
 
     @classmethod
     def add_options(cls, parser: OptionManager) -> None:
@@ -133,8 +171,47 @@ class Checker(object):
 
     @classmethod
     def parse_options(cls, options: types.ConfigurationOptions) -> None:
-        """Parses registered options for providing them to each visitor."""
+        """
+        Parses registered options for providing them to each visitor.
+
+        Also creates the results cache, when it is enabled.
+        Violations of each visitor are cached together with
+        values of options that this visitor reads.
+
+        When ``diff_against`` option is set, finds changed lines once,
+        see :ref:`diff <diff-api>`.
+
+        Loads known violations from the :ref:`baseline <baseline>` file.
+        Cached violations depend on it, since known ones are not cached.
+
+        .. versionchanged:: 0.15.0
+
+        """
         cls.options = validate_options(options)
+        cls._baseline = Baseline(
+            cls.options.baseline,
+            namespace=make_key((
+                pkg_version.pkg_version,
+                *(
+                    _get_visitor_key(visitor_class, cls.options)
+                    for visitor_class in cls._visitors
+                ),
+            )),
+            update=cls.options.baseline_update,
+        )
+
+        # All violations must be found again to update the baseline:
+        cls._results_cache = None
+        if cls.options.results_cache_dir and not cls.options.baseline_update:
+            cls._results_cache = ResultsCache(
+                cls.options.results_cache_dir,
+                max_size=cls.options.results_cache_size * 1024 * 1024,
+                namespace=(pkg_version.pkg_version, cls._baseline.key),
+            )
+
+        cls._changed_lines = None
+        if cls.options.diff_against:
+            cls._changed_lines = get_changed_lines(cls.options.diff_against)
 
     def run(self) -> Iterator[types.CheckResult]:
         """
@@ -143,23 +220,142 @@ class Checker(object):
         This method is used by ``flake8`` API.
         It is executed after all configuration is parsed.
 
+        Modules without changes are not checked
+        when ``diff_against`` option is set.
+        Only violations on changed lines are reported then.
+
+        Violations from the baseline file are not reported.
+        Modules that did not change since it was written are not checked.
+
         Yields:
             Violations that were found by the passed visitors.
 
+        .. versionchanged:: 0.15.0
+
         """
-        for visitor_class in self._visitors:
-            visitor = visitor_class.from_checker(self)
+        changed_lines = None
+        if self._changed_lines is not None:
+            changed_lines = self._changed_lines.get(self.filename)
+            if changed_lines is None:
+                return
+
+        violations = self._get_violations(''.join(self.lines))
+        for visitor_violations in violations.values():
+            yield from (
+                (*violation, type(self))
+                for violation in visitor_violations
+                if changed_lines is None or violation[0] in changed_lines
+            )
 
-            try:
-                visitor.run()
-            except Exception:
-                # In case we fail misserably, we want users to see at
-                # least something! Full stack trace
-                # and some rules that still work.
-                print(traceback.format_exc())  # noqa: T001, WPS421
-                visitor.add_violation(system.InternalErrorViolation())
+    def _get_violations(  # noqa: WPS210
+        self,
+        source: str,
+    ) -> Dict[VisitorClass, List[CachedResult]]:
+        module_baseline = self._baseline.get(self.filename, source)
+        if module_baseline is None:
+            return {}
+        self._module_baseline = module_baseline
+
+        cache = self._results_cache if source else None
+        visitor_keys = {
+            visitor_class: _get_visitor_key(visitor_class, self.options)
+            for visitor_class in self._visitors
+        }
+        cached = cache.get(self.filename, source) if cache else {}
+
+        outdated = [
+            visitor_class
+            for visitor_class, visitor_key in visitor_keys.items()
+            if visitor_key not in cached
+        ]
+        violations = {
+            visitor_class: cached.get(visitor_key, [])
+            for visitor_class, visitor_key in visitor_keys.items()
+        }
+        if outdated:
+            violations.update(self._run_checks(outdated))
+
+        # Internal errors and timeouts might be random, so we check again:
+        if cache is not None and outdated:
+            cache.set(self.filename, source, {
+                visitor_keys[visitor_class]: visitor_violations
+                for visitor_class, visitor_violations in violations.items()
+                if visitor_class not in self._failed_visitors
+            })
+        self._baseline.save(self.filename, source, module_baseline)
+        return violations
+
+    def _run_checks(  # noqa: WPS210
+        self,
+        visitor_classes: Sequence[VisitorClass],
+    ) -> Dict[VisitorClass, List[CachedResult]]:
+        """
+        Runs given visitors and returns their violations.
 
-            yield from (
-                (*error.node_items(), type(self))
-                for error in visitor.violations
+        When ``incremental_state`` is set,
+        ``ast`` based visitors are executed by this state.
+        When ``fused_visitors`` option is set,
+        all ``ast`` based visitors are executed together with a single walk.
+
+        Known violations are dropped before formatting their messages.
+        Incremental state is not used together with the baseline,
+        since it stores already formatted violations.
+
+        Visitors are stopped when they are out of time,
+        fused visitors share their budgets,
+        see :ref:`watchdog <watchdog>`.
+
+        .. versionchanged:: 0.15.0
+
+        """
+        self.tree = transform(self.tree, self.lines)
+        visitors = [
+            visitor_class.from_checker(self)
+            for visitor_class in visitor_classes
+        ]
+        node_visitors = [
+            visitor
+            for visitor in visitors
+            if isinstance(visitor, base.BaseNodeVisitor)
+        ]
+
+        definition_violations: Dict[base.BaseVisitor, List[CachedResult]] = {}
+        if self.incremental_state is not None and not self.options.baseline:
+            definition_violations = self.incremental_state.run(
+                self, node_visitors, self._report_error, self._watchdog.watch,
             )
+        elif self.options.fused_visitors:
+            walker = FusedWalker(node_visitors, self._report_error)
+            with self._watchdog.watch(walker.visitors):
+                walker.run(self.tree)
+        else:
+            node_visitors = []
+
+        separate_visitors = [
+            visitor for visitor in visitors if visitor not in node_visitors
+        ]
+        for visitor in separate_visitors:
+            try:
+                self._watchdog.run(visitor)
+            except Exception:
+                self._report_error(visitor)
+        self._failed_visitors.update(self._watchdog.stopped_visitors)
+        return {
+            type(checked): [
+                *definition_violations.get(checked, []),
+                *(
+                    error.node_items()
+                    for error in checked.violations
+                    if not self._module_baseline.is_known(error)
+                ),
+            ]
+            for checked in visitors
+        }
+
+    def _report_error(self, visitor: base.BaseVisitor) -> None:
+        # In case we fail misserably, we want users to see at
+        # least something! Full stack trace
+        # and some rules that still work.
+        print(traceback.format_exc())  # noqa: T001, WPS421
+        self._failed_visitors.add(type(visitor))
+        visitor.add_violation(system.InternalErrorViolation())
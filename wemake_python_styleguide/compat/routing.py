@@ -1,13 +1,29 @@
 import ast
 import types
+from typing import (
+    Callable,
+    Dict,
+    Iterator,
+    List,
+    Mapping,
+    Optional,
+    Tuple,
+    Type,
+)
 
 from typing_extensions import Final
 
 from wemake_python_styleguide.compat.constants import PY38
 from wemake_python_styleguide.compat.nodes import Constant
 
+#: Unbound visitor method that handles a single node.
+VisitMethod = Callable[[ast.NodeVisitor, ast.AST], None]
+
+#: Nodes are routed by their type, constants are also routed by value type.
+RouteKey = Type[object]
+
 #: That's how python types and ast types map to each other, copied from ast.
-_CONST_NODE_TYPE_NAMES: Final = types.MappingProxyType({
+_CONST_NODE_TYPE_NAMES: Final[Mapping[RouteKey, str]] = types.MappingProxyType({
     bool: 'NameConstant',  # should be before int
     type(None): 'NameConstant',
     int: 'Num',
@@ -18,26 +34,99 @@ _CONST_NODE_TYPE_NAMES: Final = types.MappingProxyType({
     type(...): 'Ellipsis',
 })
 
+#: Maps route keys to visitor methods, ``None`` is used for missing methods.
+_DispatchTable = Dict[RouteKey, Optional[VisitMethod]]
+
+#: Dispatch tables for each visitor class, they are filled on first use.
+_dispatch_tables: Dict[Type[ast.NodeVisitor], _DispatchTable] = {}
+
+
+def get_route_key(node: ast.AST) -> RouteKey:
+    """
+    Returns the key we use to route this node to its visitor method.
+
+    It is just a node type for most of the nodes.
+    But, ``Constant`` nodes are routed by the type of their value,
+    because different methods handle them.
+    Python types and ``ast`` types never clash.
+    """
+    if PY38 and isinstance(node, Constant):  # pragma: py-lt-38
+        return type(node.value)
+    return type(node)
+
+
+def get_handler_name(node: ast.AST) -> str:
+    """
+    Returns the name of the visitor method that handles this node.
+
+    On python3.8+ we also need to route ``Constant`` nodes
+    to old methods like ``visit_Num``, ``visit_Str``, etc.
+    We get the name of wrapped type from it in this case.
+    """
+    if PY38 and isinstance(node, Constant):  # pragma: py-lt-38
+        type_name = _CONST_NODE_TYPE_NAMES.get(type(node.value))
+    else:
+        type_name = node.__class__.__name__
+    return 'visit_{0}'.format(type_name)
+
+
+def get_visit_method(
+    visitor_class: Type[ast.NodeVisitor],
+    node: ast.AST,
+) -> Optional[VisitMethod]:
+    """
+    Returns unbound visitor method for a node or ``None`` if there's none.
+
+    We use dispatch table for each visitor class.
+    It is filled lazily, so aliased methods are also found.
+    That's how we avoid string formatting and ``getattr`` for each node.
+    """
+    dispatch_table = _dispatch_tables.get(visitor_class)
+    if dispatch_table is None:
+        dispatch_table = _dispatch_tables.setdefault(visitor_class, {})
+
+    route_key = get_route_key(node)
+    try:
+        return dispatch_table[route_key]
+    except KeyError:
+        visit_method = getattr(visitor_class, get_handler_name(node), None)
+        dispatch_table[route_key] = visit_method
+        return visit_method
+
+
+def _get_route_names() -> Iterator[Tuple[RouteKey, str]]:
+    node_types: List[Type[ast.AST]] = [ast.AST]
+    while node_types:
+        node_type = node_types.pop()
+        node_types.extend(node_type.__subclasses__())
+        yield node_type, node_type.__name__
+    # These keys are only used on python3.8+, but they do not clash:
+    yield from _CONST_NODE_TYPE_NAMES.items()
+
+
+def fill_dispatch_table(visitor_class: Type[ast.NodeVisitor]) -> None:
+    """
+    Fills the dispatch table of a visitor class for all known nodes.
+
+    We do it before worker processes are forked,
+    so workers share these tables instead of filling their own copies.
+    """
+    dispatch_table = _dispatch_tables.setdefault(visitor_class, {})
+    for route_key, type_name in _get_route_names():
+        dispatch_table.setdefault(route_key, getattr(
+            visitor_class, 'visit_{0}'.format(type_name), None,
+        ))
+
+
+def route_visit(self: ast.NodeVisitor, node: ast.AST):
+    """
+    Custom router for all versions of python.
 
-if PY38:  # pragma: py-lt-38
-    def route_visit(self: ast.NodeVisitor, node: ast.AST):
-        """
-        Custom router for python3.8+ release.
-
-        Hacked to make sure that everything we had defined before is working.
-        """
-        if isinstance(node, Constant):
-            # That's the hack itself, we don't get the name of the node.
-            # We get the name of wrapped type from it.
-            type_name = _CONST_NODE_TYPE_NAMES.get(type(node.value))
-        else:
-            type_name = node.__class__.__name__
-
-        return getattr(
-            self,
-            'visit_{0}'.format(type_name),
-            self.generic_visit,
-        )(node)
-
-else:  # pragma: py-gte-38
-    route_visit = ast.NodeVisitor.visit  # noqa: WPS440
+    Hacked to make sure that everything we had defined before is working.
+    Why? Because python3.8 now uses ``visit_Constant`` instead of old
+    methods like ``visit_Num``, ``visit_Str``, ``visit_Bytes``, etc.
+    """
+    visit_method = get_visit_method(type(self), node)
+    if visit_method is None:
+        return self.generic_visit(node)
+    return visit_method(self, node)
@@ -0,0 +1,247 @@
+"""
+Long-running process that keeps our checker warm between runs.
+
+Each ``flake8`` run imports all plugins and all our visitors,
+and parses options again. It takes seconds before any module is checked.
+It is the most of the time, when only a few changed modules are checked,
+like ``pre-commit`` does.
+
+Daemon pays this price once. Then it checks modules for its clients
+over a local Unix socket,
+see :class:`wemake_python_styleguide.linter.linter.Linter`.
+Parsed options, caches, and states of
+:ref:`incremental <incremental>` checks are kept between requests.
+Requests with the same options share them, even when paths are different.
+Only a few recently used options are kept.
+Options are parsed again when any config file is changed.
+
+Usage:
+
+.. code:: bash
+
+    python -m wemake_python_styleguide.daemon start
+    python -m wemake_python_styleguide.daemon check --show-source some.py
+    python -m wemake_python_styleguide.daemon stop
+
+``check`` accepts the same arguments as ``flake8`` and prints the same output.
+It checks modules in its own process when no daemon is running.
+Use ``--socket`` option to run several daemons,
+its default is ``.wps-daemon.sock`` in the current directory.
+
+.. _daemon:
+
+Daemon API
+----------
+
+.. autoclass:: Daemon
+   :no-undoc-members:
+
+.. autofunction:: request
+
+"""
+
+import argparse
+import functools
+import json
+import os
+import socket
+import socketserver
+import subprocess  # noqa: S404
+import sys
+import time
+import traceback
+from typing import Dict, List, Optional, Sequence, Tuple
+
+from typing_extensions import Final, final
+
+from wemake_python_styleguide.linter import arguments
+from wemake_python_styleguide.linter.linter import Linter
+
+#: Formatted output and exit status of a single run.
+LintResult = Tuple[str, int]
+
+#: Client directory and its options without paths.
+_LinterKey = Tuple[str, arguments.CommandOptions]
+
+_DEFAULT_SOCKET: Final = '.wps-daemon.sock'
+
+_START_TIMEOUT: Final = 30
+_START_POLL_INTERVAL: Final = 0.05
+
+_CHECK_COMMAND: Final = 'check'
+
+#: Each linter keeps states of all its modules, so we keep only a few.
+_MAX_LINTERS: Final = 8
+
+
+@final
+class Daemon(object):
+    """Serves lint requests one by one, keeps a linter for each options."""
+
+    def __init__(self, socket_path: str) -> None:
+        """Creates a daemon that listens at the given path."""
+        self.socket_path = socket_path
+        self.is_stopped = False
+        self._linters: Dict[_LinterKey, Linter] = {}
+
+    def serve(self) -> None:
+        """Serves requests until the ``stop`` request."""
+        with socketserver.UnixStreamServer(
+            self.socket_path,
+            functools.partial(_RequestHandler, daemon=self),
+        ) as server:
+            while not self.is_stopped:
+                server.handle_request()
+        os.unlink(self.socket_path)
+
+    def lint(self, cwd: str, argv: Sequence[str]) -> LintResult:
+        """
+        Checks modules of a client, like ``flake8`` does.
+
+        Config files and relative paths are found from the client directory.
+        Requests are served one by one, so changing the directory is fine.
+        """
+        os.chdir(cwd)
+        command_options, paths = arguments.split_paths(argv)
+        key = (cwd, command_options)
+        linter = self._linters.pop(key, None)
+        if linter is None or linter.is_outdated():
+            linter = Linter(argv, incremental=True)
+
+        # Recently used linters go last, the least recently used goes away:
+        self._linters[key] = linter
+        if len(self._linters) > _MAX_LINTERS:
+            self._linters.pop(next(iter(self._linters)))
+        # Linter keeps paths of its first request, so we pass the default:
+        return linter.run(paths or ['.'])
+
+
+@final
+class _RequestHandler(socketserver.StreamRequestHandler):
+    def __init__(self, *args, daemon: Daemon, **kwargs) -> None:
+        self._daemon = daemon
+        super().__init__(*args, **kwargs)
+
+    def handle(self) -> None:  # noqa: WPS110
+        message = json.loads(self.rfile.readline())
+        command = message['command']
+        if command == _CHECK_COMMAND:
+            response = self._lint(message['cwd'], message['argv'])
+        else:
+            self._daemon.is_stopped = command == 'stop'
+            response = {'status': 0}
+        self.wfile.write(_encode(response))
+
+    def _lint(self, cwd: str, argv: List[str]) -> Dict[str, object]:
+        try:
+            output, status = self._daemon.lint(cwd, argv)
+        except BaseException:  # noqa: WPS424
+            # Client reports it again in its own process:
+            return {'error': traceback.format_exc()}
+        return {'output': output, 'status': status}
+
+
+def _encode(message: Dict[str, object]) -> bytes:
+    return '{0}\n'.format(json.dumps(message)).encode('utf-8')
+
+
+def request(
+    socket_path: str,
+    command: str,
+    argv: Sequence[str] = (),
+) -> Optional[LintResult]:
+    """
+    Sends a request to the daemon, ``None`` when it can not be served.
+
+    Requests fail when the daemon is not running,
+    and when it can not check modules, like with invalid options.
+    Unix sockets are not available on some platforms, like Windows.
+    """
+    if getattr(socket, 'AF_UNIX', None) is None:
+        return None
+
+    try:
+        with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as client:
+            client.connect(socket_path)
+            client.sendall(_encode({
+                'command': command,
+                'cwd': os.getcwd(),
+                'argv': list(argv),
+            }))
+            with client.makefile('rb') as response_file:
+                response = json.loads(response_file.readline())
+    except (OSError, ValueError):
+        return None
+
+    if 'error' in response:
+        return None
+    return response.get('output', ''), response['status']
+
+
+def _start(socket_path: str) -> int:
+    if request(socket_path, 'ping') is not None:
+        return 0
+    if os.path.exists(socket_path):  # left by a daemon that was killed
+        os.unlink(socket_path)
+
+    subprocess.Popen(  # noqa: S603
+        [
+            sys.executable,
+            '-m',
+            'wemake_python_styleguide.daemon',
+            'serve',
+            '--socket',
+            socket_path,
+        ],
+        stdin=subprocess.DEVNULL,
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.DEVNULL,
+        start_new_session=True,
+    )
+    deadline = time.monotonic() + _START_TIMEOUT
+    while time.monotonic() < deadline:
+        if request(socket_path, 'ping') is not None:
+            return 0
+        time.sleep(_START_POLL_INTERVAL)
+    return 1
+
+
+def _check(socket_path: str, argv: Sequence[str]) -> int:
+    lint_result = None
+    if '-' not in argv:  # daemon can not read our `stdin`
+        lint_result = request(socket_path, _CHECK_COMMAND, argv)
+    if lint_result is None:
+        lint_result = Linter(argv).run()
+
+    output, status = lint_result
+    sys.stdout.write(output)
+    return status
+
+
+def main(argv: Optional[Sequence[str]] = None) -> int:
+    """Runs daemon commands, returns the exit status."""
+    parser = argparse.ArgumentParser(
+        prog='python -m wemake_python_styleguide.daemon',
+        allow_abbrev=False,
+    )
+    parser.add_argument(
+        'command',
+        choices=('start', 'serve', _CHECK_COMMAND, 'stop'),
+    )
+    parser.add_argument('--socket', default=_DEFAULT_SOCKET)
+    daemon_arguments, flake8_argv = parser.parse_known_args(argv)
+    socket_path = os.path.abspath(daemon_arguments.socket)
+
+    if daemon_arguments.command == 'start':
+        return _start(socket_path)
+    elif daemon_arguments.command == 'serve':
+        Daemon(socket_path).serve()
+    elif daemon_arguments.command == _CHECK_COMMAND:
+        return _check(socket_path, flake8_argv)
+    else:
+        request(socket_path, 'stop')
+    return 0
+
+
+if __name__ == '__main__':  # pragma: no cover
+    sys.exit(main())
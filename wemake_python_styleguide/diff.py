@@ -0,0 +1,190 @@
+"""
+Lines of modules that were changed since some ``git`` revision.
+
+Large repositories are usually checked to review small changes.
+When ``--diff-against`` option is set,
+we ask ``git diff`` for all changed lines once per ``flake8`` run.
+
+Modules without changes are not checked at all.
+Only violations on changed lines are reported for changed modules.
+Violations of the whole module, like too many imports or a wrong module name,
+do not have lines. They are reported whenever the module has changed.
+
+Untracked files are treated as completely changed.
+Removed lines are not reported, since there is nothing to report there.
+
+.. _diff-api:
+
+Diff API
+--------
+
+.. autofunction:: get_changed_lines
+
+.. autoclass:: ChangedLines
+   :no-undoc-members:
+
+.. autoclass:: LineRanges
+   :no-undoc-members:
+
+"""
+
+import bisect
+import os
+import re
+import subprocess  # noqa: S404
+import sys
+from typing import Dict, Iterable, List, Mapping, Optional, Sequence, Tuple
+
+from typing_extensions import Final, final
+
+#: First and last changed lines, both are included.
+LineRange = Tuple[int, int]
+
+#: Only the new side of a hunk is interesting for us.
+_HUNK_HEADER: Final = re.compile(r'^@@ -\d+(?:,\d+)? \+(\d+)(?:,(\d+))? @@')
+
+_FILE_HEADER: Final = 'diff --git '
+_NEW_FILE_PREFIX: Final = '+++ b/'
+
+#: Untracked files are changed up to this line.
+_LAST_LINE: Final = sys.maxsize
+
+
+@final
+class LineRanges(object):
+    """Sorted ranges of changed lines in a single module."""
+
+    def __init__(self, line_ranges: Iterable[LineRange]) -> None:
+        """Sorts given ranges to find lines with the binary search."""
+        self._line_ranges = sorted(line_ranges)
+
+    def __contains__(self, line_number: int) -> bool:
+        """Tells whether the line was changed, zero means the whole module."""
+        if not line_number:
+            return True
+        index = bisect.bisect_right(
+            self._line_ranges, (line_number, _LAST_LINE),
+        )
+        if not index:
+            return False
+        _, last_line = self._line_ranges[index - 1]
+        return last_line >= line_number
+
+
+@final
+class ChangedLines(object):
+    """Changed lines of all changed modules."""
+
+    def __init__(self, changes: Mapping[str, Sequence[LineRange]]) -> None:
+        """Accepts changed lines by absolute file names."""
+        self._changes = {
+            os.path.realpath(filename): LineRanges(line_ranges)
+            for filename, line_ranges in changes.items()
+        }
+
+    def get(self, filename: str) -> Optional[LineRanges]:
+        """Returns changed lines of a module, ``None`` for unchanged ones."""
+        return self._changes.get(os.path.realpath(filename))
+
+
+@final
+class _DiffParser(object):
+    """Reads ``git diff`` output line by line."""
+
+    def __init__(self) -> None:
+        self.changes: Dict[str, List[LineRange]] = {}
+        self._filename: Optional[str] = None
+        self._in_file_header = False
+
+    def parse_line(self, line: str) -> None:
+        if line.startswith(_FILE_HEADER):
+            self._filename = None
+            self._in_file_header = True
+        elif self._in_file_header and line.startswith(_NEW_FILE_PREFIX):
+            self._filename = line[len(_NEW_FILE_PREFIX):]
+            self.changes[self._filename] = []
+        elif self._filename is not None and line.startswith('@@ '):
+            # Hunk contents never start with `@`, only hunk headers do:
+            self._in_file_header = False
+            self._parse_hunk_header(self._filename, line)
+
+    def _parse_hunk_header(self, filename: str, line: str) -> None:
+        hunk = _HUNK_HEADER.match(line)
+        if hunk is None:
+            return
+
+        first_line = int(hunk.group(1))
+        line_count = int(hunk.group(2) or 1)
+        if line_count:
+            self.changes[filename].append(
+                (first_line, first_line + line_count - 1),
+            )
+
+
+def parse_diff(diff_output: str) -> Dict[str, List[LineRange]]:
+    """
+    Returns changed lines of each file from ``git diff`` output.
+
+    Output must not contain any context lines.
+
+    >>> parse_diff('''diff --git a/some.py b/some.py
+    ... --- a/some.py
+    ... +++ b/some.py
+    ... @@ -1,0 +2,3 @@
+    ... +++ b/not_a_file_name
+    ... +second
+    ... +third
+    ... @@ -8 +10,0 @@
+    ... -removed
+    ... ''')
+    {'some.py': [(2, 4)]}
+
+    """
+    parser = _DiffParser()
+    for line in diff_output.splitlines():
+        parser.parse_line(line)
+    return parser.changes
+
+
+def _git(*args: str) -> str:
+    return subprocess.run(  # noqa: S603, S607
+        ['git', '-c', 'core.quotePath=false', *args],
+        check=True,
+        stdout=subprocess.PIPE,
+        universal_newlines=True,
+        encoding='utf-8',
+        errors='surrogateescape',
+    ).stdout
+
+
+def get_changed_lines(revision: str) -> ChangedLines:
+    """
+    Finds lines that were changed since the given revision.
+
+    Committed, staged, and unstaged changes are included.
+    Raises ``subprocess.CalledProcessError`` when ``git`` fails.
+    """
+    toplevel = _git('rev-parse', '--show-toplevel').strip()
+    changes = parse_diff(_git(
+        '-C',
+        toplevel,
+        'diff',
+        '--no-color',
+        '--no-ext-diff',
+        '--unified=0',
+        # Prefixes can be changed or removed by `git` configs of users:
+        '--src-prefix=a/',
+        '--dst-prefix=b/',
+        revision,
+        '--',
+    ))
+    changes.update(
+        (untracked, [(1, _LAST_LINE)])
+        for untracked in _git(
+            '-C', toplevel, 'ls-files', '--others', '--exclude-standard',
+        ).splitlines()
+    )
+    return ChangedLines({
+        os.path.join(toplevel, filename): line_ranges
+        for filename, line_ranges in changes.items()
+    })
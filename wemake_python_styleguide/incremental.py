@@ -0,0 +1,237 @@
+"""
+Incremental checks of modules that are changed over and over again.
+
+Editors check the same module on each save,
+but usually only a single function or class is changed.
+So, we check modules in parts: each top-level function or class
+is a separate part, all other statements are checked together.
+
+:class:`IncrementalState` keeps violations and statistics
+of all top-level definitions from the previous run.
+Definitions are found by the hash of their source lines,
+including decorators and comments after the definition.
+When a definition has not changed, its violations are reused
+and shifted by the number of lines added or removed above it.
+Only changed definitions and other statements are visited again.
+
+Visitors report violations of the whole module
+from merged statistics of all parts,
+see :class:`wemake_python_styleguide.visitors.base.BaseNodeVisitor`.
+Visitors that can not check modules in parts are executed on the whole module.
+Filename and ``tokenize`` based visitors are not affected.
+
+.. _incremental:
+
+Incremental API
+---------------
+
+.. autoclass:: IncrementalState
+   :no-undoc-members:
+
+"""
+
+import ast
+from typing import (
+    Callable,
+    ContextManager,
+    Dict,
+    List,
+    Optional,
+    Sequence,
+    Tuple,
+    Type,
+)
+
+import attr
+from typing_extensions import Final, final
+
+from wemake_python_styleguide.cache import CachedResult, make_key
+from wemake_python_styleguide.compat.aliases import FunctionNodes
+from wemake_python_styleguide.types import ConfigurationOptions
+from wemake_python_styleguide.visitors.base import (
+    BaseNodeVisitor,
+    BaseVisitor,
+    ModuleStatistics,
+)
+
+#: Violations and statistics of a definition, lines are relative to its start.
+_PartResults = Tuple[List[CachedResult], ModuleStatistics]
+
+#: Results of all visitors for each definition source.
+_DefinitionResults = Dict[str, Dict[Type[BaseNodeVisitor], _PartResults]]
+
+#: Runs the block within the time budget of given visitors.
+_Watch = Callable[[Sequence[BaseVisitor]], ContextManager[None]]
+
+_DEFINITIONS: Final = (*FunctionNodes, ast.ClassDef)
+
+
+@final
+@attr.dataclass(slots=True, frozen=True)
+class _Definition(object):
+    """Top-level function or class."""
+
+    node: ast.stmt
+    first_line: int
+    source_key: str
+
+
+def _get_first_line(node: ast.stmt) -> int:
+    decorators: List[ast.expr] = getattr(node, 'decorator_list', [])
+    return min([node.lineno, *(decorator.lineno for decorator in decorators)])
+
+
+def _split_module(
+    tree: ast.Module,
+    lines: Sequence[str],
+) -> Tuple[ast.Module, List[_Definition]]:
+    """Returns all statements except definitions, and all definitions."""
+    first_lines = [_get_first_line(node) for node in tree.body]
+    return ast.Module(
+        body=[
+            node for node in tree.body if not isinstance(node, _DEFINITIONS)
+        ],
+        type_ignores=[],
+    ), [
+        _Definition(node, first_line, make_key(
+            lines[first_line - 1:next_line - 1],
+        ))
+        for node, first_line, next_line in zip(
+            tree.body, first_lines, [*first_lines[1:], len(lines) + 1],
+        )
+        if isinstance(node, _DEFINITIONS)
+    ]
+
+
+def _shift_lines(
+    violations: List[CachedResult],
+    line_offset: int,
+) -> List[CachedResult]:
+    return [
+        (line + line_offset, column, message)
+        for line, column, message in violations
+    ]
+
+
+def _check_definition(
+    visitor: BaseNodeVisitor,
+    definition: _Definition,
+) -> _PartResults:
+    definition_visitor = type(visitor)(
+        options=visitor.options,
+        filename=visitor.filename,
+        tree=visitor.tree,
+    )
+    definition_visitor.visit(definition.node)
+    statistics = definition_visitor.finish_part()
+    return _shift_lines(
+        [error.node_items() for error in definition_visitor.violations],
+        -definition.first_line,
+    ), statistics
+
+
+@final
+class IncrementalState(object):
+    """
+    Results of the previous run for the same module.
+
+    State is reset when the file name or options are changed.
+    Results of visitors that have failed are never reused.
+    """
+
+    def __init__(self) -> None:
+        """Creates an empty state, the first run checks everything."""
+        self._context: Optional[Tuple[str, ConfigurationOptions]] = None
+        self._definitions: _DefinitionResults = {}
+
+    def run(  # noqa: WPS210
+        self,
+        checker,
+        visitors: Sequence[BaseNodeVisitor],
+        on_error: Callable[[BaseVisitor], None],
+        watch: _Watch,
+    ) -> Dict[BaseVisitor, List[CachedResult]]:
+        """
+        Runs ``ast`` based visitors and updates the state.
+
+        Violations of other statements and of the whole module
+        are added to visitors as usual.
+        Violations of top-level definitions are returned for each visitor.
+
+        Arguments:
+            checker: checker instance with the transformed tree.
+            visitors: visitors to run.
+            on_error: called with the visitor that has failed.
+            watch: stops each visitor when it is out of time.
+
+        Returns:
+            Violations of top-level definitions.
+
+        """
+        context = (checker.filename, checker.options)
+        if context != self._context:
+            self._context = context
+            self._definitions = {}
+
+        statements, definitions = _split_module(checker.tree, checker.lines)
+        previous = self._definitions
+        self._definitions = {
+            definition.source_key: {} for definition in definitions
+        }
+
+        definition_violations: Dict[BaseVisitor, List[CachedResult]] = {}
+        for visitor in visitors:
+            definition_results: List[_PartResults] = []
+            try:
+                with watch([visitor]):
+                    definition_results = self._check_parts(
+                        visitor, statements, definitions, previous,
+                    )
+            except Exception:
+                on_error(visitor)
+            definition_violations[visitor] = self._store_results(
+                type(visitor), definitions, definition_results,
+            )
+        return definition_violations
+
+    def _check_parts(
+        self,
+        visitor: BaseNodeVisitor,
+        statements: ast.Module,
+        definitions: List[_Definition],
+        previous: _DefinitionResults,
+    ) -> List[_PartResults]:
+        if visitor.module_scoped:
+            visitor.run()
+            return []
+
+        visitor.visit(statements)
+        statistics = visitor.finish_part()
+        definition_results = []
+        for definition in definitions:
+            part_results = previous.get(definition.source_key, {}).get(
+                type(visitor),
+            )
+            if part_results is None:
+                part_results = _check_definition(visitor, definition)
+            statistics.update(part_results[1])
+            definition_results.append(part_results)
+
+        visitor.check_module(statistics)
+        return definition_results
+
+    def _store_results(
+        self,
+        visitor_class: Type[BaseNodeVisitor],
+        definitions: List[_Definition],
+        definition_results: List[_PartResults],
+    ) -> List[CachedResult]:
+        violations = []
+        for definition, part_results in zip(definitions, definition_results):
+            self._definitions[definition.source_key][visitor_class] = (
+                part_results
+            )
+            violations.extend(
+                _shift_lines(part_results[0], definition.first_line),
+            )
+        return violations
@@ -0,0 +1,120 @@
+import argparse
+import os
+from functools import lru_cache
+from typing import List, Optional, Sequence, Tuple
+
+from flake8 import __version__ as flake8_version
+from flake8.main import options as flake8_options
+from flake8.options import aggregator, config, manager
+from typing_extensions import Final
+
+from wemake_python_styleguide.checker import Checker
+
+#: Command line options without paths, they can be compared and hashed.
+CommandOptions = Tuple[Tuple[str, str], ...]
+
+#: ``flake8`` selects codes of plugins by their entry point names.
+_CODE_PREFIX: Final = 'WPS'
+
+
+def _parse_preliminary_options(
+    argv: Sequence[str],
+) -> Tuple[argparse.ArgumentParser, List[str], config.ConfigFileFinder]:
+    preliminary_parser = argparse.ArgumentParser(add_help=False)
+    flake8_options.register_preliminary_options(preliminary_parser)
+    preliminary_options, rest = preliminary_parser.parse_known_args(argv)
+    if preliminary_options.output_file:
+        rest.extend(('--output-file', preliminary_options.output_file))
+
+    return preliminary_parser, rest, config.ConfigFileFinder(
+        'flake8',
+        preliminary_options.append_config,
+        config_file=preliminary_options.config,
+        ignore_config_files=preliminary_options.isolated,
+    )
+
+
+def _make_option_manager(
+    preliminary_parser: argparse.ArgumentParser,
+) -> manager.OptionManager:
+    option_manager = manager.OptionManager(
+        prog='flake8',
+        version=flake8_version,
+        parents=[preliminary_parser],
+    )
+    flake8_options.register_default_options(option_manager)
+    Checker.add_options(option_manager)
+    option_manager.extend_default_select([_CODE_PREFIX])
+    return option_manager
+
+
+@lru_cache()
+def _get_command_parser() -> argparse.ArgumentParser:
+    preliminary_parser = argparse.ArgumentParser(add_help=False)
+    flake8_options.register_preliminary_options(preliminary_parser)
+    return _make_option_manager(preliminary_parser).parser
+
+
+def _get_config_files(config_finder: config.ConfigFileFinder) -> List[str]:
+    if config_finder.config_file:
+        return [config_finder.config_file]
+    if config_finder.ignore_config_files:
+        return []
+    return [
+        config_finder.user_config_file,
+        *config_finder.local_config_files(),
+        # New files in the current directory change options as well:
+        *(
+            os.path.abspath(project_filename)
+            for project_filename in config_finder.project_filenames
+        ),
+    ]
+
+
+def parse_arguments(
+    argv: Sequence[str],
+) -> Tuple[argparse.Namespace, List[str], List[str]]:
+    """
+    Parses command line arguments and config files, like ``flake8`` does.
+
+    Only our options and options of ``flake8`` itself are registered.
+
+    Arguments:
+        argv: ``flake8`` command line arguments, including paths.
+
+    Returns:
+        Parsed options, paths to check, and all config files
+        that change options when they are created or changed.
+
+    """
+    preliminary_parser, rest, config_finder = _parse_preliminary_options(argv)
+    options, paths = aggregator.aggregate_options(
+        _make_option_manager(preliminary_parser), config_finder, rest,
+    )
+    return options, paths, _get_config_files(config_finder)
+
+
+def split_paths(argv: Sequence[str]) -> Tuple[CommandOptions, List[str]]:
+    """
+    Splits command line arguments into options and paths to check.
+
+    Config files are not read, so it is cheap to do on each run.
+    Runs with different paths, but with the same options,
+    can share parsed options and states of modules.
+    """
+    parsed_arguments = vars(  # noqa: WPS421
+        _get_command_parser().parse_args(argv),
+    )
+    paths: List[str] = parsed_arguments.pop('filenames')
+    return tuple(sorted(
+        (option_name, str(option_value))
+        for option_name, option_value in parsed_arguments.items()
+    )), paths
+
+
+def get_mtime(filename: str) -> Optional[float]:
+    """Returns the modification time of a file, ``None`` when it is missing."""
+    try:
+        return os.stat(filename).st_mtime
+    except OSError:
+        return None
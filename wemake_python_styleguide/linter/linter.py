@@ -0,0 +1,164 @@
+"""
+Linting of modules with our checker, but without ``flake8`` plugins.
+
+``flake8`` finds and loads all installed plugins on each run,
+and then passes every module through all of them.
+When only our violations are needed,
+this module runs :class:`wemake_python_styleguide.checker.Checker` directly.
+
+Options are parsed just like ``flake8`` does:
+command line arguments are merged with ``[flake8]`` sections
+of ``setup.cfg``, ``tox.ini``, and ``.flake8`` configuration files.
+Then violations are selected, ignored, and formatted by ``flake8`` itself,
+including ``noqa`` comments and ``per-file-ignores``.
+So, the output is the same as ``flake8 --select=WPS``
+with the same options.
+
+Only our options and options of ``flake8`` itself are known here.
+Options of other plugins in configuration files are ignored.
+
+Usage:
+
+.. code:: bash
+
+    python -m wemake_python_styleguide --show-source some/package
+
+Modules are checked by a pool of processes,
+its size is the number of cores or the value of ``--jobs`` option.
+Workers check modules and send back only what is needed for the output.
+They are forked when lazy state of the checker is already built,
+so they share memory with the parent process.
+Parent process reads next modules in background threads,
+while workers check previous ones.
+A single process checks modules as soon as they are found,
+while the next ones are read in background threads.
+
+.. _linter:
+
+Linter API
+----------
+
+.. autoclass:: Linter
+   :no-undoc-members:
+
+"""
+
+import argparse
+from typing import Dict, Iterable, Iterator, List, Optional, Sequence, Tuple
+
+from typing_extensions import final
+
+from wemake_python_styleguide.checker import Checker
+from wemake_python_styleguide.incremental import IncrementalState
+from wemake_python_styleguide.linter import (
+    arguments,
+    modules,
+    parallel,
+    prefetch,
+    report,
+)
+
+
+@final
+class Linter(object):
+    """
+    Checks modules with options from the command line and config files.
+
+    Options are parsed once, so a linter can be reused for many runs.
+    But config files might change between runs,
+    create a new linter when :meth:`is_outdated` tells so.
+    """
+
+    def __init__(
+        self,
+        argv: Sequence[str] = (),
+        *,
+        incremental: bool = False,
+    ) -> None:
+        """
+        Parses options like ``flake8`` does.
+
+        Arguments:
+            argv: ``flake8`` command line arguments, including paths.
+            incremental: whether to keep states of checked modules.
+
+        """
+        options, paths, config_files = arguments.parse_arguments(argv)
+        self.options: argparse.Namespace = options
+        self.paths: List[str] = paths
+        self._config_files = {
+            config_file: arguments.get_mtime(config_file)
+            for config_file in config_files
+        }
+        self._incremental = incremental
+        self._incremental_states: Dict[str, IncrementalState] = {}
+
+    def is_outdated(self) -> bool:
+        """Tells whether any config file was changed after options parsing."""
+        return any(
+            arguments.get_mtime(config_file) != mtime
+            for config_file, mtime in self._config_files.items()
+        )
+
+    def find_modules(self, paths: Sequence[str] = ()) -> Iterator[str]:
+        """Finds modules lazily, in paths from the command line by default."""
+        return modules.find_modules(self.options, paths or self.paths)
+
+    def prepare(self) -> None:
+        """Passes options to the checker, once before each run."""
+        Checker.parse_options(self.options)
+
+    def check_module(
+        self,
+        filename: str,
+        lines: Optional[List[str]] = None,
+        *,
+        read_module: prefetch.ReadModule = None,
+    ) -> List[modules.ModuleResult]:
+        """
+        Checks a single module, reads it when lines are not passed.
+
+        Modules that are read ahead are passed as they are,
+        see :func:`wemake_python_styleguide.linter.prefetch.read_modules`.
+
+        Call :meth:`prepare` once before checking modules.
+        States of :ref:`incremental <incremental>` checks
+        are kept for each module, when they are enabled.
+        """
+        incremental_state = None
+        if self._incremental:
+            incremental_state = self._incremental_states.setdefault(
+                filename, IncrementalState(),
+            )
+        return modules.check_module(
+            self.options, filename, lines, incremental_state, read_module,
+        )
+
+    def run(self, paths: Sequence[str] = ()) -> Tuple[str, int]:
+        """
+        Checks all modules, returns formatted output and exit status.
+
+        Modules are checked in parallel, like ``--jobs`` option tells.
+        :ref:`Incremental <incremental>` checks are always serial,
+        since states of modules are kept in this process.
+        Serial checks start with the first found module,
+        next modules are read in background threads meanwhile.
+        """
+        self.prepare()
+        filenames = self.find_modules(paths)
+        jobs = parallel.get_jobs(self.options, paths or self.paths)
+        if self._incremental or jobs == 1:
+            checked_modules: Iterable[report.CheckedModule] = (
+                (
+                    modules.get_display_name(self.options, filename),
+                    self.check_module(filename, read_module=read_module),
+                )
+                for filename, read_module in prefetch.read_modules(
+                    self.options, filenames,
+                )
+            )
+        else:
+            checked_modules = parallel.check_modules(
+                self.options, filenames, jobs,
+            )
+        return report.report(self.options, checked_modules)
@@ -0,0 +1,165 @@
+import argparse
+import logging
+import tokenize
+from typing import Dict, Iterator, List, Optional, Sequence, Tuple
+
+from flake8 import checker, processor, utils
+from typing_extensions import Final, final
+
+from wemake_python_styleguide import types
+from wemake_python_styleguide.checker import Checker
+from wemake_python_styleguide.incremental import IncrementalState
+
+#: Error code, line, column, text, and physical line, like ``flake8`` has.
+ModuleResult = Tuple[str, int, int, str, Optional[str]]
+
+_Plugins = Dict[str, List[object]]
+
+_LOG: Final = logging.getLogger(__name__)
+
+#: ``flake8`` reports modules that can not be parsed without any plugins.
+_NO_CHECKS: Final[_Plugins] = {  # noqa: WPS407
+    'ast_plugins': [],
+    'logical_line_plugins': [],
+    'physical_line_plugins': [],
+}
+
+_PARSE_ERRORS: Final = (
+    ValueError,
+    SyntaxError,
+    TypeError,
+    tokenize.TokenError,
+)
+
+
+def get_display_name(options: argparse.Namespace, filename: str) -> str:
+    """Returns the name of a module that is used in the output."""
+    if filename == '-':
+        return options.stdin_display_name
+    return filename
+
+
+def _is_excluded(options: argparse.Namespace, path: str) -> bool:
+    if path == '-' and options.stdin_display_name == 'stdin':
+        return False
+    return utils.matches_filename(
+        get_display_name(options, path),
+        patterns=(
+            *options.exclude,
+            *getattr(options, 'extend_exclude', []),
+        ),
+        log_message='"%(path)s" has %(whether)sbeen excluded',  # noqa: WPS323
+        logger=_LOG,
+    )
+
+
+def find_modules(
+    options: argparse.Namespace,
+    paths: Sequence[str],
+) -> Iterator[str]:
+    """Finds modules to check lazily, like ``flake8`` does."""
+    return (
+        filename
+        for argument in paths or ['.']
+        for filename in utils.filenames_from(
+            argument, lambda path: _is_excluded(options, path),
+        )
+        if argument == filename or utils.fnmatch(filename, options.filename)
+    )
+
+
+@final
+class _BrokenModuleChecker(checker.FileChecker):
+    """``flake8`` has its own rules to report broken modules."""
+
+    def __init__(
+        self,
+        options: argparse.Namespace,
+        filename: str,
+        lines: Optional[List[str]],
+    ) -> None:
+        self._lines = lines
+        super().__init__(filename, _NO_CHECKS, options)
+
+    def check(self) -> List[ModuleResult]:
+        """Reports broken and missing modules without any plugins."""
+        if self.processor is not None:
+            self.run_checks()
+        return self.results
+
+    def _make_processor(self) -> Optional[processor.FileProcessor]:
+        if self._lines is None:
+            return super()._make_processor()
+        # Unsaved modules of editors can be broken, unlike the saved ones:
+        return processor.FileProcessor(
+            self.filename, self.options, lines=self._lines,
+        )
+
+
+def read_module(
+    options: argparse.Namespace,
+    filename: str,
+    lines: Optional[List[str]] = None,
+) -> Optional[processor.FileProcessor]:
+    """Reads a module, returns ``None`` when it can not be read."""
+    try:
+        return processor.FileProcessor(filename, options, lines=lines)
+    except OSError:
+        return None
+
+
+def _to_module_result(
+    violation: types.CheckResult,
+    file_processor: processor.FileProcessor,
+) -> ModuleResult:
+    line_number, column, message, _ = violation
+    error_code, text = message.split(' ', 1)
+    return (
+        error_code,
+        line_number,
+        column,
+        text,
+        file_processor.noqa_line_for(line_number),
+    )
+
+
+def check_module(
+    options: argparse.Namespace,
+    filename: str,
+    lines: Optional[List[str]] = None,
+    incremental_state: Optional[IncrementalState] = None,
+    file_processor: Optional[processor.FileProcessor] = None,
+) -> List[ModuleResult]:
+    """
+    Checks a single module, reads it when lines are not passed.
+
+    Modules that are already read can be passed with their file processors.
+    Options must be passed to the checker before.
+    Results are sorted by their locations, like ``flake8`` sorts them.
+    """
+    if file_processor is None:
+        file_processor = read_module(options, filename, lines)
+    if file_processor is None:
+        return _BrokenModuleChecker(options, filename, lines).check()
+    if file_processor.should_ignore_file():
+        return []
+
+    try:
+        tree = file_processor.build_ast()
+    except _PARSE_ERRORS:
+        return _BrokenModuleChecker(options, filename, lines).check()
+
+    module_checker = Checker(
+        tree=tree,
+        file_tokens=file_processor.file_tokens,
+        filename=file_processor.filename,
+        lines=file_processor.lines,
+    )
+    module_checker.incremental_state = incremental_state
+    return [
+        _to_module_result(violation, file_processor)
+        for violation in sorted(
+            module_checker.run(),
+            key=lambda violation: (violation[0], violation[1]),
+        )
+    ]
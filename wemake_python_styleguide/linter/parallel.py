@@ -0,0 +1,180 @@
+import argparse
+import functools
+import math
+import multiprocessing
+import operator
+import os
+from typing import Dict, Iterable, Iterator, List, Sequence, Tuple
+
+from flake8 import defaults
+from typing_extensions import Final
+
+from wemake_python_styleguide.linter import prefetch, prefork
+from wemake_python_styleguide.linter.modules import (
+    ModuleResult,
+    check_module,
+    get_display_name,
+)
+from wemake_python_styleguide.linter.report import CheckedModule
+
+#: Modules checked by a worker, with their positions.
+_CheckedBatch = List[Tuple[int, CheckedModule]]
+
+#: Each worker gets a few batches, so slow modules are balanced between them.
+_BATCHES_PER_JOB: Final = 4
+
+#: Bytes of modules in a batch, lines of batches are kept in memory.
+_MAX_BATCH_COST: Final = 1024 * 1024
+
+#: Modules in a batch, so small modules are still sent to all workers.
+_MAX_BATCH_MODULES: Final = 64
+
+
+def get_jobs(options: argparse.Namespace, paths: Sequence[str]) -> int:
+    """
+    Returns the number of processes to check modules, like ``flake8`` does.
+
+    Options of the checker are inherited by forked workers,
+    other start methods of processes are not supported.
+    Modules are not found yet, so a single module
+    is checked without workers later.
+    """
+    is_parallel = (
+        '-' not in paths and
+        multiprocessing.get_start_method() == 'fork'
+    )
+    if not is_parallel:
+        return 1
+    if not options.jobs.is_auto:
+        return max(options.jobs.n_jobs, 1)
+    try:
+        return multiprocessing.cpu_count()
+    except NotImplementedError:
+        return 1
+
+
+def _get_costs(
+    filenames: Sequence[str],
+) -> List[Tuple[int, prefetch.IndexedModule]]:
+    module_costs = []
+    for indexed_module in enumerate(filenames):
+        try:
+            module_cost = os.stat(indexed_module[1]).st_size
+        except OSError:  # missing modules are reported right away
+            module_cost = 0
+        module_costs.append((module_cost, indexed_module))
+    return sorted(module_costs, key=operator.itemgetter(0), reverse=True)
+
+
+def _schedule(
+    filenames: Sequence[str],
+    jobs: int,
+) -> List[List[prefetch.IndexedModule]]:
+    """
+    Groups modules into batches, the most expensive modules go first.
+
+    Otherwise, a huge module that is sent last keeps a single worker busy,
+    while all other workers wait for it. Cost of a module is its size.
+    Small modules are batched together, not to pay for each of them.
+    Batches are read ahead of workers, so their sizes are limited,
+    only a module that is larger than the limit is sent alone.
+    """
+    module_costs = _get_costs(filenames)
+    batch_cost = min(
+        sum(map(operator.itemgetter(0), module_costs)) / (
+            jobs * _BATCHES_PER_JOB
+        ),
+        _MAX_BATCH_COST,
+    )
+    batches: List[List[prefetch.IndexedModule]] = []
+    current_cost = math.inf
+    for module_cost in module_costs:
+        current_cost += module_cost[0]
+        if current_cost > batch_cost or len(batches[-1]) >= _MAX_BATCH_MODULES:
+            batches.append([])
+            current_cost = module_cost[0]
+        batches[-1].append(module_cost[1])
+    return batches
+
+
+def _compact(
+    options: argparse.Namespace,
+    module_results: List[ModuleResult],
+) -> List[ModuleResult]:
+    if options.show_source:
+        return module_results
+    # Physical lines are sent between processes only for `noqa` comments,
+    # we find them with the same regular expression as `flake8` does:
+    return [
+        module_result
+        if not options.disable_noqa and defaults.NOQA_INLINE_REGEXP.search(
+            module_result[-1] or '',
+        )
+        else module_result[:-1] + ('',)
+        for module_result in module_results
+    ]
+
+
+def _check_batch(
+    options: argparse.Namespace,
+    batch: List[prefetch.ReadLines],
+) -> _CheckedBatch:
+    return [
+        (index, (
+            get_display_name(options, filename),
+            _compact(options, check_module(options, filename, lines)),
+        ))
+        for index, filename, lines in batch
+    ]
+
+
+def _in_order(
+    checked_batches: Iterable[_CheckedBatch],
+) -> Iterator[CheckedModule]:
+    checked_modules: Dict[int, CheckedModule] = {}
+    next_index = 0
+    for checked_batch in checked_batches:
+        checked_modules.update(checked_batch)
+        while next_index in checked_modules:
+            yield checked_modules.pop(next_index)
+            next_index += 1
+
+
+def check_modules(
+    options: argparse.Namespace,
+    filenames: Iterable[str],
+    jobs: int,
+) -> Iterator[CheckedModule]:
+    """
+    Checks modules in worker processes, yields results in the same order.
+
+    All modules are found first, since we schedule them by their sizes.
+    A single module is checked right here, without workers.
+    Otherwise, the parent reads lines of next batches in background threads,
+    while workers check previous batches.
+    Workers are forked from the warmed up parent with frozen objects,
+    so they share its memory and are ready to check modules right away.
+    Modules are sent to workers in batches, the most expensive ones first.
+    Results are sent back as tuples,
+    without physical lines that are not needed for the output.
+    """
+    all_filenames = list(filenames)
+    if len(all_filenames) < 2:
+        yield from _in_order([_check_batch(options, [
+            (index, filename, None)
+            for index, filename in enumerate(all_filenames)
+        ])])
+        return
+
+    prefork.warm_up()
+    with prefork.frozen_objects():
+        pool = multiprocessing.Pool(jobs)
+
+    with pool:
+        yield from _in_order(pool.imap_unordered(
+            functools.partial(_check_batch, options),
+            prefetch.read_batches(options, _schedule(all_filenames, jobs)),
+        ))
+        # Workers finish their exit handlers, unlike terminated ones:
+        pool.close()
+        pool.join()
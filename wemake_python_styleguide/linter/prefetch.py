@@ -0,0 +1,117 @@
+import argparse
+import collections
+import contextlib
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import (
+    Callable,
+    Deque,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Tuple,
+    TypeVar,
+)
+
+from flake8 import exceptions, processor
+from typing_extensions import Final
+
+from wemake_python_styleguide.linter import modules
+
+#: Module that is read and split into tokens, ``None`` when it is not read.
+ReadModule = Optional[processor.FileProcessor]
+
+#: Position of a module in the order of discovery, and its name.
+IndexedModule = Tuple[int, str]
+
+#: Position of a module, its name, and its lines, ``None`` when not read.
+ReadLines = Tuple[int, str, Optional[List[str]]]
+
+#: Threads mostly wait for the file system, so we have more than cores.
+_READING_THREADS: Final = 4
+
+#: Modules that are read ahead of checks, it bounds the memory we use.
+_READ_AHEAD: Final = 16
+
+_ReadResult = TypeVar('_ReadResult')
+_Reader = Callable[[argparse.Namespace, str], _ReadResult]
+_PendingModule = Tuple[str, 'Future[_ReadResult]']
+
+
+def _read_module(options: argparse.Namespace, filename: str) -> ReadModule:
+    file_processor = modules.read_module(options, filename)
+    if file_processor is None:  # missing modules are read again to report them
+        return None
+    # Broken modules are tokenized again, so they are reported as usual:
+    with contextlib.suppress(exceptions.InvalidSyntax):
+        file_processor.file_tokens  # noqa: WPS428
+    return file_processor
+
+
+def _read_lines(
+    options: argparse.Namespace,
+    filename: str,
+) -> Optional[List[str]]:
+    file_processor = modules.read_module(options, filename)
+    if file_processor is None:
+        return None
+    return file_processor.lines
+
+
+def _wait(
+    pending_module: '_PendingModule[_ReadResult]',
+) -> Tuple[str, _ReadResult]:
+    return pending_module[0], pending_module[1].result()
+
+
+def _read_ahead(
+    reader: _Reader[_ReadResult],
+    options: argparse.Namespace,
+    filenames: Iterable[str],
+) -> Iterator[Tuple[str, _ReadResult]]:
+    pending_modules: Deque[_PendingModule[_ReadResult]] = collections.deque()
+    with ThreadPoolExecutor(_READING_THREADS) as executor:
+        for filename in filenames:
+            pending_modules.append((
+                filename, executor.submit(reader, options, filename),
+            ))
+            if len(pending_modules) > _READ_AHEAD:
+                yield _wait(pending_modules.popleft())
+        while pending_modules:
+            yield _wait(pending_modules.popleft())
+
+
+def read_modules(
+    options: argparse.Namespace,
+    filenames: Iterable[str],
+) -> Iterator[Tuple[str, ReadModule]]:
+    """
+    Reads modules in background threads, yields them in the same order.
+
+    Modules are read, decoded, and split into tokens ahead of their checks.
+    So, slow file systems do not stall checks.
+    Only a few modules are read ahead, not to keep a huge project in memory.
+    Modules are found lazily too, checks start with the first found module.
+    """
+    return _read_ahead(_read_module, options, filenames)
+
+
+def read_batches(
+    options: argparse.Namespace,
+    batches: List[List[IndexedModule]],
+) -> Iterator[List[ReadLines]]:
+    """
+    Reads lines of modules in batches, while workers check previous batches.
+
+    Only lines are read, since file processors are not sent to workers.
+    Batches are read on demand, when workers are ready to take them.
+    """
+    read_lines = _read_ahead(
+        _read_lines,
+        options,
+        (filename for batch in batches for _, filename in batch),
+    )
+    return (
+        [(indexed_module[0], *next(read_lines)) for indexed_module in batch]
+        for batch in batches
+    )
@@ -0,0 +1,46 @@
+import ast
+import contextlib
+import gc
+from typing import Callable, Iterator, Type, cast
+
+from typing_extensions import Final
+
+from wemake_python_styleguide.checker import Checker
+from wemake_python_styleguide.compat.routing import fill_dispatch_table
+from wemake_python_styleguide.logic.naming.rules import naming_rules_from
+from wemake_python_styleguide.presets.types import tree as tree_preset
+
+#: There's no permanent generation on python3.6, so nothing is frozen there.
+_freeze: Final[Callable[[], object]] = getattr(gc, 'freeze', gc.isenabled)
+_unfreeze: Final[Callable[[], object]] = getattr(gc, 'unfreeze', gc.isenabled)
+
+
+def warm_up() -> None:
+    """
+    Builds lazy state of the checker, before workers are forked.
+
+    Otherwise, each worker builds the same naming rules
+    and dispatch tables of visitors on its own.
+    Options must be passed to the checker before.
+    """
+    naming_rules_from(Checker.options)
+    for visitor_class in tree_preset.PRESET:
+        fill_dispatch_table(cast(Type[ast.NodeVisitor], visitor_class))
+
+
+@contextlib.contextmanager
+def frozen_objects() -> Iterator[None]:
+    """
+    Hides all existing objects from the garbage collector, while forking.
+
+    Forked workers never collect these objects.
+    So, workers share memory pages of visitors, violations and constants
+    with their parent, instead of copying them.
+    Parent process collects its objects again, when workers are started.
+    """
+    gc.collect()  # garbage would be frozen forever otherwise
+    _freeze()
+    try:
+        yield
+    finally:
+        _unfreeze()
@@ -0,0 +1,103 @@
+import argparse
+import copy
+import io
+from typing import Iterable, List, Tuple, Type
+
+from flake8 import style_guide
+from flake8.formatting import base, default
+from typing_extensions import Final, final
+
+from wemake_python_styleguide.formatter import WemakeFormatter
+from wemake_python_styleguide.linter.modules import ModuleResult
+
+#: Display name of a module and its results.
+CheckedModule = Tuple[str, List[ModuleResult]]
+
+_FORMATTERS: Final = {  # noqa: WPS407
+    'default': default.Default,
+    'pylint': default.Pylint,
+    'quiet-filename': default.FilenameOnly,
+    'quiet-nothing': default.Nothing,
+    'wemake': WemakeFormatter,
+}
+
+
+@final
+class _Output(io.StringIO):
+    """Formatters close their output when they stop, we read it later."""
+
+    def close(self) -> None:
+        """Keeps the formatted output."""
+
+
+def _make_formatter(options: argparse.Namespace) -> base.BaseFormatter:
+    format_name = options.format
+    if options.quiet == 1:
+        format_name = 'quiet-filename'
+    elif options.quiet >= 2:
+        format_name = 'quiet-nothing'
+
+    formatter_class: Type[base.BaseFormatter] = _FORMATTERS.get(
+        format_name, default.Default,
+    )
+    # Formatted output is returned, it is never printed here:
+    formatter_options = copy.copy(options)
+    formatter_options.tee = False
+    return formatter_class(formatter_options)
+
+
+def _handle_results(
+    guide: style_guide.StyleGuideManager,
+    checked_modules: Iterable[CheckedModule],
+) -> int:
+    reported = 0
+    for display_name, module_results in checked_modules:
+        with guide.processing_file(display_name):
+            reported += sum(
+                guide.handle_error(error_code, display_name, *error_details)
+                for error_code, *error_details in module_results
+            )
+    return reported
+
+
+def _write_output(options: argparse.Namespace, output: str) -> str:
+    if not options.output_file:
+        return output
+    with open(options.output_file, 'w') as output_file:
+        output_file.write(output)
+    return output if options.tee else ''
+
+
+def report(
+    options: argparse.Namespace,
+    checked_modules: Iterable[CheckedModule],
+) -> Tuple[str, int]:
+    """
+    Selects and formats results of modules, like ``flake8`` does.
+
+    Results are formatted by ``flake8`` formatters.
+    So, ``noqa`` comments, ``--select``, ``--ignore``,
+    and ``--per-file-ignores`` options work just like they do there.
+
+    Arguments:
+        options: parsed options of a linter.
+        checked_modules: display names of modules and their results.
+
+    Returns:
+        Formatted output and the exit status.
+
+    """
+    output = _Output()
+    formatter = _make_formatter(options)
+    formatter.output_fd = output
+    guide = style_guide.StyleGuideManager(options, formatter)
+
+    reported = _handle_results(guide, checked_modules)
+    if options.statistics:
+        formatter.show_statistics(guide.stats)
+    formatter.stop()
+    if options.count:
+        output.write('{0}\n'.format(reported))
+    return _write_output(options, output.getvalue()), int(
+        bool(reported) and not options.exit_zero,
+    )
@@ -0,0 +1,135 @@
+"""
+Structural fingerprints of ``ast`` subtrees.
+
+We use fingerprints to tell whether two subtrees represent the same code.
+It is much faster than converting both subtrees back to the source code.
+
+Fingerprints do not depend on positions, formatting, and expression contexts.
+So, ``x`` from ``x = 1`` and ``x`` from ``print(x)``
+have the same fingerprint.
+
+Fingerprints are calculated bottom-up only once and cached on nodes.
+Subtrees with the same structure share the same fingerprint object,
+so comparing and hashing fingerprints does not depend on the subtree size.
+Fingerprints are released together with the last node that uses them.
+
+Use ``source.node_to_string`` when you need to show the code to the user.
+"""
+
+import ast
+import weakref
+from functools import lru_cache
+from typing import MutableMapping, Optional, Tuple, Type, cast
+
+from typing_extensions import Final, final
+
+#: Structure of a node: its type, its fields, and fingerprints of subnodes.
+_Structure = Tuple[object, ...]
+
+#: These fields do not change the meaning of the code.
+_IGNORED_FIELDS: Final = frozenset((
+    'ctx',
+    'kind',
+    'type_comment',
+))
+
+
+@final
+class Fingerprint(object):
+    """
+    Represents the structure of a subtree.
+
+    Fingerprints are equal only when they are the same object.
+    """
+
+    __slots__ = ('__weakref__',)
+
+
+_fingerprints: MutableMapping[
+    _Structure, Fingerprint,
+] = weakref.WeakValueDictionary()
+
+
+def get_fingerprint(node: ast.AST) -> Fingerprint:
+    """
+    Returns the structural fingerprint of a node.
+
+    >>> import ast
+    >>> first = ast.parse('x.attr[0] + "a"').body[0].value
+    >>> second = ast.parse("(x . attr)[ 0 ] + 'a'").body[0].value
+    >>> get_fingerprint(first) is get_fingerprint(second)
+    True
+
+    >>> third = ast.parse('x.attr[0] + b"a"').body[0].value
+    >>> get_fingerprint(first) is get_fingerprint(third)
+    False
+
+    """
+    fingerprint = _get_cached_fingerprint(node)
+    if fingerprint is not None:
+        return fingerprint
+
+    # We don't use recursion here, since some expressions are really deep.
+    # Reversed breadth-first order has all children before their parents:
+    subnodes = [node]
+    for parent in subnodes:
+        subnodes.extend(
+            child
+            for child in ast.iter_child_nodes(parent)
+            if _get_cached_fingerprint(child) is None
+        )
+
+    for subnode in reversed(subnodes):
+        structure = _get_structure(subnode)
+        fingerprint = _fingerprints.get(structure)
+        if fingerprint is None:
+            fingerprint = Fingerprint()
+            _fingerprints[structure] = fingerprint
+        setattr(subnode, 'wps_fingerprint', fingerprint)  # noqa: B010
+    return cast(Fingerprint, fingerprint)
+
+
+def is_same(node: ast.AST, other: ast.AST) -> bool:
+    """
+    Tells whether two nodes represent the same code.
+
+    >>> import ast
+    >>> assign = ast.parse('x = x.y').body[0]
+    >>> is_same(assign.targets[0], assign.value.value)
+    True
+    >>> is_same(assign.targets[0], assign.value)
+    False
+
+    """
+    return get_fingerprint(node) is get_fingerprint(other)
+
+
+@lru_cache(maxsize=None)
+def _get_fields(node_type: Type[ast.AST]) -> Tuple[str, ...]:
+    return tuple(
+        field
+        for field in node_type._fields  # noqa: WPS437
+        if field not in _IGNORED_FIELDS
+    )
+
+
+def _get_cached_fingerprint(node: ast.AST) -> Optional[Fingerprint]:
+    return getattr(node, 'wps_fingerprint', None)
+
+
+def _get_structure(node: ast.AST) -> _Structure:
+    return (type(node), *[
+        _get_field_structure(getattr(node, field, None))
+        for field in _get_fields(type(node))
+    ])
+
+
+def _get_field_structure(field_value: object) -> object:
+    if isinstance(field_value, ast.AST):
+        return _get_cached_fingerprint(field_value)
+    if isinstance(field_value, list):
+        return tuple(map(_get_field_structure, field_value))
+    if isinstance(field_value, str):
+        return field_value
+    # We need types to tell `1`, `1.0`, and `True` apart:
+    return (type(field_value), field_value)
@@ -0,0 +1,252 @@
+"""
+Index of all nodes inside a module by their types.
+
+It is built once during the transformation step.
+Each node that has children is marked with its pre-order position
+and with the position of the last node in its subtree.
+So, all nodes of some type inside any subtree are just a slice of the index.
+Nodes are also marked with their depth in the index,
+so we return them breadth-first, in the same order as ``ast.walk`` does.
+
+Each node that has children is also marked with a summary
+of all node types inside its subtree. It is a bit mask,
+so we can tell that some type is not there without looking at subnodes.
+
+Nodes without children are not marked at all,
+because ``ast`` reuses some of them (like ``ast.Load`` or ``ast.Add``)
+between all the trees. Walking a leaf is cheap anyway.
+"""
+
+import ast
+import types
+from bisect import bisect_left, bisect_right
+from collections import defaultdict
+from operator import itemgetter
+from typing import Dict, Iterator, List, Mapping, Optional, Tuple, Type, Union
+
+from typing_extensions import Final, final
+
+from wemake_python_styleguide.types import AnyNodes
+
+#: We query index with a single type or with a tuple of types.
+NodeTypes = Union[AnyNodes, type]
+
+_NodeType = Type[ast.AST]
+#: Nodes are sorted by their depth and position.
+_Positioned = Tuple[Tuple[int, int], ast.AST]
+
+#: Unknown node types match any query.
+_ANY_TYPE: Final = -1
+
+
+def _get_node_type_bits() -> Mapping[type, int]:
+    all_types = [ast.AST]
+    for node_type in all_types:
+        all_types.extend(node_type.__subclasses__())
+
+    # Deprecated types like `ast.Num` are never created since `python3.8`,
+    # they only use custom `isinstance` checks. So, we can not index them:
+    return types.MappingProxyType({
+        real_type: 1 << bit
+        for bit, real_type in enumerate(all_types)
+        if type(real_type) is type  # noqa: WPS516
+    })
+
+
+#: Each node type has its own bit in subtree summaries.
+_NODE_TYPE_BITS: Final = _get_node_type_bits()
+
+#: Query masks are calculated once for each query.
+_types_masks: Dict[NodeTypes, Optional[int]] = {}
+
+
+def get_types_mask(node_types: NodeTypes) -> Optional[int]:
+    """
+    Returns a bit mask of all node types that match the given query.
+
+    Returns ``None`` when the query has types we do not index.
+    For example, ``ast.Num`` is not a real node type since ``python3.8``.
+    """
+    try:
+        return _types_masks[node_types]
+    except KeyError:
+        query = node_types if isinstance(node_types, tuple) else (node_types,)
+        types_mask: Optional[int] = None
+        if all(query_type in _NODE_TYPE_BITS for query_type in query):
+            types_mask = 0
+            for node_type, type_bit in _NODE_TYPE_BITS.items():
+                if issubclass(node_type, node_types):
+                    types_mask |= type_bit
+        _types_masks[node_types] = types_mask
+        return types_mask
+
+
+@final
+class NodeIndex(object):
+    """
+    Stores nodes of each type together with their positions.
+
+    Nodes are added in pre-order, so each list is sorted by positions.
+    We use binary search to find the subtree slice.
+    """
+
+    def __init__(self) -> None:
+        """Creates an empty index."""
+        self._positions: Dict[_NodeType, List[int]] = defaultdict(list)
+        self._nodes: Dict[_NodeType, List[_Positioned]] = defaultdict(list)
+        self._matching_types: Dict[NodeTypes, Tuple[_NodeType, ...]] = {}
+
+        # Nodes with unfinished subtrees, with the number of pending nodes,
+        # and with all node types inside their subtrees so far:
+        self._open_subtrees: List[Tuple[ast.AST, int]] = []
+        self._open_types: List[int] = []
+        self._size = 0
+
+    def __len__(self) -> int:
+        """Returns the total number of indexed nodes."""
+        return self._size
+
+    def add(self, node: ast.AST, *, is_leaf: bool, pending: int) -> None:
+        """
+        Adds a next node in pre-order.
+
+        Nodes with children are marked with their position.
+        We also need to know how many nodes are still waiting to be added
+        when we add this one, to tell when its subtree is over.
+        """
+        node_type = type(node)
+        if node_type not in self._nodes:
+            self._matching_types.clear()
+
+        self._positions[node_type].append(self._size)
+        # All parents of this node have unfinished subtrees:
+        depth = len(self._open_subtrees)
+        self._nodes[node_type].append(((depth, self._size), node))
+        type_bit = _NODE_TYPE_BITS.get(node_type, _ANY_TYPE)
+        if not is_leaf:
+            setattr(node, 'wps_index', self)  # noqa: B010
+            setattr(node, 'wps_position', self._size)  # noqa: B010
+            self._open_subtrees.append((node, pending))
+            self._open_types.append(type_bit)
+        elif self._open_types:
+            self._open_types[-1] |= type_bit
+            # The last node of any subtree is always a leaf:
+            self._close_subtrees(pending)
+        self._size += 1
+
+    def get_subnodes(
+        self,
+        node_types: NodeTypes,
+        start: int,
+        end: int,
+    ) -> Iterator[ast.AST]:
+        """
+        Returns nodes of given types between two positions.
+
+        Nodes are returned breadth-first, just like ``ast.walk`` does.
+        Some checks rely on this order, they treat the first found name
+        as its definition. So, the order does not depend on the index.
+        """
+        subnodes: List[_Positioned] = []
+        for node_type in self._get_matching_types(node_types):
+            subnodes.extend(self._get_slice(node_type, start, end))
+        subnodes.sort(key=itemgetter(0))
+        return (node for _, node in subnodes)
+
+    def _close_subtrees(self, pending: int) -> None:
+        open_subtrees = self._open_subtrees
+        open_types = self._open_types
+        while open_subtrees and open_subtrees[-1][1] == pending:
+            node = open_subtrees.pop()[0]
+            subtree_types = open_types.pop()
+            setattr(node, 'wps_subtree_end', self._size)  # noqa: B010
+            setattr(node, 'wps_subtree_types', subtree_types)  # noqa: B010
+            if open_types:
+                open_types[-1] |= subtree_types
+
+    def _get_slice(
+        self,
+        node_type: _NodeType,
+        start: int,
+        end: int,
+    ) -> List[_Positioned]:
+        positions = self._positions[node_type]
+        lower = bisect_left(positions, start)
+        upper = bisect_right(positions, end, lower)
+        return self._nodes[node_type][lower:upper]
+
+    def _get_matching_types(
+        self,
+        node_types: NodeTypes,
+    ) -> Tuple[_NodeType, ...]:
+        matching_types = self._matching_types.get(node_types)
+        if matching_types is None:
+            matching_types = tuple(
+                node_type
+                for node_type in self._nodes
+                if issubclass(node_type, node_types)
+            )
+            self._matching_types[node_types] = matching_types
+        return matching_types
+
+
+#: Index of a node, its position, and the position of its last subnode.
+_Subtree = Tuple[NodeIndex, int, int]
+
+
+def may_contain(node: ast.AST, node_types: NodeTypes) -> bool:
+    """
+    Tells whether the subtree of a node might contain given node types.
+
+    When it says ``False``, there are definitely no such nodes.
+    When it says ``True``, you have to look for them.
+    """
+    subtree_types: Optional[int] = getattr(node, 'wps_subtree_types', None)
+    if subtree_types is None:
+        return True
+    types_mask = get_types_mask(node_types)
+    return types_mask is None or bool(subtree_types & types_mask)
+
+
+def is_subnode(node: ast.AST, container: ast.AST) -> Optional[bool]:
+    """
+    Tells whether node is inside the subtree of a container.
+
+    Returns ``None`` when we can not compare their positions.
+    """
+    node_subtree = _get_subtree(node)
+    container_subtree = _get_subtree(container)
+    if node_subtree is None or container_subtree is None:
+        return None
+
+    if node_subtree[0] is not container_subtree[0]:
+        return None
+    return container_subtree[1] < node_subtree[1] <= container_subtree[2]
+
+
+def get_subnodes(
+    node: ast.AST,
+    node_types: NodeTypes,
+) -> Optional[Iterator[ast.AST]]:
+    """
+    Returns subnodes of given types including the node itself.
+
+    Returns ``None`` when node is not indexed, so you have to walk it.
+    """
+    subtree = _get_subtree(node)
+    if subtree is None or get_types_mask(node_types) is None:
+        return None
+
+    node_index, start, end = subtree
+    return node_index.get_subnodes(node_types, start, end)
+
+
+def _get_subtree(node: ast.AST) -> Optional[_Subtree]:
+    node_index: Optional[NodeIndex] = getattr(node, 'wps_index', None)
+    if node_index is None:
+        return None
+    return (
+        node_index,
+        getattr(node, 'wps_position'),  # noqa: B009
+        getattr(node, 'wps_subtree_end'),  # noqa: B009
+    )
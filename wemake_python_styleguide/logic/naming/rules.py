@@ -0,0 +1,226 @@
+import re
+from functools import lru_cache
+from typing import FrozenSet, Iterable, Optional, Tuple
+
+from typing_extensions import Final, final
+
+from wemake_python_styleguide.constants import (
+    SPECIAL_ARGUMENT_NAMES_WHITELIST,
+    UNREADABLE_CHARACTER_COMBINATIONS,
+)
+from wemake_python_styleguide.logic.naming import blacklists, builtins
+from wemake_python_styleguide.types import ConfigurationOptions
+
+#: Each rule is a single bit of the result, set bits are failed rules.
+BUILTIN_SHADOWING: Final = 1
+TRAILING_UNDERSCORE: Final = BUILTIN_SHADOWING << 1
+PRIVATE: Final = TRAILING_UNDERSCORE << 1
+UNICODE: Final = PRIVATE << 1
+UNDERSCORED_NUMBER: Final = UNICODE << 1
+CONSECUTIVE_UNDERSCORES: Final = UNDERSCORED_NUMBER << 1
+TOO_SHORT: Final = CONSECUTIVE_UNDERSCORES << 1
+TOO_LONG: Final = TOO_SHORT << 1
+WRONG_NAME: Final = TOO_LONG << 1
+RESERVED_ARGUMENT: Final = WRONG_NAME << 1
+WRONG_UNUSED_NAME: Final = RESERVED_ARGUMENT << 1
+UNREADABLE: Final = WRONG_UNUSED_NAME << 1
+
+#: All rules in the order their violations are reported.
+_ALL_RULES: Final = (
+    BUILTIN_SHADOWING,
+    TRAILING_UNDERSCORE,
+    PRIVATE,
+    UNICODE,
+    UNDERSCORED_NUMBER,
+    CONSECUTIVE_UNDERSCORES,
+    TOO_SHORT,
+    TOO_LONG,
+    WRONG_NAME,
+    RESERVED_ARGUMENT,
+    WRONG_UNUSED_NAME,
+    UNREADABLE,
+)
+
+#: Failed rule, the text of its violation, and its baseline.
+Verdict = Tuple[int, str, Optional[int]]
+
+#: Names are repeated a lot, so we keep verdicts of the most used ones.
+_VERDICTS_CACHE_SIZE: Final = 8192
+
+_DOUBLE_UNDERSCORE: Final = '__'
+
+# All alphabet rules in a single pattern, every group finds one rule.
+# Underscores are matched one by one, so rules never hide each other:
+_ALPHABET_PATTERN: Final = re.compile('|'.join((
+    '(?P<unreadable>{0})'.format('|'.join(
+        re.escape(combination)
+        for combination in sorted(UNREADABLE_CHARACTER_COMBINATIONS)
+    )),
+    r'(?P<underscored>(?<=.\D)_(?=\d))',
+    '(?P<consecutive>_(?=_))',
+    r'(?P<unicode>[^\x00-\x7f]+)',
+)))
+
+_GROUP_RULES: Final = {  # noqa: WPS407
+    'unreadable': UNREADABLE,
+    'underscored': UNDERSCORED_NUMBER,
+    'consecutive': CONSECUTIVE_UNDERSCORES,
+    'unicode': UNICODE,
+}
+
+
+def _with_underscores(names: Iterable[str]) -> FrozenSet[str]:
+    return frozenset(
+        variant
+        for name in names
+        for variant in (name, '_{0}'.format(name), '{0}_'.format(name))
+    )
+
+
+_RESERVED_NAMES: Final = _with_underscores(SPECIAL_ARGUMENT_NAMES_WHITELIST)
+
+
+@final
+class NamingRules(object):
+    """
+    Naming rules compiled for values of options.
+
+    Checks a name in a single pass over its characters.
+    Results are the same as the ones of ``access``,
+    ``alphabet``, ``builtins``, and ``logical`` functions.
+    """
+
+    def __init__(
+        self,
+        min_length: int,
+        max_length: int,
+        variable_names_blacklist: Iterable[str],
+    ) -> None:
+        """Expands the blacklist with ``_name`` and ``name_`` variants."""
+        self.min_length = min_length
+        self.max_length = max_length
+        self._blacklist = _with_underscores(variable_names_blacklist)
+
+    def check(
+        self,
+        name: str,
+        *,
+        is_first_argument: bool = False,
+    ) -> Tuple[int, str]:
+        """
+        Returns failed rules, and the first unreadable character combination.
+
+        >>> rules = NamingRules(2, 10, ['data'])
+        >>> rules.check('_data') == (WRONG_NAME, '')
+        True
+
+        >>> rules.check('_x_') == (TOO_SHORT | TRAILING_UNDERSCORE, '')
+        True
+
+        >>> rules.check('x__1O0') == (
+        ...     CONSECUTIVE_UNDERSCORES | UNDERSCORED_NUMBER | UNREADABLE, 'O0',
+        ... )
+        True
+
+        >>> rules.check('cls', is_first_argument=True)
+        (0, '')
+
+        """
+        failed, unreadable = self._check_alphabet(name)
+        lowercase_name = name.lower()
+        if lowercase_name in self._blacklist:
+            failed |= WRONG_NAME
+        if not is_first_argument and lowercase_name in _RESERVED_NAMES:
+            failed |= RESERVED_ARGUMENT
+        if len(name) > self.max_length:
+            failed |= TOO_LONG
+        return failed | self._check_underscores(name), unreadable
+
+    @classmethod
+    def _check_alphabet(cls, name: str) -> Tuple[int, str]:
+        failed = 0
+        unreadable = ''
+        for match in _ALPHABET_PATTERN.finditer(name):
+            failed |= _GROUP_RULES[match.lastgroup]  # type: ignore
+            if not unreadable and match.lastgroup == 'unreadable':
+                unreadable = match.group()
+
+        # Leading and trailing underscores are fine for magic and private:
+        is_consecutive_allowed = (
+            failed & CONSECUTIVE_UNDERSCORES and
+            name.startswith(_DOUBLE_UNDERSCORE) and
+            _DOUBLE_UNDERSCORE not in name.strip('_')
+        )
+        if is_consecutive_allowed:
+            failed ^= CONSECUTIVE_UNDERSCORES
+        return failed, unreadable
+
+    def _check_underscores(self, name: str) -> int:
+        stripped_name = name.strip('_')
+        if name and not stripped_name:
+            return WRONG_UNUSED_NAME if len(name) > 1 else 0
+
+        failed = TOO_SHORT if len(stripped_name) < self.min_length else 0
+        if builtins.is_builtin_name(name):
+            failed |= BUILTIN_SHADOWING
+        if name.startswith(_DOUBLE_UNDERSCORE):
+            if name.endswith(_DOUBLE_UNDERSCORE):
+                return failed  # magic names are fine
+            failed |= PRIVATE
+        if name.endswith('_') and not builtins.is_builtin_name(name[:-1]):
+            failed |= TRAILING_UNDERSCORE
+        return failed
+
+
+@lru_cache()
+def naming_rules_from(options: ConfigurationOptions) -> NamingRules:
+    """Compiles naming rules once for each options object."""
+    return NamingRules(
+        min_length=options.min_name_length,
+        max_length=options.max_name_length,
+        variable_names_blacklist=(
+            blacklists.variable_names_blacklist_from(options)
+        ),
+    )
+
+
+@lru_cache(maxsize=_VERDICTS_CACHE_SIZE)
+def get_verdicts(
+    naming_rules: NamingRules,
+    name: str,
+    *,
+    is_first_argument: bool = False,
+) -> Tuple[Verdict, ...]:
+    """
+    Finds all failed rules of a name, without any nodes.
+
+    Verdicts are shared by all modules checked in this process.
+    So, each module only pays for names that were not seen before.
+
+    >>> rules = NamingRules(2, 10, ['data'])
+    >>> get_verdicts(rules, '_x_') == (
+    ...     (TRAILING_UNDERSCORE, '_x_', None),
+    ...     (TOO_SHORT, '_x_', 2),
+    ... )
+    True
+
+    """
+    failed, unreadable = naming_rules.check(
+        name, is_first_argument=is_first_argument,
+    )
+    if not failed:
+        return ()
+
+    baselines = {
+        TOO_SHORT: naming_rules.min_length,
+        TOO_LONG: naming_rules.max_length,
+    }
+    return tuple(
+        (
+            rule,
+            unreadable if rule == UNREADABLE else name,
+            baselines.get(rule),
+        )
+        for rule in _ALL_RULES
+        if failed & rule
+    )
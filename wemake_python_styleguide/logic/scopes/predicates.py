@@ -5,7 +5,8 @@ from typing_extensions import Final
 
 from wemake_python_styleguide.compat.aliases import AssignNodes, FunctionNodes
 from wemake_python_styleguide.logic.nodes import get_parent
-from wemake_python_styleguide.logic.source import node_to_string
+from wemake_python_styleguide.logic.source import dotted_name_to_string
+from wemake_python_styleguide.logic.walk import get_subnodes_by_type
 
 #: That's what we expect from `@overload` decorator:
 _OVERLOAD_EXCEPTIONS: Final = frozenset(('overload', 'typing.overload'))
@@ -20,7 +21,7 @@ def is_function_overload(node: ast.AST) -> bool:
     """Check that function decorated with `typing.overload`."""
     if isinstance(node, FunctionNodes):
         for decorator in node.decorator_list:
-            if node_to_string(decorator) in _OVERLOAD_EXCEPTIONS:
+            if dotted_name_to_string(decorator) in _OVERLOAD_EXCEPTIONS:
                 return True
     return False
 
@@ -34,7 +35,7 @@ def is_property_setter(node: ast.AST) -> bool:
     """Check that function decorated with ``@property.setter``."""
     if isinstance(node, FunctionNodes):
         for decorator in node.decorator_list:
-            if node_to_string(decorator) in _PROPERTY_EXCEPTIONS:
+            if dotted_name_to_string(decorator) in _PROPERTY_EXCEPTIONS:
                 return True
     return False
 
@@ -46,8 +47,7 @@ def is_same_value_reuse(node: ast.AST, names: Set[str]) -> bool:
     if isinstance(node, AssignNodes) and node.value:
         used_names = {
             name_node.id
-            for name_node in ast.walk(node.value)
-            if isinstance(name_node, ast.Name)
+            for name_node in get_subnodes_by_type(node.value, ast.Name)
         }
         if not names.difference(used_names):
             return True
@@ -1,13 +1,77 @@
 import ast
+from itertools import accumulate
+from typing import List, Optional, Sequence
 
 import astor
+from typing_extensions import final
 
+from wemake_python_styleguide.logic import walk
 from wemake_python_styleguide.types import AnyTextPrimitive
 
 
 def node_to_string(node: ast.AST) -> str:
-    """Returns the source code by doing ``ast`` to string convert."""
-    return astor.to_source(node).strip()
+    """
+    Returns the source code by doing ``ast`` to string convert.
+
+    The result is cached on the node, so each node is converted only once
+    by all visitors. Cache is freed together with the tree.
+
+    >>> import ast
+    >>> node = ast.parse('first + second').body[0].value
+    >>> node_to_string(node)
+    '(first + second)'
+    >>> node_to_string(node) is node_to_string(node)
+    True
+
+    .. versionchanged:: 0.15.0
+
+    """
+    source_code: Optional[str] = getattr(node, 'wps_source_code', None)
+    if source_code is None:
+        source_code = astor.to_source(node).strip()
+        setattr(node, 'wps_source_code', source_code)  # noqa: B010
+    return source_code
+
+
+def get_source_segment(tree: ast.AST, node: ast.AST) -> str:
+    """
+    Returns the source code of a node exactly as it was written.
+
+    Falls back to the full convert, when the tree has no source lines
+    or when the node does not have reliable positions.
+    We use it to show the code to the user.
+    """
+    segments: Optional[SourceSegments] = getattr(
+        tree, 'wps_source_segments', None,
+    )
+    segment = None if segments is None else segments.get_segment(node)
+    if segment is None:
+        return node_to_string(node)
+    return segment
+
+
+def dotted_name_to_string(node: ast.AST) -> Optional[str]:
+    """
+    Returns the source code of ``Name`` and ``Attribute`` chains.
+
+    It is much faster than the full convert, but works only for chains.
+    Returns ``None`` for any other node.
+
+    >>> import ast
+    >>> dotted_name_to_string(ast.parse('first.second.third').body[0].value)
+    'first.second.third'
+
+    >>> dotted_name_to_string(ast.parse('first().second').body[0].value)
+
+    """
+    parts: List[str] = []
+    while isinstance(node, ast.Attribute):
+        parts.append(node.attr)
+        node = node.value
+    if not isinstance(node, ast.Name):
+        return None
+    parts.append(node.id)
+    return '.'.join(reversed(parts))
 
 
 def render_string(text_data: AnyTextPrimitive) -> str:
@@ -22,3 +86,63 @@ def render_string(text_data: AnyTextPrimitive) -> str:
         # See https://docs.python.org/3/howto/unicode.html
         return text_data.decode('utf-8', errors='surrogateescape')
     return text_data  # it is a `str`
+
+
+@final
+class SourceSegments(object):
+    """
+    Finds the original source code of nodes in a module.
+
+    It is built once per module from its lines.
+    We convert node positions to offsets with the array of line starts.
+    """
+
+    def __init__(self, lines: Sequence[str]) -> None:
+        """Builds the array of line starts."""
+        self._lines = lines
+        self._source = ''.join(lines)
+        self._line_starts = [0, *accumulate(len(line) for line in lines)]
+
+    def get_segment(self, node: ast.AST) -> Optional[str]:
+        """
+        Returns the original source code of a node.
+
+        Returns ``None`` when the node does not have reliable positions:
+
+        - ``end_lineno`` and ``end_col_offset`` exist only in ``python3.8+``
+        - nodes inside f-strings might have wrong positions
+        - line numbers of tuples are changed by our transformations
+
+        """
+        if isinstance(node, ast.Tuple):
+            return None
+        if walk.get_closest_parent(node, ast.JoinedStr):
+            return None
+
+        start = self._get_offset(
+            getattr(node, 'lineno', None),
+            getattr(node, 'col_offset', None),
+        )
+        end = self._get_offset(
+            getattr(node, 'end_lineno', None),
+            getattr(node, 'end_col_offset', None),
+        )
+        if start is None or end is None:
+            return None
+        return self._source[start:end]
+
+    def _get_offset(
+        self,
+        lineno: Optional[int],
+        col_offset: Optional[int],
+    ) -> Optional[int]:
+        if lineno is None or col_offset is None:
+            return None
+        if lineno < 1 or lineno > len(self._lines):
+            return None
+
+        # Column offsets are in bytes, but we need them in chars:
+        line_start = self._lines[lineno - 1].encode('utf-8')[:col_offset]
+        return self._line_starts[lineno - 1] + len(
+            line_start.decode('utf-8', errors='ignore'),
+        )
@@ -1,10 +1,8 @@
 import ast
 
+from wemake_python_styleguide.logic.walk import get_subnodes_by_type
+
 
 def count_boolops(node: ast.AST) -> int:
     """Counts how many ``BoolOp`` nodes there are in a node."""
-    return len([
-        subnode
-        for subnode in ast.walk(node)
-        if isinstance(subnode, ast.BoolOp)
-    ])
+    return len(list(get_subnodes_by_type(node, ast.BoolOp)))
@@ -3,7 +3,7 @@ from typing import List, Optional, Tuple
 
 from wemake_python_styleguide.compat.aliases import AssignNodes
 from wemake_python_styleguide.constants import ALLOWED_BUILTIN_CLASSES
-from wemake_python_styleguide.logic import nodes
+from wemake_python_styleguide.logic import nodes, walk
 from wemake_python_styleguide.logic.naming.builtins import is_builtin_name
 from wemake_python_styleguide.types import AnyAssign
 
@@ -60,7 +60,7 @@ def get_attributes(node: ast.ClassDef) -> _AllAttributes:
     class_attributes = []
     instance_attributes = []
 
-    for subnode in ast.walk(node):
+    for subnode in walk.get_subnodes(node, (ast.Attribute, *AssignNodes)):
         instance_attr = _get_instance_attribute(subnode)
         if instance_attr is not None:
             instance_attributes.append(instance_attr)
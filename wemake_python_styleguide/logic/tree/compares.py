@@ -6,7 +6,7 @@ from typing import DefaultDict, Mapping, Set, Tuple, Type, Union
 import attr
 from typing_extensions import Final, final
 
-from wemake_python_styleguide.logic import source
+from wemake_python_styleguide.logic import fingerprints
 
 
 @final
@@ -27,7 +27,7 @@ _ComparesMapping = Mapping[
 ]
 
 #: Used to track the operator usages in `a > b and b >c` compares.
-_OperatorUsages = DefaultDict[str, _Bounds]
+_OperatorUsages = DefaultDict[fingerprints.Fingerprint, _Bounds]
 
 #: Constant to define similar operators.
 SIMILAR_OPERATORS: Final[_ComparesMapping] = types.MappingProxyType({
@@ -94,7 +94,7 @@ class CompareBounds(object):
                 self._mutate(
                     comparison_node,
                     operator,
-                    source.node_to_string(operand),
+                    fingerprints.get_fingerprint(operand),
                     operand is left_operand,
                 )
             left_operand = right_operand
@@ -103,7 +103,7 @@ class CompareBounds(object):
         self,
         comparison_node: ast.Compare,
         operator: ast.cmpop,
-        name: str,
+        fingerprint: fingerprints.Fingerprint,
         is_left: bool,
     ) -> None:
         key_name = None
@@ -113,4 +113,4 @@ class CompareBounds(object):
             key_name = 'upper_bound' if is_left else 'lower_bound'
 
         if key_name:
-            getattr(self._uses[name], key_name).add(comparison_node)
+            getattr(self._uses[fingerprint], key_name).add(comparison_node)
@@ -22,18 +22,25 @@ def get_all_exception_names(node: ast.Try) -> List[str]:
     """Returns a list of all exceptions names in ``ast.Try``."""
     exceptions: List[str] = []
     for exc_handler in node.handlers:
-        # There might be complex things hidden inside an exception type,
-        # so we want to get the string representation of it:
         if isinstance(exc_handler.type, ast.Name):
-            exceptions.append(source.node_to_string(exc_handler.type))
+            exceptions.append(exc_handler.type.id)
         elif isinstance(exc_handler.type, ast.Tuple):
             exceptions.extend([
-                source.node_to_string(node)
-                for node in exc_handler.type.elts
+                _get_exception_type_name(exc_type)
+                for exc_type in exc_handler.type.elts
             ])
     return exceptions
 
 
+def _get_exception_type_name(node: ast.expr) -> str:
+    # There might be complex things hidden inside an exception type,
+    # so we want to get the string representation of it:
+    dotted_name = source.dotted_name_to_string(node)
+    if dotted_name is None:
+        return source.node_to_string(node)
+    return dotted_name
+
+
 def traverse_exception(
     cls,
     builtin_exceptions=None,
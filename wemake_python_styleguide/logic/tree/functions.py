@@ -22,13 +22,42 @@ def given_function_called(node: Call, to_check: Container[str]) -> str:
     >>> given_function_called(module.body[0].value, ['adjust'])
     ''
 
+    .. versionchanged:: 0.15.0
+
     """
-    function_name = source.node_to_string(node.func)
+    function_name = get_function_name(node)
     if function_name in to_check:
         return function_name
     return ''
 
 
+def get_function_name(node: Call) -> str:
+    """
+    Returns the source code of the called function.
+
+    Plain names and attribute chains like ``self.method`` are resolved
+    directly, other functions are fully converted back to the source code.
+    The result is cached on the node.
+
+    >>> import ast
+    >>> module = ast.parse('self.logger.info(123)')
+    >>> get_function_name(module.body[0].value)
+    'self.logger.info'
+
+    >>> module = ast.parse('factory()[0](123)')
+    >>> get_function_name(module.body[0].value)
+    'factory()[0]'
+
+    """
+    function_name: Optional[str] = getattr(node, 'wps_function_name', None)
+    if function_name is None:
+        function_name = source.dotted_name_to_string(node.func)
+        if function_name is None:
+            function_name = source.node_to_string(node.func)
+        setattr(node, 'wps_function_name', function_name)  # noqa: B010
+    return function_name
+
+
 def is_method(function_type: Optional[str]) -> bool:
     """
     Returns whether a given function type belongs to a class.
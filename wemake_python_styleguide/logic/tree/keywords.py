@@ -2,6 +2,7 @@ import ast
 from typing import List, Tuple
 
 from wemake_python_styleguide.logic.nodes import get_context
+from wemake_python_styleguide.logic.walk import get_subnodes_by_type
 
 
 def returning_nodes(
@@ -11,9 +12,8 @@ def returning_nodes(
     """Returns ``return`` or ``yield`` nodes with values."""
     returns: List[ast.Return] = []
     has_values = False
-    for sub_node in ast.walk(node):
-        context_node = get_context(sub_node)
-        if isinstance(sub_node, returning_type) and context_node == node:
+    for sub_node in get_subnodes_by_type(node, returning_type):
+        if get_context(sub_node) == node:
             if sub_node.value:
                 has_values = True
             returns.append(sub_node)
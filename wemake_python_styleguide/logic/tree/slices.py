@@ -1,16 +1,16 @@
 import ast
 
-from wemake_python_styleguide.logic import source
+from wemake_python_styleguide.logic import fingerprints
 
 
 def is_same_slice(
-    iterable: str,
-    target: str,
+    iterable: ast.AST,
+    target: ast.AST,
     node: ast.Subscript,
 ) -> bool:
     """Used to tell when slice is identical to some pair of name/index."""
     return (
-        source.node_to_string(node.value) == iterable and
+        fingerprints.is_same(node.value, iterable) and
         isinstance(node.slice, ast.Index) and  # mypy is unhappy
-        source.node_to_string(node.slice.value) == target
+        fingerprints.is_same(node.slice.value, target)
     )
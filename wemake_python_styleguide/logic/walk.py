@@ -1,11 +1,14 @@
 import ast
-from typing import Iterator, Optional, Type, TypeVar, Union
+from typing import Dict, Iterator, List, Optional, Type, TypeVar, cast
 
+from wemake_python_styleguide.logic import index
 from wemake_python_styleguide.logic.nodes import get_parent
-from wemake_python_styleguide.types import AnyNodes
 
 _SubnodeType = TypeVar('_SubnodeType', bound=ast.AST)
-_IsInstanceContainer = Union[AnyNodes, type]
+_IsInstanceContainer = index.NodeTypes
+
+#: Closest parents of a node for each queried parent types.
+_ClosestParents = Dict[_IsInstanceContainer, Optional[ast.AST]]
 
 
 def is_contained(
@@ -15,49 +18,111 @@ def is_contained(
     """
     Checks whether node does contain given subnode types.
 
-    Goes down by the tree to check all children.
+    Uses the summary of subtree node types to say "no" right away.
+    Uses the index of node types when it is present.
+    Otherwise, goes down by the tree to check all children.
+
+    .. versionchanged:: 0.15.0
+
     """
-    for child in ast.walk(node):
-        if isinstance(child, to_check):
-            return True
-    return False
+    if not index.may_contain(node, to_check):
+        return False
+    return next(get_subnodes(node, to_check), None) is not None
 
 
 def get_closest_parent(
     node: ast.AST,
     parents: _IsInstanceContainer,
 ) -> Optional[ast.AST]:
-    """Returns the closes parent of a node of requested types."""
+    """
+    Returns the closes parent of a node of requested types.
+
+    Results are cached on indexed nodes that we pass on the way up,
+    so the next query from any node below stops there.
+
+    .. versionchanged:: 0.15.0
+
+    """
+    caches_to_update: List[_ClosestParents] = []
     parent = get_parent(node)
-    while True:
-        if parent is None:
-            return None
-        if isinstance(parent, parents):
-            return parent
-        parent = get_parent(parent)
+    while parent is not None and not isinstance(parent, parents):
+        closest_parents = _get_closest_parents(parent)
+        try:
+            cached_parent = closest_parents[parents]
+        except KeyError:
+            caches_to_update.append(closest_parents)
+            parent = get_parent(parent)
+        else:
+            parent = cached_parent
+            break
+
+    for parents_cache in caches_to_update:
+        parents_cache[parents] = parent
+    return parent
 
 
 def is_contained_by(node: ast.AST, container: ast.AST) -> bool:
     """
     Tells you if a node is contained by a given container.
 
-    Goes up by the tree of ``node`` to check all parents.
+    Compares positions when both nodes are indexed.
+    Otherwise, goes up by the tree of ``node`` to check all parents.
     Works with specific instances.
+
+    .. versionchanged:: 0.15.0
+
     """
-    parent = get_parent(node)
-    while True:
-        if parent is None:
-            return False
+    parent: Optional[ast.AST] = node
+    while parent is not None:
+        is_subnode = index.is_subnode(parent, container)
+        if is_subnode is not None:
+            return is_subnode
+
+        parent = get_parent(parent)
         if parent == container:
             return True
-        parent = get_parent(parent)
+    return False
 
 
 def get_subnodes_by_type(
     node: ast.AST,
     subnodes_type: Type[_SubnodeType],
 ) -> Iterator[_SubnodeType]:
-    """Returns the list of subnodes of given node with given subnode type."""
-    for child in ast.walk(node):
-        if isinstance(child, subnodes_type):
-            yield child
+    """
+    Returns subnodes of given node with given subnode type.
+
+    .. versionchanged:: 0.15.0
+
+    """
+    return cast(Iterator[_SubnodeType], get_subnodes(node, subnodes_type))
+
+
+def get_subnodes(
+    node: ast.AST,
+    subnodes_types: _IsInstanceContainer,
+) -> Iterator[ast.AST]:
+    """
+    Returns subnodes of given node with any of given subnode types.
+
+    The node itself is also included when it matches.
+    Indexed nodes are found by a slice lookup, other nodes are walked.
+    The order is breadth-first either way, like ``ast.walk`` has.
+    """
+    indexed = index.get_subnodes(node, subnodes_types)
+    if indexed is not None:
+        return indexed
+    return (
+        child
+        for child in ast.walk(node)
+        if isinstance(child, subnodes_types)
+    )
+
+
+def _get_closest_parents(node: ast.AST) -> _ClosestParents:
+    closest_parents = getattr(node, 'wps_closest_parents', None)
+    if closest_parents is None:
+        closest_parents = {}
+        if getattr(node, 'wps_index', None) is not None:
+            # We can not trust nodes outside of the index, ``ast`` reuses some:
+            setattr(node, 'wps_closest_parents', closest_parents)  # noqa: B010
+    return closest_parents
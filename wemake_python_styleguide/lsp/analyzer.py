@@ -0,0 +1,129 @@
+import logging
+import operator
+import threading
+import time
+from typing import Callable, Dict, List, Optional, Tuple
+from urllib.parse import urlparse
+from urllib.request import url2pathname
+
+from typing_extensions import Final, final
+
+from wemake_python_styleguide.linter.linter import Linter
+from wemake_python_styleguide.lsp import diagnostics
+from wemake_python_styleguide.lsp.protocol import Message
+
+#: Version and text of an open document.
+Document = Tuple[Optional[int], str]
+
+#: Publishes diagnostics of a document version.
+Publisher = Callable[[str, Optional[int], List[Message]], None]
+
+_LOG: Final = logging.getLogger(__name__)
+
+
+@final
+class _DocumentChecker(object):
+    """Checks texts of documents, options are parsed again when outdated."""
+
+    def __init__(self, linter_factory: Callable[[], Linter]) -> None:
+        self._linter_factory = linter_factory
+        self._linter = linter_factory()
+
+    def check(self, uri: str, text: str) -> List[Message]:
+        """Returns diagnostics of a document text."""
+        if self._linter.is_outdated():
+            self._linter = self._linter_factory()
+        self._linter.prepare()
+
+        filename = url2pathname(urlparse(uri).path)
+        lines = text.splitlines(keepends=True)
+        return diagnostics.make_diagnostics(
+            self._linter.options,
+            filename,
+            lines,
+            self._linter.check_module(filename, lines),
+        )
+
+
+@final
+class Analyzer(object):
+    """
+    Checks open documents in its own thread, only their latest versions.
+
+    Each change postpones the check of a document by the debounce delay.
+    So, we do not check documents while they are typed.
+    Results of stale versions are dropped instead of being published.
+    """
+
+    def __init__(
+        self,
+        linter_factory: Callable[[], Linter],
+        publish: Publisher,
+        debounce: float,
+    ) -> None:
+        """Creates the first linter, so invalid options are found early."""
+        self._document_checker = _DocumentChecker(linter_factory)
+        self._publish = publish
+        self._debounce = debounce
+
+        self._documents: Dict[str, Document] = {}
+        self._deadlines: Dict[str, float] = {}
+        self._condition = threading.Condition()
+        self._is_stopped = False
+
+    def update(self, uri: str, version: Optional[int], text: str) -> None:
+        """Keeps the new text of a document and postpones its check."""
+        with self._condition:
+            self._documents[uri] = (version, text)
+            self._deadlines[uri] = time.monotonic() + self._debounce
+            self._condition.notify()
+
+    def close(self, uri: str) -> None:
+        """Forgets a document and clears its diagnostics."""
+        with self._condition:
+            self._documents.pop(uri, None)
+            self._deadlines.pop(uri, None)
+            self._publish(uri, None, [])
+
+    def stop(self) -> None:
+        """Stops checks, the current one is finished first."""
+        with self._condition:
+            self._is_stopped = True
+            self._condition.notify()
+
+    def run(self) -> None:
+        """Checks documents until it is stopped."""
+        next_document = self._next_document()
+        while next_document is not None:
+            self._check(*next_document)
+            next_document = self._next_document()
+
+    def _next_document(self) -> Optional[Tuple[str, Document]]:
+        with self._condition:
+            while not self._is_stopped:
+                if not self._deadlines:
+                    self._condition.wait()
+                    continue
+
+                uri, deadline = min(
+                    self._deadlines.items(), key=operator.itemgetter(1),
+                )
+                delay = deadline - time.monotonic()
+                if delay <= 0:
+                    self._deadlines.pop(uri)
+                    return uri, self._documents[uri]
+                self._condition.wait(delay)
+        return None
+
+    def _check(self, uri: str, document: Document) -> None:
+        version, text = document
+        try:
+            module_diagnostics = self._document_checker.check(uri, text)
+        except BaseException:  # noqa: WPS424
+            # Broken options must not stop checks of other versions:
+            _LOG.exception('Failed to check {0}'.format(uri))
+            return
+
+        with self._condition:
+            if self._documents.get(uri) is document:  # not changed or closed
+                self._publish(uri, version, module_diagnostics)
@@ -0,0 +1,106 @@
+import argparse
+import copy
+from typing import Iterable, List, Sequence
+
+from flake8 import style_guide
+from flake8.formatting import base
+from typing_extensions import Final, final
+
+from wemake_python_styleguide.formatter import DOCS_URL_TEMPLATE
+from wemake_python_styleguide.linter.modules import ModuleResult
+from wemake_python_styleguide.lsp.protocol import Message
+from wemake_python_styleguide.version import pkg_version
+
+_CODE_PREFIX: Final = 'WPS'
+
+#: Our violations are not errors, code still works with them.
+_WARNING_SEVERITY: Final = 2
+
+#: Documentation pages of our violations, by hundreds of their codes.
+_VIOLATION_PAGES: Final = (
+    'system',
+    'naming',
+    'complexity',
+    'consistency',
+    'best_practices',
+    'refactoring',
+    'oop',
+)
+
+
+@final
+class _Collector(base.BaseFormatter):
+    """Keeps selected violations instead of writing them."""
+
+    def after_init(self) -> None:
+        """Creates an empty list of violations."""
+        self.violations: List[style_guide.Violation] = []
+
+    def handle(self, error: style_guide.Violation) -> None:  # noqa: WPS110
+        """Keeps a violation that was not ignored."""
+        self.violations.append(error)
+
+
+def _select_violations(
+    options: argparse.Namespace,
+    filename: str,
+    module_results: Iterable[ModuleResult],
+) -> List[style_guide.Violation]:
+    collector_options = copy.copy(options)
+    collector_options.output_file = None
+    collector = _Collector(collector_options)
+    guide = style_guide.StyleGuideManager(options, collector)
+    with guide.processing_file(filename):
+        for error_code, *error_details in module_results:
+            guide.handle_error(error_code, filename, *error_details)
+    return collector.violations
+
+
+def _make_diagnostic(
+    violation: style_guide.Violation,
+    lines: Sequence[str],
+) -> Message:
+    # Violations of whole modules are reported for the line number zero:
+    line_number = max(violation.line_number - 1, 0)
+    character = max(violation.column_number - 1, 0)
+    end_character = character
+    if line_number < len(lines):  # the whole rest of the line is marked
+        end_character = max(
+            len(lines[line_number].rstrip('\r\n')), character,
+        )
+
+    diagnostic = {
+        'range': {
+            'start': {'line': line_number, 'character': character},
+            'end': {'line': line_number, 'character': end_character},
+        },
+        'severity': _WARNING_SEVERITY,
+        'code': violation.code,
+        'source': 'wemake-python-styleguide',
+        'message': violation.text,
+    }
+    if violation.code.startswith(_CODE_PREFIX):
+        diagnostic['codeDescription'] = {'href': '{0}{1}.html'.format(
+            DOCS_URL_TEMPLATE.format(pkg_version),
+            _VIOLATION_PAGES[int(violation.code[len(_CODE_PREFIX)])],
+        )}
+    return diagnostic
+
+
+def make_diagnostics(
+    options: argparse.Namespace,
+    filename: str,
+    lines: Sequence[str],
+    module_results: Iterable[ModuleResult],
+) -> List[Message]:
+    """
+    Converts results of a module to ``LSP`` diagnostics.
+
+    Results are selected just like ``flake8`` selects them.
+    So, ``noqa`` comments, ``--select``, ``--ignore``,
+    and ``--per-file-ignores`` options work the same way.
+    """
+    return [
+        _make_diagnostic(violation, lines)
+        for violation in _select_violations(options, filename, module_results)
+    ]
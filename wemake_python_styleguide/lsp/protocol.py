@@ -0,0 +1,48 @@
+import json
+import threading
+from typing import Any, BinaryIO, Dict, Optional
+
+from typing_extensions import Final, final
+
+#: Messages are JSON objects, their structure depends on a method.
+Message = Dict[str, Any]
+
+_CONTENT_LENGTH: Final = b'content-length:'
+
+
+@final
+class JsonRpcStream(object):
+    """
+    Reads and writes ``JSON-RPC`` messages with ``LSP`` headers.
+
+    Messages are written from several threads, so writes are serialized.
+    """
+
+    def __init__(self, reader: BinaryIO, writer: BinaryIO) -> None:
+        """Wraps binary streams, like ``stdin`` and ``stdout``."""
+        self._reader = reader
+        self._writer = writer
+        self._write_lock = threading.Lock()
+
+    def read(self) -> Optional[Message]:
+        """Reads the next message, ``None`` when the stream is closed."""
+        content_length = None
+        header = self._reader.readline()
+        while header.strip():
+            if header.lower().startswith(_CONTENT_LENGTH):
+                content_length = int(header[len(_CONTENT_LENGTH):])
+            header = self._reader.readline()
+
+        if content_length is None:
+            return None
+        return json.loads(self._reader.read(content_length))
+
+    def write(self, message: Message) -> None:
+        """Writes a single message with its header."""
+        body = json.dumps({'jsonrpc': '2.0', **message}).encode('utf-8')
+        with self._write_lock:
+            self._writer.write(
+                'Content-Length: {0}\r\n\r\n'.format(len(body)).encode(),
+            )
+            self._writer.write(body)
+            self._writer.flush()
@@ -0,0 +1,176 @@
+"""
+Language server that checks documents while they are edited.
+
+Editors usually run ``flake8`` on each save.
+It is slow, and saved files are needed.
+This server speaks ``LSP`` over ``stdin`` and ``stdout`` instead.
+It keeps open documents in memory and checks their unsaved text,
+see :class:`wemake_python_styleguide.linter.linter.Linter`.
+
+Usage:
+
+.. code:: bash
+
+    python -m wemake_python_styleguide.lsp.server --max-line-complexity=10
+
+The server accepts the same options as ``flake8``.
+Config files are found from its working directory, like ``flake8`` does,
+options are parsed again when any config file is changed.
+
+Documents are checked in a separate thread, so typing is never blocked.
+Each change postpones the check of its document a little,
+and results of stale versions are never published.
+Diagnostics have our violation codes and links to their documentation.
+
+.. _lsp:
+
+Language server API
+-------------------
+
+.. autoclass:: LanguageServer
+   :no-undoc-members:
+
+"""
+
+import contextlib
+import functools
+import sys
+import threading
+from typing import Callable, Dict, List, Optional, Sequence
+
+from typing_extensions import Final, final
+
+from wemake_python_styleguide.linter.linter import Linter
+from wemake_python_styleguide.lsp.analyzer import Analyzer
+from wemake_python_styleguide.lsp.protocol import JsonRpcStream, Message
+from wemake_python_styleguide.version import pkg_version
+
+#: Seconds without changes before a document is checked.
+_DEBOUNCE: Final = 0.3
+
+_METHOD_NOT_FOUND: Final = -32601
+
+#: We always receive full texts of changed documents.
+_FULL_SYNC: Final = 1
+
+
+def _publish_diagnostics(
+    stream: JsonRpcStream,
+    uri: str,
+    version: Optional[int],
+    diagnostics: List[Message],
+) -> None:
+    stream.write({
+        'method': 'textDocument/publishDiagnostics',
+        'params': {'uri': uri, 'version': version, 'diagnostics': diagnostics},
+    })
+
+
+@final
+class LanguageServer(object):
+    """Handles messages of a client, until the ``exit`` notification."""
+
+    def __init__(
+        self,
+        stream: JsonRpcStream,
+        linter_factory: Callable[[], Linter],
+        *,
+        debounce: float = _DEBOUNCE,
+    ) -> None:
+        """Creates a server with its analyzer of open documents."""
+        self._stream = stream
+        self._analyzer = Analyzer(
+            linter_factory,
+            functools.partial(_publish_diagnostics, stream),
+            debounce,
+        )
+        self._is_shut_down = False
+        self._handlers: Dict[str, Callable[[Message], object]] = {
+            'initialize': self._initialize,
+            'shutdown': self._shutdown,
+            'textDocument/didOpen': self._update_document,
+            'textDocument/didChange': self._update_document,
+            'textDocument/didClose': self._close_document,
+        }
+
+    def serve(self) -> int:
+        """
+        Serves messages, returns the exit status.
+
+        Messages are often written to ``stdout``,
+        so everything that is printed meanwhile goes to ``stderr``.
+        For example, tracebacks of failed visitors.
+        """
+        with contextlib.redirect_stdout(sys.stderr):
+            analysis = threading.Thread(
+                target=self._analyzer.run, daemon=True,
+            )
+            analysis.start()
+
+            message = self._stream.read()
+            while message is not None and message.get('method') != 'exit':
+                self._dispatch(message)
+                message = self._stream.read()
+
+            self._analyzer.stop()
+            analysis.join()
+        return int(not self._is_shut_down)
+
+    def _dispatch(self, message: Message) -> None:
+        method = message.get('method')
+        request_id = message.get('id')
+        method_handler = self._handlers.get(method or '')
+        method_params = message.get('params', {})
+        if request_id is None:
+            if method_handler is not None:  # other notifications are ignored
+                method_handler(method_params)
+        elif method_handler is not None:
+            self._stream.write({
+                'id': request_id,
+                'result': method_handler(method_params),
+            })
+        elif method is not None:  # responses to us are not expected
+            self._stream.write({'id': request_id, 'error': {
+                'code': _METHOD_NOT_FOUND,
+                'message': 'Unknown method: {0}'.format(method),
+            }})
+
+    def _initialize(self, method_params: Message) -> Message:
+        return {
+            'capabilities': {
+                'textDocumentSync': {'openClose': True, 'change': _FULL_SYNC},
+            },
+            'serverInfo': {
+                'name': 'wemake-python-styleguide',
+                'version': pkg_version,
+            },
+        }
+
+    def _shutdown(self, method_params: Message) -> None:
+        self._is_shut_down = True
+
+    def _update_document(self, method_params: Message) -> None:
+        text_document = method_params['textDocument']
+        # Opened documents have their text, changed ones have changes:
+        content_changes = method_params.get('contentChanges', [text_document])
+        self._analyzer.update(
+            text_document['uri'],
+            text_document.get('version'),
+            content_changes[-1]['text'],
+        )
+
+    def _close_document(self, method_params: Message) -> None:
+        self._analyzer.close(method_params['textDocument']['uri'])
+
+
+def main(argv: Optional[Sequence[str]] = None) -> int:
+    """Serves ``stdin`` and ``stdout``, returns the exit status."""
+    flake8_argv = sys.argv[1:] if argv is None else argv
+    return LanguageServer(
+        JsonRpcStream(sys.stdin.buffer, sys.stdout.buffer),
+        functools.partial(Linter, flake8_argv, incremental=True),
+    ).serve()
+
+
+if __name__ == '__main__':  # pragma: no cover
+    sys.exit(main())
@@ -135,6 +135,38 @@ You can also show all options that ``flake8`` supports by running:
     from module, defaults to
     :str:`wemake_python_styleguide.options.defaults.MAX_IMPORT_FROM_MEMBERS`
 
+.. rubric:: Runtime options
+
+These options do not change our rules, only how and where they are applied.
+
+- ``fused-visitors`` - whether to walk the ``ast`` tree only once
+    and dispatch each node to all visitors at the same time,
+    defaults to
+    :str:`wemake_python_styleguide.options.defaults.FUSED_VISITORS`
+- ``results-cache-dir`` - directory to store violations of checked modules,
+    unchanged modules are not checked again when it is set, defaults to
+    :str:`wemake_python_styleguide.options.defaults.RESULTS_CACHE_DIR`
+- ``results-cache-size`` - maximum size of the results cache in megabytes,
+    least recently used entries are removed first, defaults to
+    :str:`wemake_python_styleguide.options.defaults.RESULTS_CACHE_SIZE`
+- ``diff-against`` - ``git`` revision to compare the working tree with,
+    only modules and lines changed since this revision are reported
+    when it is set, defaults to
+    :str:`wemake_python_styleguide.options.defaults.DIFF_AGAINST`
+- ``baseline`` - file with known violations of legacy code,
+    these violations are not reported when it is set, defaults to
+    :str:`wemake_python_styleguide.options.defaults.BASELINE`
+- ``baseline-update`` - whether to record all violations
+    to the baseline file instead of reporting them, defaults to
+    :str:`wemake_python_styleguide.options.defaults.BASELINE_UPDATE`
+- ``max-visitor-time`` - seconds that each visitor can spend on a module,
+    slower visitors are stopped when it is set, defaults to
+    :str:`wemake_python_styleguide.options.defaults.MAX_VISITOR_TIME`
+- ``max-module-time`` - seconds that all visitors can spend on a module,
+    visitors are stopped when it is set and the module is out of time,
+    defaults to
+    :str:`wemake_python_styleguide.options.defaults.MAX_MODULE_TIME`
+
 """
 
 from typing import ClassVar, Mapping, Optional, Sequence, Union
@@ -145,7 +177,7 @@ from typing_extensions import final
 
 from wemake_python_styleguide.options import defaults
 
-ConfigValuesTypes = Union[str, int, bool, Sequence[str]]
+ConfigValuesTypes = Union[str, int, float, bool, Sequence[str]]
 
 
 @final
@@ -396,7 +428,67 @@ class Configuration(object):
         ),
     ]
 
+    #: These options change how we run checks, not our rules:
+    _runtime_options: ClassVar[Sequence[_Option]] = [
+        _Option(
+            '--fused-visitors',
+            defaults.FUSED_VISITORS,
+            'Whether to walk the `ast` tree once for all visitors.',
+            action='store_true',
+            type=None,
+        ),
+
+        _Option(
+            '--results-cache-dir',
+            defaults.RESULTS_CACHE_DIR,
+            'Directory to store violations of checked modules.',
+            type='string',
+        ),
+
+        _Option(
+            '--results-cache-size',
+            defaults.RESULTS_CACHE_SIZE,
+            'Maximum size of the results cache in megabytes.',
+        ),
+
+        _Option(
+            '--diff-against',
+            defaults.DIFF_AGAINST,
+            'Git revision to report only changed lines since.',
+            type='string',
+        ),
+
+        _Option(
+            '--baseline',
+            defaults.BASELINE,
+            'File with known violations that are not reported.',
+            type='string',
+        ),
+
+        _Option(
+            '--baseline-update',
+            defaults.BASELINE_UPDATE,
+            'Whether to record all violations to the baseline file.',
+            action='store_true',
+            type=None,
+        ),
+
+        _Option(
+            '--max-visitor-time',
+            defaults.MAX_VISITOR_TIME,
+            'Seconds that each visitor can spend on a module.',
+            type='float',
+        ),
+
+        _Option(
+            '--max-module-time',
+            defaults.MAX_MODULE_TIME,
+            'Seconds that all visitors can spend on a module.',
+            type='float',
+        ),
+    ]
+
     def register_options(self, parser: OptionManager) -> None:
         """Registers options for our plugin."""
-        for option in self._options:
+        for option in (*self._options, *self._runtime_options):
             parser.add_option(**option.asdict_no_none())
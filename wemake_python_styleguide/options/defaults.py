@@ -121,3 +121,32 @@ MAX_ANN_COMPLEXITY: Final = 3  # reasonable enough
 
 #: Maximum number of names that can be imported from module.
 MAX_IMPORT_FROM_MEMBERS: Final = 8  # guessed
+
+
+# ========
+# Runtime:
+# ========
+
+#: Whether to walk the ``ast`` tree once for all visitors.
+FUSED_VISITORS: Final = False
+
+#: Directory to store violations of checked modules, empty to disable.
+RESULTS_CACHE_DIR: Final = ''
+
+#: Maximum size of the results cache in megabytes.
+RESULTS_CACHE_SIZE: Final = 64  # enough for tens of thousands of modules
+
+#: ``git`` revision to report only changed lines since, empty to disable.
+DIFF_AGAINST: Final = ''
+
+#: Baseline file with known violations, empty to disable.
+BASELINE: Final = ''
+
+#: Whether to record all violations to the baseline file.
+BASELINE_UPDATE: Final = False
+
+#: Seconds that each visitor can spend on a module, zero to disable.
+MAX_VISITOR_TIME: Final = 0.0
+
+#: Seconds that all visitors can spend on a module, zero to disable.
+MAX_MODULE_TIME: Final = 0.0
@@ -93,6 +93,16 @@ class _ValidatedOptions(object):
     max_annotation_complexity: int = attr.ib(validator=[_min_max(min=2)])
     max_import_from_members: int = attr.ib(validator=[_min_max(min=1)])
 
+    # Runtime:
+    fused_visitors: bool
+    results_cache_dir: str
+    results_cache_size: int = attr.ib(validator=[_min_max(min=1)])
+    diff_against: str
+    baseline: str
+    baseline_update: bool
+    max_visitor_time: float = attr.ib(validator=[_min_max(min=0)])
+    max_module_time: float = attr.ib(validator=[_min_max(min=0)])
+
 
 def validate_options(options: ConfigurationOptions) -> _ValidatedOptions:
     """Validates all options from ``flake8``, uses a subset of them."""
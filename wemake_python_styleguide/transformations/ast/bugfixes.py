@@ -2,8 +2,14 @@ import ast
 
 from wemake_python_styleguide.logic.nodes import get_parent
 
+_ASYNC_NODES = (
+    ast.AsyncFor,
+    ast.AsyncWith,
+    ast.AsyncFunctionDef,
+)
 
-def fix_async_offset(tree: ast.AST) -> ast.AST:
+
+def fix_async_offset(node: ast.AST) -> None:
     """
     Fixes ``col_offest`` values for async nodes.
 
@@ -19,20 +25,15 @@ def fix_async_offset(tree: ast.AST) -> ast.AST:
         https://bugs.python.org/issue29205
         https://github.com/wemake-services/wemake-python-styleguide/issues/282
 
+    .. versionchanged:: 0.15.0
+
     """
-    nodes_to_fix = (
-        ast.AsyncFor,
-        ast.AsyncWith,
-        ast.AsyncFunctionDef,
-    )
-    for node in ast.walk(tree):
-        if isinstance(node, nodes_to_fix):
-            error = 6 if node.col_offset % 4 else 0
-            node.col_offset = node.col_offset - error
-    return tree
-
-
-def fix_line_number(tree: ast.AST) -> ast.AST:
+    if isinstance(node, _ASYNC_NODES):
+        error = 6 if node.col_offset % 4 else 0
+        node.col_offset = node.col_offset - error
+
+
+def fix_line_number(node: ast.AST) -> None:
     """
     Adjusts line number for some nodes.
 
@@ -43,17 +44,18 @@ def fix_line_number(tree: ast.AST) -> ast.AST:
     an incorrect line number. But, we basically check if there's
     a parent, so we can compare and adjust.
 
+    Parent must be already fixed at this point.
+
     Example::
 
         print((  # should start from here
             1, 2, 3,  # actually starts from here
         ))
 
+    .. versionchanged:: 0.15.0
+
     """
-    affected = (ast.Tuple,)
-    for node in ast.walk(tree):
-        if isinstance(node, affected):
-            parent_lineno = getattr(get_parent(node), 'lineno', None)
-            if parent_lineno and parent_lineno < node.lineno:
-                node.lineno = node.lineno - 1
-    return tree
+    if isinstance(node, ast.Tuple):
+        parent_lineno = getattr(get_parent(node), 'lineno', None)
+        if parent_lineno and parent_lineno < node.lineno:
+            node.lineno = node.lineno - 1
@@ -1,8 +1,8 @@
 import ast
-from typing import Optional, Tuple, Type
+from typing import Tuple, Type
 
 from wemake_python_styleguide.compat.aliases import FunctionNodes
-from wemake_python_styleguide.logic.nodes import get_parent
+from wemake_python_styleguide.logic.nodes import get_context, get_parent
 from wemake_python_styleguide.types import ContextNodes
 
 _CONTEXTS: Tuple[Type[ContextNodes], ...] = (
@@ -12,7 +12,7 @@ _CONTEXTS: Tuple[Type[ContextNodes], ...] = (
 )
 
 
-def set_if_chain(tree: ast.AST) -> ast.AST:
+def set_if_chain(node: ast.AST) -> None:
     """
     Used to create ``if`` chains.
 
@@ -33,14 +33,15 @@ def set_if_chain(tree: ast.AST) -> ast.AST:
 
     Since they are very similar it very hard to make a different when
     actually working with nodes. So, we need a simple way to separate them.
+
+    .. versionchanged:: 0.15.0
+
     """
-    for statement in ast.walk(tree):
-        if isinstance(statement, ast.If):
-            _apply_if_statement(statement)
-    return tree
+    if isinstance(node, ast.If):
+        _apply_if_statement(node)
 
 
-def set_node_context(tree: ast.AST) -> ast.AST:
+def set_node_context(node: ast.AST) -> None:
     """
     Used to set proper context to all nodes.
 
@@ -62,31 +63,19 @@ def set_node_context(tree: ast.AST) -> ast.AST:
     - :py:class:`ast.ClassDef`
     - :py:class:`ast.FunctionDef` and :py:class:`ast.AsyncFunctionDef`
 
-    .. versionchanged:: 0.8.1
-
-    """
-    for statement in ast.walk(tree):
-        current_context = _find_context(statement, _CONTEXTS)
-        setattr(statement, 'wps_context', current_context)  # noqa: B010
-    return tree
-
+    We pass contexts down from parents, so parent's context
+    must be already set at this point.
 
-def _find_context(
-    node: ast.AST,
-    contexts: Tuple[Type[ast.AST], ...],
-) -> Optional[ast.AST]:
-    """
-    We changed how we find and assign contexts in 0.8.1 version.
+    .. versionchanged:: 0.8.1
+    .. versionchanged:: 0.15.0
 
-    It happened because of the bug #520
-    See: https://github.com/wemake-services/wemake-python-styleguide/issues/520
     """
     parent = get_parent(node)
-    if parent is None:
-        return None
-    elif isinstance(parent, contexts):
-        return parent
-    return _find_context(parent, contexts)
+    if parent is None or isinstance(parent, _CONTEXTS):
+        current_context = parent
+    else:
+        current_context = get_context(parent)
+    setattr(node, 'wps_context', current_context)  # noqa: B010
 
 
 def _apply_if_statement(statement: ast.If) -> None:
@@ -1,8 +1,10 @@
 import ast
+from typing import List, Sequence
 
 from pep8ext_naming import NamingChecker
-from typing_extensions import final
 
+from wemake_python_styleguide.logic.index import NodeIndex
+from wemake_python_styleguide.logic.source import SourceSegments
 from wemake_python_styleguide.transformations.ast.bugfixes import (
     fix_async_offset,
     fix_line_number,
@@ -13,22 +15,9 @@ from wemake_python_styleguide.transformations.ast.enhancements import (
 )
 
 
-@final
-class _ClassVisitor(ast.NodeVisitor):
-    """Used to set method types inside classes."""
-
-    def __init__(self, transformer: NamingChecker) -> None:
-        super().__init__()
-        self.transformer = transformer
-
-    def visit_ClassDef(self, node: ast.ClassDef) -> None:  # noqa: N802
-        self.transformer.tag_class_functions(node)
-        self.generic_visit(node)
-
-
-def _set_parent(tree: ast.AST) -> ast.AST:
+def _set_children_parent(node: ast.AST) -> List[ast.AST]:
     """
-    Sets parents for all nodes that do not have this prop.
+    Sets parent for all children of the given node and returns them.
 
     This step is required due to how `flake8` works.
     It does not set the same properties as `ast` module.
@@ -39,54 +28,83 @@ def _set_parent(tree: ast.AST) -> ast.AST:
 
     .. versionchanged:: 0.0.11
     .. versionchanged:: 0.6.1
+    .. versionchanged:: 0.15.0
 
     """
-    for statement in ast.walk(tree):
-        for child in ast.iter_child_nodes(statement):
-            setattr(child, 'wps_parent', statement)  # noqa: B010
-    return tree
+    children = list(ast.iter_child_nodes(node))
+    for child in children:
+        setattr(child, 'wps_parent', node)  # noqa: B010
+    return children
 
 
-def _set_function_type(tree: ast.AST) -> ast.AST:
+def _set_function_type(node: ast.AST, naming: NamingChecker) -> None:
     """
     Sets the function type for methods.
 
     Can set: `method`, `classmethod`, `staticmethod`.
 
     .. versionchanged:: 0.3.0
+    .. versionchanged:: 0.15.0
 
     """
-    transformer = _ClassVisitor(NamingChecker(tree, 'stdin'))
-    transformer.visit(tree)
-    return tree
-
-
-def transform(tree: ast.AST) -> ast.AST:
+    if isinstance(node, ast.ClassDef):
+        naming.tag_class_functions(node)
+
+
+def _transform_node(
+    node: ast.AST,
+    naming: NamingChecker,
+    index: NodeIndex,
+    *,
+    pending: int,
+) -> List[ast.AST]:
+    """Applies all transformations to a single node, returns its children."""
+    # Initial, should be the first ones, ordering inside is important:
+    children = _set_children_parent(node)
+    index.add(node, is_leaf=not children, pending=pending)
+    _set_function_type(node, naming)
+
+    # Bugfixes, order is not important:
+    fix_async_offset(node)
+    fix_line_number(node)
+
+    # Enhancements, order is not important:
+    set_node_context(node)
+    set_if_chain(node)
+    return children
+
+
+def transform(tree: ast.AST, lines: Sequence[str] = ()) -> ast.AST:
     """
     Mutates the given ``ast`` tree.
 
-    Applies all possible transformations.
+    Applies all possible transformations in a single tree walk.
+    Nodes are visited in pre-order,
+    so each node can rely on its parent being already transformed.
+    We also build the index of all nodes by their types here.
+
+    Source ``lines`` of the module are used
+    to show the original source code in violation messages.
 
-    Ordering:
+    Ordering for each node:
     - initial ones
     - bugfixes
     - enhancements
 
+    .. versionchanged:: 0.15.0
+
     """
-    pipeline = (
-        # Initial, should be the first ones, ordering inside is important:
-        _set_parent,
-        _set_function_type,
-
-        # Bugfixes, order is not important:
-        fix_async_offset,
-        fix_line_number,
-
-        # Enhancements, order is not important:
-        set_node_context,
-        set_if_chain,
+    naming = NamingChecker(tree, 'stdin')
+    index = NodeIndex()
+    nodes_to_transform = [tree]
+    while nodes_to_transform:
+        node = nodes_to_transform.pop()
+        children = _transform_node(
+            node, naming, index, pending=len(nodes_to_transform),
+        )
+        nodes_to_transform.extend(reversed(children))
+
+    setattr(  # noqa: B010
+        tree, 'wps_source_segments', SourceSegments(lines),
     )
-
-    for tranformation in pipeline:
-        tree = tranformation(tree)
     return tree
@@ -244,3 +244,36 @@ class ConfigurationOptions(Protocol):
     @property
     def max_import_from_members(self) -> int:
         ...
+
+    # Runtime:
+    @property
+    def fused_visitors(self) -> bool:
+        ...
+
+    @property
+    def results_cache_dir(self) -> str:
+        ...
+
+    @property
+    def results_cache_size(self) -> int:
+        ...
+
+    @property
+    def diff_against(self) -> str:
+        ...
+
+    @property
+    def baseline(self) -> str:
+        ...
+
+    @property
+    def baseline_update(self) -> bool:
+        ...
+
+    @property
+    def max_visitor_time(self) -> float:
+        ...
+
+    @property
+    def max_module_time(self) -> float:
+        ...
@@ -52,6 +52,7 @@ Reference
 import abc
 import ast
 import enum
+import hashlib
 import tokenize
 from typing import Callable, ClassVar, Optional, Set, Tuple, Union
 
@@ -143,6 +144,36 @@ class BaseViolation(object, metaclass=abc.ABCMeta):
         """Returns tuple to match ``flake8`` API format."""
         return (*self._location(), self.message())
 
+    @final
+    def fingerprint(self) -> str:
+        """
+        Returns short hash of the violation that does not use its location.
+
+        It is made of the code, the text, and the node of this violation.
+        Nodes of compound statements are represented only by their names,
+        since their bodies change too often.
+        Messages are not formatted, so this is cheaper than ``message()``.
+
+        .. versionadded:: 0.15.0
+
+        """
+        node = self._node
+        if isinstance(node, tokenize.TokenInfo):
+            node_source = node.string
+        elif isinstance(node, ast.AST) and getattr(node, 'body', None) is None:
+            node_source = ast.dump(node)
+        else:
+            node_source = '{0} {1}'.format(
+                type(node).__qualname__, getattr(node, 'name', ''),
+            )
+        fingerprint = '\0'.join((
+            self._full_code(), self._text or '', node_source,
+        ))
+        return hashlib.blake2b(
+            fingerprint.encode('utf-8', errors='surrogatepass'),
+            digest_size=8,
+        ).hexdigest()
+
     @final
     def _full_code(self) -> str:
         """
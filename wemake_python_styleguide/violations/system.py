@@ -14,11 +14,13 @@ Summary
    :nosignatures:
 
    InternalErrorViolation
+   TimeoutViolation
 
 Respect your objects
 --------------------
 
 .. autoclass:: InternalErrorViolation
+.. autoclass:: TimeoutViolation
 
 """
 
@@ -46,3 +48,30 @@ class InternalErrorViolation(SimpleViolation):
         'Internal error happened, see log. Please, take some time to report it'
     )
     code = 0
+
+
+@final
+class TimeoutViolation(SimpleViolation):
+    """
+    Happens when a visitor runs out of its time budget.
+
+    Some modules, usually generated ones, make our visitors very slow.
+    When ``--max-visitor-time`` or ``--max-module-time`` option is set,
+    slow visitors are stopped. Other visitors still check the module.
+    We report the name of the stopped visitor and the time it took.
+    Time budgets are not set by default.
+
+    Reasoning:
+        Violations of the stopped visitor might be missing.
+
+    Solution:
+        Exclude generated modules or increase the time budget.
+
+    See :ref:`watchdog <watchdog>` for how visitors are stopped.
+
+    .. versionadded:: 0.15.0
+
+    """
+
+    error_template = 'Found a check that is stopped for taking too long: {0}'
+    code = 1
@@ -68,6 +68,9 @@ class BlockVariableVisitor(base.BaseNodeVisitor):
 
     """
 
+    # Block variables are compared with names from the whole module:
+    module_scoped = True
+
     _naming_predicates: Tuple[_NamePredicate, ...] = (
         predicates.is_property_setter,
         predicates.is_function_overload,
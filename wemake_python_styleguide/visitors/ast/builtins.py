@@ -1,7 +1,7 @@
 import ast
 import re
 import string
-from collections import Counter, Hashable, defaultdict
+from collections import Hashable, defaultdict
 from contextlib import suppress
 from typing import (
     ClassVar,
@@ -23,7 +23,12 @@ from wemake_python_styleguide.compat.aliases import (
     FunctionNodes,
     TextNodes,
 )
-from wemake_python_styleguide.logic import nodes, safe_eval, source
+from wemake_python_styleguide.logic import (
+    fingerprints,
+    nodes,
+    safe_eval,
+    source,
+)
 from wemake_python_styleguide.logic.naming.name_nodes import extract_name
 from wemake_python_styleguide.logic.tree import operators, strings
 from wemake_python_styleguide.types import AnyFor, AnyNodes, AnyText, AnyWith
@@ -32,6 +37,7 @@ from wemake_python_styleguide.visitors import base, decorators
 
 #: Items that can be inside a hash.
 _HashItems = Sequence[Optional[ast.AST]]
+_SimilarElements = DefaultDict[fingerprints.Fingerprint, List[ast.AST]]
 
 
 @final
@@ -371,7 +377,7 @@ class WrongCollectionVisitor(base.BaseNodeVisitor):
         node: Union[ast.Set, ast.Dict],
         keys_or_elts: _HashItems,
     ) -> None:
-        elements: List[str] = []
+        elements: _SimilarElements = defaultdict(list)
         element_values = []
 
         for set_item in keys_or_elts:
@@ -381,8 +387,9 @@ class WrongCollectionVisitor(base.BaseNodeVisitor):
             real_item = operators.unwrap_unary_node(set_item)
             if isinstance(real_item, self._elements_in_sets):
                 # Similar look:
-                node_repr = source.node_to_string(set_item)
-                elements.append(node_repr.strip().strip('(').strip(')'))
+                elements[fingerprints.get_fingerprint(set_item)].append(
+                    set_item,
+                )
 
             real_item = operators.unwrap_starred_node(real_item)
 
@@ -402,14 +409,17 @@ class WrongCollectionVisitor(base.BaseNodeVisitor):
     def _report_set_elements(
         self,
         node: Union[ast.Set, ast.Dict],
-        elements: List[str],
+        elements: _SimilarElements,
         element_values,
     ) -> None:
-        for look_element, look_count in Counter(elements).items():
-            if look_count > 1:
+        for same_elements in elements.values():
+            if len(same_elements) > 1:
+                node_repr = source.get_source_segment(
+                    self.tree, same_elements[0],
+                )
                 self.add_violation(
                     best_practices.NonUniqueItemsInHashViolation(
-                        node, text=look_element,
+                        node, text=node_repr.strip('(').strip(')'),
                     ),
                 )
                 return
@@ -1,13 +1,13 @@
 import ast
 from collections import defaultdict
-from typing import ClassVar, DefaultDict, FrozenSet, List, Optional
+from typing import ClassVar, DefaultDict, FrozenSet, List, Optional, Union, cast
 
 from typing_extensions import final
 
 from wemake_python_styleguide import constants, types
 from wemake_python_styleguide.compat.aliases import AssignNodes, FunctionNodes
 from wemake_python_styleguide.compat.functions import get_assign_targets
-from wemake_python_styleguide.logic import nodes, source, walk
+from wemake_python_styleguide.logic import fingerprints, nodes, walk
 from wemake_python_styleguide.logic.arguments import function_args, super_args
 from wemake_python_styleguide.logic.naming import access, name_nodes
 from wemake_python_styleguide.logic.tree import (
@@ -20,6 +20,9 @@ from wemake_python_styleguide.violations import best_practices as bp
 from wemake_python_styleguide.violations import consistency, oop
 from wemake_python_styleguide.visitors import base, decorators
 
+#: Slots are named by strings, starred items are compared by their structure.
+_SlotName = Union[str, fingerprints.Fingerprint]
+
 
 @final
 class WrongClassVisitor(base.BaseNodeVisitor):
@@ -286,7 +289,7 @@ class WrongSlotsVisitor(base.BaseNodeVisitor):
         node: types.AnyAssign,
         elements: ast.Tuple,
     ) -> None:
-        fields: DefaultDict[str, List[ast.AST]] = defaultdict(list)
+        fields: DefaultDict[_SlotName, List[ast.AST]] = defaultdict(list)
 
         for tuple_item in elements.elts:
             slot_name = self._slot_item_name(tuple_item)
@@ -314,11 +317,11 @@ class WrongSlotsVisitor(base.BaseNodeVisitor):
         if isinstance(node.value, ast.Tuple):
             self._count_slots_items(node, node.value)
 
-    def _slot_item_name(self, node: ast.AST) -> Optional[str]:
+    def _slot_item_name(self, node: ast.AST) -> Optional[_SlotName]:
         if isinstance(node, ast.Str):
             return node.s
         if isinstance(node, ast.Starred):
-            return source.node_to_string(node)
+            return fingerprints.get_fingerprint(node)
         return None
 
     def _are_correct_slots(self, slots: List[ast.AST]) -> bool:
@@ -378,10 +381,9 @@ class ClassMethodOrderVisitor(base.BaseNodeVisitor):
     def _check_method_order(self, node: ast.ClassDef) -> None:
         method_nodes: List[str] = []
 
-        for subnode in ast.walk(node):
-            if isinstance(subnode, FunctionNodes):
-                if nodes.get_context(subnode) == node:
-                    method_nodes.append(subnode.name)
+        for subnode in walk.get_subnodes(node, FunctionNodes):
+            if nodes.get_context(subnode) == node:
+                method_nodes.append(cast(types.AnyFunctionDef, subnode).name)
 
         ideal = sorted(method_nodes, key=self._ideal_order, reverse=True)
         for existing_order, ideal_order in zip(method_nodes, ideal):
@@ -5,7 +5,7 @@ from typing_extensions import final
 
 from wemake_python_styleguide.compat.aliases import AssignNodes, TextNodes
 from wemake_python_styleguide.compat.functions import get_assign_targets
-from wemake_python_styleguide.logic import nodes, source, walk
+from wemake_python_styleguide.logic import fingerprints, nodes, walk
 from wemake_python_styleguide.logic.naming.name_nodes import is_same_variable
 from wemake_python_styleguide.logic.tree import (
     compares,
@@ -365,7 +365,7 @@ class WrongConditionalVisitor(BaseNodeVisitor):
     def _is_simplifiable_assign(
         self,
         node_body: List[ast.stmt],
-    ) -> Optional[str]:
+    ) -> Optional[fingerprints.Fingerprint]:
         wrong_length = len(node_body) != 1
         if wrong_length or not isinstance(node_body[0], AssignNodes):
             return None
@@ -378,7 +378,7 @@ class WrongConditionalVisitor(BaseNodeVisitor):
         if len(targets) != 1:
             return None
 
-        return source.node_to_string(targets[0])
+        return fingerprints.get_fingerprint(targets[0])
 
 
 @final
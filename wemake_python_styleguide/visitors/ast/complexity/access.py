@@ -16,6 +16,8 @@ from wemake_python_styleguide.visitors.base import BaseNodeVisitor
 class AccessVisitor(BaseNodeVisitor):
     """Counts access number for expressions."""
 
+    used_options = frozenset(('max_access_level',))
+
     _access_nodes: ClassVar[AnyNodes] = (
         ast.Attribute,
         ast.Subscript,
@@ -23,6 +23,8 @@ from wemake_python_styleguide.visitors.decorators import alias
 class AnnotationComplexityVisitor(BaseNodeVisitor):
     """Ensures that annotations are used correctly."""
 
+    used_options = frozenset(('max_annotation_complexity',))
+
     def visit_any_function(self, node: AnyFunctionDef) -> None:
         """
         Checks return type annotations.
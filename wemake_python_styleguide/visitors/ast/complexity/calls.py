@@ -15,6 +15,8 @@ from wemake_python_styleguide.visitors.base import BaseNodeVisitor
 class CallChainsVisitor(BaseNodeVisitor):
     """Counts number of consecutive calls."""
 
+    used_options = frozenset(('max_call_level',))
+
     def __init__(self, *args, **kwargs) -> None:
         """Keeps visited calls to not visit them again."""
         super().__init__(*args, **kwargs)
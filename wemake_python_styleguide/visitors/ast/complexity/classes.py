@@ -21,6 +21,11 @@ from wemake_python_styleguide.visitors.decorators import alias
 class ClassComplexityVisitor(BaseNodeVisitor):
     """Checks class complexity."""
 
+    used_options = frozenset((
+        'max_attributes',
+        'max_base_classes',
+    ))
+
     def visit_ClassDef(self, node: ast.ClassDef) -> None:
         """
         Checking class definitions.
@@ -83,6 +88,8 @@ class ClassComplexityVisitor(BaseNodeVisitor):
 class MethodMembersVisitor(BaseNodeVisitor):
     """Counts methods in a single class."""
 
+    used_options = frozenset(('max_methods',))
+
     def __init__(self, *args, **kwargs) -> None:
         """Creates a counter for tracked methods in different classes."""
         super().__init__(*args, **kwargs)
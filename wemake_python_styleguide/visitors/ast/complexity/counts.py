@@ -1,5 +1,5 @@
 import ast
-from collections import defaultdict
+from collections import Counter, defaultdict
 from typing import DefaultDict, List, Union
 
 from typing_extensions import final
@@ -14,7 +14,10 @@ from wemake_python_styleguide.types import (
 )
 from wemake_python_styleguide.violations import complexity
 from wemake_python_styleguide.violations.base import ErrorCallback
-from wemake_python_styleguide.visitors.base import BaseNodeVisitor
+from wemake_python_styleguide.visitors.base import (
+    BaseNodeVisitor,
+    ModuleStatistics,
+)
 from wemake_python_styleguide.visitors.decorators import alias
 
 _ConditionNodes = Union[ast.If, ast.While, ast.IfExp]
@@ -30,6 +33,11 @@ _ModuleMembers = Union[AnyFunctionDef, ast.ClassDef]
 class ModuleMembersVisitor(BaseNodeVisitor):
     """Counts classes and functions in a module."""
 
+    used_options = frozenset((
+        'max_decorators',
+        'max_module_members',
+    ))
+
     def __init__(self, *args, **kwargs) -> None:
         """Creates a counter for tracked metrics."""
         super().__init__(*args, **kwargs)
@@ -65,11 +73,15 @@ class ModuleMembersVisitor(BaseNodeVisitor):
                 ),
             )
 
-    def _post_visit(self) -> None:
-        if self._public_items_count > self.options.max_module_members:
+    def _get_statistics(self) -> ModuleStatistics:
+        return Counter(members=self._public_items_count)
+
+    def _check_statistics(self, statistics: ModuleStatistics) -> None:
+        public_items_count = statistics['members']
+        if public_items_count > self.options.max_module_members:
             self.add_violation(
                 complexity.TooManyModuleMembersViolation(
-                    text=str(self._public_items_count),
+                    text=str(public_items_count),
                     baseline=self.options.max_module_members,
                 ),
             )
@@ -106,6 +118,12 @@ class _ImportFromMembersValidator(object):
 class ImportMembersVisitor(BaseNodeVisitor):
     """Counts imports in a module."""
 
+    used_options = frozenset((
+        'max_import_from_members',
+        'max_imported_names',
+        'max_imports',
+    ))
+
     def __init__(self, *args, **kwargs) -> None:
         """Creates a counter for tracked metrics."""
         super().__init__(*args, **kwargs)
@@ -145,28 +163,29 @@ class ImportMembersVisitor(BaseNodeVisitor):
         self._imported_names_count += len(node.names)
         self.generic_visit(node)
 
-    def _check_imports_count(self) -> None:
-        if self._imports_count > self.options.max_imports:
+    def _get_statistics(self) -> ModuleStatistics:
+        return Counter(
+            imports=self._imports_count,
+            imported_names=self._imported_names_count,
+        )
+
+    def _check_statistics(self, statistics: ModuleStatistics) -> None:
+        if statistics['imports'] > self.options.max_imports:
             self.add_violation(
                 complexity.TooManyImportsViolation(
-                    text=str(self._imports_count),
+                    text=str(statistics['imports']),
                     baseline=self.options.max_imports,
                 ),
             )
 
-    def _check_imported_names_count(self) -> None:
-        if self._imported_names_count > self.options.max_imported_names:
+        if statistics['imported_names'] > self.options.max_imported_names:
             self.add_violation(
                 complexity.TooManyImportedNamesViolation(
-                    text=str(self._imported_names_count),
+                    text=str(statistics['imported_names']),
                     baseline=self.options.max_imported_names,
                 ),
             )
 
-    def _post_visit(self) -> None:
-        self._check_imports_count()
-        self._check_imported_names_count()
-
 
 @final
 class ConditionsVisitor(BaseNodeVisitor):
@@ -292,6 +311,8 @@ class ElifVisitor(BaseNodeVisitor):
 class TryExceptVisitor(BaseNodeVisitor):
     """Visits all try/except nodes to ensure that they are not too complex."""
 
+    used_options = frozenset(('max_try_body_length',))
+
     def visit_Try(self, node: ast.Try) -> None:
         """
         Ensures that try/except is correct.
@@ -1,5 +1,5 @@
 import ast
-from collections import defaultdict
+from collections import Counter, defaultdict
 from typing import ClassVar, DefaultDict, List, Mapping, Tuple, Type, Union
 
 from typing_extensions import final
@@ -24,7 +24,10 @@ from wemake_python_styleguide.violations.complexity import (
     TooManyLocalsViolation,
     TooManyReturnsViolation,
 )
-from wemake_python_styleguide.visitors.base import BaseNodeVisitor
+from wemake_python_styleguide.visitors.base import (
+    BaseNodeVisitor,
+    ModuleStatistics,
+)
 from wemake_python_styleguide.visitors.decorators import alias
 
 _FunctionCounter = DefaultDict[AnyFunctionDef, int]
@@ -129,6 +132,15 @@ class FunctionComplexityVisitor(BaseNodeVisitor):
 
     """
 
+    used_options = frozenset((
+        'max_arguments',
+        'max_asserts',
+        'max_awaits',
+        'max_expressions',
+        'max_local_variables',
+        'max_returns',
+    ))
+
     def __init__(self, *args, **kwargs) -> None:
         """Creates a counter for tracked metrics."""
         super().__init__(*args, **kwargs)
@@ -227,6 +239,11 @@ class FunctionComplexityVisitor(BaseNodeVisitor):
 class CognitiveComplexityVisitor(BaseNodeVisitor):
     """Used to count cognitive score and average module complexity."""
 
+    used_options = frozenset((
+        'max_cognitive_average',
+        'max_cognitive_score',
+    ))
+
     def __init__(self, *args, **kwargs) -> None:
         """We use to save all functions' complexity here."""
         super().__init__(*args, **kwargs)
@@ -245,13 +262,7 @@ class CognitiveComplexityVisitor(BaseNodeVisitor):
         self.generic_visit(node)
 
     def _post_visit(self) -> None:
-        if not self._functions:
-            return  # module can be empty
-
-        total = 0
         for function, score in self._functions.items():
-            total += score
-
             if score > self.options.max_cognitive_score:
                 self.add_violation(
                     CognitiveComplexityViolation(
@@ -261,7 +272,17 @@ class CognitiveComplexityVisitor(BaseNodeVisitor):
                     ),
                 )
 
-        average = total / len(self._functions)
+    def _get_statistics(self) -> ModuleStatistics:
+        return Counter(
+            functions=len(self._functions),
+            total=sum(self._functions.values()),
+        )
+
+    def _check_statistics(self, statistics: ModuleStatistics) -> None:
+        if not statistics['functions']:
+            return  # module can be empty
+
+        average = statistics['total'] / statistics['functions']
         if average > self.options.max_cognitive_average:
             self.add_violation(
                 CognitiveModuleComplexityViolation(
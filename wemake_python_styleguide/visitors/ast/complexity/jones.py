@@ -8,9 +8,9 @@ Original project is licensed under MIT.
 """
 
 import ast
-from collections import defaultdict
+from collections import Counter, defaultdict
 from statistics import median
-from typing import DefaultDict, List
+from typing import DefaultDict, List, cast
 
 from typing_extensions import final
 
@@ -19,7 +19,10 @@ from wemake_python_styleguide.violations.complexity import (
     JonesScoreViolation,
     LineComplexityViolation,
 )
-from wemake_python_styleguide.visitors.base import BaseNodeVisitor
+from wemake_python_styleguide.visitors.base import (
+    BaseNodeVisitor,
+    ModuleStatistics,
+)
 
 
 @final
@@ -36,6 +39,11 @@ class JonesComplexityVisitor(BaseNodeVisitor):
     so we do not count them.
     """
 
+    used_options = frozenset((
+        'max_jones_score',
+        'max_line_complexity',
+    ))
+
     _ignored_nodes = (
         ast.ClassDef,
         *FunctionNodes,
@@ -70,10 +78,9 @@ class JonesComplexityVisitor(BaseNodeVisitor):
 
     def _post_visit(self) -> None:
         """
-        Triggers after the whole module was processed.
+        Triggers after the whole module or its part was processed.
 
         Checks each line for its complexity, compares it to the tresshold.
-        We also calculate the final Jones score for the whole module.
         """
         for line_nodes in self._lines.values():
             complexity = len(line_nodes)
@@ -86,7 +93,13 @@ class JonesComplexityVisitor(BaseNodeVisitor):
                     ),
                 )
 
-        node_counts = [len(nodes) for nodes in self._lines.values()]
+    def _get_statistics(self) -> ModuleStatistics:
+        # We only need the number of lines with each complexity for the median:
+        return Counter(len(line_nodes) for line_nodes in self._lines.values())
+
+    def _check_statistics(self, statistics: ModuleStatistics) -> None:
+        """We calculate the final Jones score for the whole module."""
+        node_counts = [cast(int, count) for count in statistics.elements()]
         total_count = median(node_counts) if node_counts else 0
 
         if total_count > self.options.max_jones_score:
@@ -30,6 +30,8 @@ class NestedComplexityVisitor(BaseNodeVisitor):
     We allow to nest function inside classes, that's called methods.
     """
 
+    used_options = frozenset(('nested_classes_whitelist',))
+
     def visit_ClassDef(self, node: ast.ClassDef) -> None:
         """
         Used to find nested classes in other classes and functions.
@@ -1,18 +1,18 @@
 import ast
-from collections import defaultdict
-from typing import Callable, ClassVar, DefaultDict, List, Tuple
+from collections import Counter, defaultdict
+from typing import Callable, ClassVar, DefaultDict, List, Tuple, cast
 
 from typing_extensions import final
 
 from wemake_python_styleguide.compat.aliases import FunctionNodes
-from wemake_python_styleguide.logic import source, walk
+from wemake_python_styleguide.logic import fingerprints, source, walk
 from wemake_python_styleguide.logic.complexity import overuses
 from wemake_python_styleguide.types import AnyNodes, AnyText, AnyTextPrimitive
 from wemake_python_styleguide.violations import complexity
 from wemake_python_styleguide.visitors import base, decorators
 
 #: We use these types to store the number of nodes usage in different contexts.
-_Expressions = DefaultDict[str, List[ast.AST]]
+_Expressions = DefaultDict[fingerprints.Fingerprint, List[ast.AST]]
 _FunctionExpressions = DefaultDict[ast.AST, _Expressions]
 
 
@@ -24,6 +24,8 @@ _FunctionExpressions = DefaultDict[ast.AST, _Expressions]
 class StringOveruseVisitor(base.BaseNodeVisitor):
     """Restricts several string usages."""
 
+    used_options = frozenset(('max_string_usages',))
+
     def __init__(self, *args, **kwargs) -> None:
         """Inits the counter for constants."""
         super().__init__(*args, **kwargs)
@@ -48,12 +50,17 @@ class StringOveruseVisitor(base.BaseNodeVisitor):
 
         self._string_constants[node.s] += 1
 
-    def _post_visit(self) -> None:
-        for string, usage_count in self._string_constants.items():
+    def _get_statistics(self) -> base.ModuleStatistics:
+        return Counter(self._string_constants)
+
+    def _check_statistics(self, statistics: base.ModuleStatistics) -> None:
+        for string, usage_count in statistics.items():
             if usage_count > self.options.max_string_usages:
                 self.add_violation(
                     complexity.OverusedStringViolation(
-                        text=source.render_string(string) or "''",
+                        text=source.render_string(
+                            cast(AnyTextPrimitive, string),
+                        ) or "''",
                         baseline=self.options.max_string_usages,
                     ),
                 )
@@ -63,6 +70,14 @@ class StringOveruseVisitor(base.BaseNodeVisitor):
 class ExpressionOveruseVisitor(base.BaseNodeVisitor):
     """Finds overused expressions."""
 
+    used_options = frozenset((
+        'max_function_expressions',
+        'max_module_expressions',
+    ))
+
+    # Module expressions are counted together with expressions in functions:
+    module_scoped = True
+
     _expressions: ClassVar[AnyNodes] = (
         # We do not treat `ast.Attribute`s as expressions
         # because they are too widely used. That's a compromise.
@@ -120,33 +135,42 @@ class ExpressionOveruseVisitor(base.BaseNodeVisitor):
         if any(ignore(node) for ignore in self._ignore_predicates):
             return
 
-        source_code = source.node_to_string(node)
-        self._module_expressions[source_code].append(node)
+        fingerprint = fingerprints.get_fingerprint(node)
+        self._module_expressions[fingerprint].append(node)
 
         maybe_function = walk.get_closest_parent(node, FunctionNodes)
         if maybe_function is not None:
-            self._function_expressions[maybe_function][source_code].append(
+            self._function_expressions[maybe_function][fingerprint].append(
                 node,
             )
 
     def _post_visit(self) -> None:
-        for mod_source, module_nodes in self._module_expressions.items():
+        for module_nodes in self._module_expressions.values():
             if len(module_nodes) > self.options.max_module_expressions:
-                self.add_violation(
-                    complexity.OverusedExpressionViolation(
-                        module_nodes[0],
-                        text=self._msg.format(mod_source, len(module_nodes)),
-                        baseline=self.options.max_module_expressions,
-                    ),
+                self._add_overuse_violation(
+                    module_nodes, self.options.max_module_expressions,
                 )
 
         for function_contexts in self._function_expressions.values():
-            for src, function_nodes in function_contexts.items():
+            for function_nodes in function_contexts.values():
                 if len(function_nodes) > self.options.max_function_expressions:
-                    self.add_violation(
-                        complexity.OverusedExpressionViolation(
-                            function_nodes[0],
-                            text=self._msg.format(src, len(function_nodes)),
-                            baseline=self.options.max_function_expressions,
-                        ),
+                    self._add_overuse_violation(
+                        function_nodes, self.options.max_function_expressions,
                     )
+
+    def _add_overuse_violation(
+        self,
+        overused_nodes: List[ast.AST],
+        baseline: int,
+    ) -> None:
+        # We only need the source code when we show it to the user:
+        self.add_violation(
+            complexity.OverusedExpressionViolation(
+                overused_nodes[0],
+                text=self._msg.format(
+                    source.get_source_segment(self.tree, overused_nodes[0]),
+                    len(overused_nodes),
+                ),
+                baseline=baseline,
+            ),
+        )
@@ -1,11 +1,11 @@
 import ast
 from collections import defaultdict
 from functools import reduce
-from typing import ClassVar, DefaultDict, List, Mapping, Set, Type
+from typing import ClassVar, DefaultDict, Dict, List, Mapping, Set, Type
 
 from typing_extensions import final
 
-from wemake_python_styleguide.logic import source
+from wemake_python_styleguide.logic import fingerprints, source
 from wemake_python_styleguide.logic.tree import ifs, operators
 from wemake_python_styleguide.logic.tree.compares import CompareBounds
 from wemake_python_styleguide.logic.tree.functions import given_function_called
@@ -29,8 +29,10 @@ from wemake_python_styleguide.visitors.base import BaseNodeVisitor
 _OperatorPairs = Mapping[Type[ast.boolop], Type[ast.cmpop]]
 
 
-def _duplicated_isinstance_call(node: ast.BoolOp) -> List[str]:
-    counter: DefaultDict[str, int] = defaultdict(int)
+def _duplicated_isinstance_call(node: ast.BoolOp) -> List[ast.expr]:
+    counter: DefaultDict[
+        fingerprints.Fingerprint, List[ast.expr],
+    ] = defaultdict(list)
 
     for call in node.values:
         if not isinstance(call, ast.Call) or len(call.args) != 2:
@@ -39,17 +41,19 @@ def _duplicated_isinstance_call(node: ast.BoolOp) -> List[str]:
         if not given_function_called(call, {'isinstance'}):
             continue
 
-        isinstance_object = source.node_to_string(call.args[0])
-        counter[isinstance_object] += 1
+        isinstance_object = call.args[0]
+        counter[fingerprints.get_fingerprint(isinstance_object)].append(
+            isinstance_object,
+        )
 
     return [
-        node_name
-        for node_name, count in counter.items()
-        if count > 1
+        same_objects[0]
+        for same_objects in counter.values()
+        if len(same_objects) > 1
     ]
 
 
-def _get_duplicate_names(variables: List[Set[str]]):
+def _get_duplicate_names(variables: List[Set[fingerprints.Fingerprint]]):
     return reduce(
         lambda acc, element: acc.intersection(element),
         variables,
@@ -182,7 +186,7 @@ class BooleanConditionVisitor(BaseNodeVisitor):
     def _get_all_names(
         self,
         node: ast.BoolOp,
-    ) -> List[str]:
+    ) -> List[fingerprints.Fingerprint]:
         # We need to make sure that we do not visit
         # one chained `BoolOp` elements twice:
         self._same_nodes.append(node)
@@ -193,7 +197,7 @@ class BooleanConditionVisitor(BaseNodeVisitor):
                 names.extend(self._get_all_names(operand))
             else:
                 names.append(
-                    source.node_to_string(
+                    fingerprints.get_fingerprint(
                         operators.unwrap_unary_node(operand),
                     ),
                 )
@@ -211,9 +215,14 @@ class BooleanConditionVisitor(BaseNodeVisitor):
         if not isinstance(node.op, ast.Or):
             return
 
-        for var_name in _duplicated_isinstance_call(node):
+        for isinstance_object in _duplicated_isinstance_call(node):
             self.add_violation(
-                UnmergedIsinstanceCallsViolation(node, text=var_name),
+                UnmergedIsinstanceCallsViolation(
+                    node,
+                    text=source.get_source_segment(
+                        self.tree, isinstance_object,
+                    ),
+                ),
             )
 
 
@@ -240,7 +249,8 @@ class ImplicitBoolPatternsVisitor(BaseNodeVisitor):
         self.generic_visit(node)
 
     def _check_implicit_in(self, node: ast.BoolOp) -> None:
-        variables: List[Set[str]] = []
+        variables: List[Set[fingerprints.Fingerprint]] = []
+        compared: Dict[fingerprints.Fingerprint, ast.expr] = {}
 
         for cmp in node.values:
             if not isinstance(cmp, ast.Compare) or len(cmp.ops) != 1:
@@ -248,11 +258,18 @@ class ImplicitBoolPatternsVisitor(BaseNodeVisitor):
             if not isinstance(cmp.ops[0], self._allowed[node.op.__class__]):
                 return
 
-            variables.append({source.node_to_string(cmp.left)})
+            fingerprint = fingerprints.get_fingerprint(cmp.left)
+            compared.setdefault(fingerprint, cmp.left)
+            variables.append({fingerprint})
 
         for duplicate in _get_duplicate_names(variables):
             self.add_violation(
-                ImplicitInConditionViolation(node, text=duplicate),
+                ImplicitInConditionViolation(
+                    node,
+                    text=source.get_source_segment(
+                        self.tree, compared[duplicate],
+                    ),
+                ),
             )
 
     def _check_implicit_complex_compare(self, node: ast.BoolOp) -> None:
@@ -7,7 +7,10 @@ from typing_extensions import final
 from wemake_python_styleguide.compat.aliases import FunctionNodes
 from wemake_python_styleguide.logic import nodes
 from wemake_python_styleguide.logic.tree import exceptions
-from wemake_python_styleguide.logic.walk import is_contained
+from wemake_python_styleguide.logic.walk import (
+    get_subnodes_by_type,
+    is_contained,
+)
 from wemake_python_styleguide.types import AnyNodes
 from wemake_python_styleguide.violations.best_practices import (
     BaseExceptionViolation,
@@ -149,8 +152,8 @@ class NestedTryBlocksVisitor(BaseNodeVisitor):
         self.generic_visit(node)
 
     def _check_nested_try(self, node: ast.Try) -> None:
-        for sub_node in ast.walk(node):
-            if isinstance(sub_node, ast.Try) and sub_node is not node:
+        for sub_node in get_subnodes_by_type(node, ast.Try):
+            if sub_node is not node:
                 self.add_violation(NestedTryViolation(sub_node))
 
 
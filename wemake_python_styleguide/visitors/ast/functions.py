@@ -1,6 +1,6 @@
 import ast
 from contextlib import suppress
-from typing import ClassVar, Dict, List, Mapping, Union
+from typing import ClassVar, Dict, Iterator, List, Mapping, Union, cast
 
 from typing_extensions import final
 
@@ -10,7 +10,7 @@ from wemake_python_styleguide.constants import (
     FUNCTIONS_BLACKLIST,
     LITERALS_BLACKLIST,
 )
-from wemake_python_styleguide.logic import nodes, source, walk
+from wemake_python_styleguide.logic import nodes, walk
 from wemake_python_styleguide.logic.arguments import function_args
 from wemake_python_styleguide.logic.naming import access
 from wemake_python_styleguide.logic.tree import (
@@ -158,7 +158,7 @@ class WrongFunctionCallVisitor(base.BaseNodeVisitor):
             )
 
     def _is_call_ignored(self, node: ast.Call) -> bool:
-        call = source.node_to_string(node.func)
+        call = functions.get_function_name(node)
         func_called = functions.given_function_called(
             node, self._functions.keys(),
         )
@@ -266,12 +266,14 @@ class FunctionDefinitionVisitor(base.BaseNodeVisitor):
         local_variables: Dict[str, List[_LocalVariable]] = {}
 
         for body_item in node.body:
-            for sub_node in ast.walk(body_item):
-                if isinstance(sub_node, (ast.Name, ast.ExceptHandler)):
-                    var_name = self._get_variable_name(sub_node)
-                    self._maybe_update_variable(
-                        sub_node, var_name, local_variables,
-                    )
+            sub_nodes = walk.get_subnodes(
+                body_item, (ast.Name, ast.ExceptHandler),
+            )
+            for sub_node in cast(Iterator[_LocalVariable], sub_nodes):
+                var_name = self._get_variable_name(sub_node)
+                self._maybe_update_variable(
+                    sub_node, var_name, local_variables,
+                )
 
         self._ensure_used_variables(local_variables)
 
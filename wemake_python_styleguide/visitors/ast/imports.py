@@ -131,6 +131,8 @@ class _ImportFromValidator(_BaseImportValidator):
 class WrongImportVisitor(BaseNodeVisitor):
     """Responsible for finding wrong imports."""
 
+    used_options = frozenset(('i_control_code',))
+
     def __init__(self, *args, **kwargs) -> None:
         """Creates a checker for tracked violations."""
         super().__init__(*args, **kwargs)
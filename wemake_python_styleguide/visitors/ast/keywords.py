@@ -231,6 +231,9 @@ class WrongContextManagerVisitor(BaseNodeVisitor):
 class GeneratorKeywordsVisitor(BaseNodeVisitor):
     """Checks how generators are defined and used."""
 
+    # Only the first consecutive ``yield`` of the whole module is reported:
+    module_scoped = True
+
     _allowed_nodes: ClassVar[AnyNodes] = (
         ast.Name,
         ast.Call,
@@ -270,8 +273,8 @@ class GeneratorKeywordsVisitor(BaseNodeVisitor):
         self.generic_visit(node)
 
     def _check_consecutive_yields(self, node: AnyFunctionDef) -> None:
-        for sub in ast.walk(node):
-            if isinstance(sub, ast.Expr) and isinstance(sub.value, ast.Yield):
+        for sub in walk.get_subnodes_by_type(node, ast.Expr):
+            if isinstance(sub.value, ast.Yield):
                 self._yield_locations[sub.value.lineno] = sub
 
     def _check_yield_from_type(self, node: ast.YieldFrom) -> None:
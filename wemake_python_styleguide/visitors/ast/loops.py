@@ -6,7 +6,7 @@ from typing_extensions import final
 
 from wemake_python_styleguide.compat.aliases import AssignNodes
 from wemake_python_styleguide.compat.functions import get_assign_targets
-from wemake_python_styleguide.logic import nodes, source, walk
+from wemake_python_styleguide.logic import nodes, walk
 from wemake_python_styleguide.logic.tree import loops, operators, slices
 from wemake_python_styleguide.logic.tree.variables import (
     is_valid_block_variable_definition,
@@ -306,14 +306,10 @@ class SyncForLoopVisitor(base.BaseNodeVisitor):
         self.generic_visit(node)
 
     def _check_implicit_items(self, node: ast.For) -> None:
-        iterable = source.node_to_string(node.iter)
-        target = source.node_to_string(node.target)
-
-        for sub in ast.walk(node):
+        for sub in walk.get_subnodes_by_type(node, ast.Subscript):
             has_violation = (
-                isinstance(sub, ast.Subscript) and
                 not self._is_assigned_target(sub) and
-                slices.is_same_slice(iterable, target, sub)
+                slices.is_same_slice(node.iter, node.target, sub)
             )
             if has_violation:
                 self.add_violation(ImplicitItemsIteratorViolation(node))
@@ -23,6 +23,9 @@ from wemake_python_styleguide.visitors.decorators import alias
 class EmptyModuleContentsVisitor(BaseNodeVisitor):
     """Restricts to have empty modules."""
 
+    # Definitions are also module contents:
+    module_scoped = True
+
     def visit_Module(self, node: ast.Module) -> None:
         """
         Checks that module has something other than module definition.
@@ -39,7 +42,7 @@ class EmptyModuleContentsVisitor(BaseNodeVisitor):
         """
         self._check_init_contents(node)
         self._check_module_contents(node)
-        self.generic_visit(node)
+        # We don't go deeper, since only the module itself is checked.
 
     def _is_init(self) -> bool:
         return get_stem(self.filename) == constants.INIT
@@ -69,6 +72,8 @@ class EmptyModuleContentsVisitor(BaseNodeVisitor):
 class MagicModuleFunctionsVisitor(BaseNodeVisitor):
     """Restricts to use magic module functions."""
 
+    used_options = frozenset(('i_control_code',))
+
     def visit_FunctionDef(self, node: ast.FunctionDef) -> None:
         """
         Checks that module hasn't magic module functions.
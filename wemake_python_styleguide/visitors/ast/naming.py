@@ -19,18 +19,14 @@ from wemake_python_styleguide.compat.functions import get_assign_targets
 from wemake_python_styleguide.compat.types import AnyAssignWithWalrus
 from wemake_python_styleguide.constants import (
     MODULE_METADATA_VARIABLES_BLACKLIST,
-    SPECIAL_ARGUMENT_NAMES_WHITELIST,
-    UNREADABLE_CHARACTER_COMBINATIONS,
     UNUSED_PLACEHOLDER,
 )
-from wemake_python_styleguide.logic import nodes
+from wemake_python_styleguide.logic import nodes, walk
 from wemake_python_styleguide.logic.naming import (
     access,
-    alphabet,
-    blacklists,
-    builtins,
     logical,
     name_nodes,
+    rules,
 )
 from wemake_python_styleguide.logic.tree import functions
 from wemake_python_styleguide.types import (
@@ -48,25 +44,28 @@ from wemake_python_styleguide.visitors.decorators import alias
 _VariableDef = Union[ast.Name, ast.Attribute, ast.ExceptHandler]
 _ErrorCallback = Callable[[base.BaseViolation], None]
 
-_PredicateCallback = Callable[[str], bool]
-_Predicates = Mapping[_PredicateCallback, Type[base.BaseViolation]]
+#: Failed naming rules, and violations that are reported for them.
+_RuleViolations = Mapping[int, Type[base.BaseViolation]]
 
 
 @final
 class _NameValidator(object):
     """Utility class to separate logic from the naming visitor."""
 
-    _naming_predicates: ClassVar[_Predicates] = {
-        builtins.is_builtin_name: naming.BuiltinShadowingViolation,
-        builtins.is_wrong_alias: naming.TrailingUnderscoreViolation,
-
-        access.is_private: naming.PrivateNameViolation,
-
-        alphabet.does_contain_unicode: naming.UnicodeNameViolation,
-        alphabet.does_contain_underscored_number:
-            naming.UnderscoredNumberNameViolation,
-        alphabet.does_contain_consecutive_underscores:
+    _rule_violations: ClassVar[_RuleViolations] = {
+        rules.BUILTIN_SHADOWING: naming.BuiltinShadowingViolation,
+        rules.TRAILING_UNDERSCORE: naming.TrailingUnderscoreViolation,
+        rules.PRIVATE: naming.PrivateNameViolation,
+        rules.UNICODE: naming.UnicodeNameViolation,
+        rules.UNDERSCORED_NUMBER: naming.UnderscoredNumberNameViolation,
+        rules.CONSECUTIVE_UNDERSCORES:
             naming.ConsecutiveUnderscoresInNameViolation,
+        rules.TOO_SHORT: naming.TooShortNameViolation,
+        rules.TOO_LONG: naming.TooLongNameViolation,
+        rules.WRONG_NAME: naming.WrongVariableNameViolation,
+        rules.RESERVED_ARGUMENT: naming.ReservedArgumentNameViolation,
+        rules.WRONG_UNUSED_NAME: naming.WrongUnusedVariableNameViolation,
+        rules.UNREADABLE: naming.UnreadableNameViolation,
     }
 
     def __init__(
@@ -76,10 +75,7 @@ class _NameValidator(object):
     ) -> None:
         """Creates new instance of a name validator."""
         self._error_callback = error_callback
-        self._options = options
-        self._variable_names_blacklist = (
-            blacklists.variable_names_blacklist_from(options)
-        )
+        self._naming_rules = rules.naming_rules_from(options)
 
     def check_name(
         self,
@@ -88,14 +84,13 @@ class _NameValidator(object):
         *,
         is_first_argument: bool = False,
     ) -> None:
-        for predicate, violation in self._naming_predicates.items():
-            if predicate(name):
-                self._error_callback(violation(node, text=name))
-
-        self._ensure_length(node, name)
-        self._ensure_complex_naming(
-            node, name, is_first_argument=is_first_argument,
+        verdicts = rules.get_verdicts(
+            self._naming_rules, name, is_first_argument=is_first_argument,
         )
+        for rule, text, baseline in verdicts:
+            self._error_callback(self._rule_violations[rule](
+                node, text=text, baseline=baseline,
+            ))
 
     def check_function_signature(self, node: AnyFunctionDefAndLambda) -> None:
         for arg in functions.get_all_arguments(node):
@@ -111,62 +106,14 @@ class _NameValidator(object):
     def check_attribute_name(self, node: ast.ClassDef) -> None:
         top_level_assigns = [
             sub
-            for sub in ast.walk(node)
-            if isinstance(sub, AssignNodes) and nodes.get_context(sub) is node
+            for sub in walk.get_subnodes(node, AssignNodes)
+            if nodes.get_context(sub) is node
         ]
 
         for assignment in top_level_assigns:
-            for target in get_assign_targets(assignment):
+            for target in get_assign_targets(cast(AnyAssign, assignment)):
                 self._ensure_case(target)
 
-    def _ensure_length(self, node: ast.AST, name: str) -> None:
-        min_length = self._options.min_name_length
-        if logical.is_too_short_name(name, min_length=min_length):
-            self._error_callback(
-                naming.TooShortNameViolation(
-                    node, text=name, baseline=min_length,
-                ),
-            )
-
-        max_length = self._options.max_name_length
-        if logical.is_too_long_name(name, max_length=max_length):
-            self._error_callback(
-                naming.TooLongNameViolation(
-                    node, text=name, baseline=max_length,
-                ),
-            )
-
-    def _ensure_complex_naming(
-        self,
-        node: ast.AST,
-        name: str,
-        *,
-        is_first_argument: bool,
-    ) -> None:
-        if logical.is_wrong_name(name, self._variable_names_blacklist):
-            self._error_callback(
-                naming.WrongVariableNameViolation(node, text=name),
-            )
-
-        if not is_first_argument:
-            if logical.is_wrong_name(name, SPECIAL_ARGUMENT_NAMES_WHITELIST):
-                self._error_callback(
-                    naming.ReservedArgumentNameViolation(node, text=name),
-                )
-
-        if access.is_unused(name) and len(name) > 1:
-            self._error_callback(
-                naming.WrongUnusedVariableNameViolation(node, text=name),
-            )
-
-        unreadable_sequence = alphabet.get_unreadable_characters(
-            name, UNREADABLE_CHARACTER_COMBINATIONS,
-        )
-        if unreadable_sequence:
-            self._error_callback(
-                naming.UnreadableNameViolation(node, text=unreadable_sequence),
-            )
-
     def _ensure_case(self, node: ast.AST) -> None:
         if not isinstance(node, ast.Name):
             return
@@ -196,6 +143,13 @@ class _NameValidator(object):
 class WrongNameVisitor(BaseNodeVisitor):
     """Performs checks based on variable names."""
 
+    used_options = frozenset((
+        'allowed_domain_names',
+        'forbidden_domain_names',
+        'max_name_length',
+        'min_name_length',
+    ))
+
     def __init__(self, *args, **kwargs) -> None:
         """Initializes new naming validator for this visitor."""
         super().__init__(*args, **kwargs)
@@ -2,7 +2,7 @@ import ast
 
 from typing_extensions import final
 
-from wemake_python_styleguide.logic import source
+from wemake_python_styleguide.logic import fingerprints, walk
 from wemake_python_styleguide.logic.tree import functions, operators, slices
 from wemake_python_styleguide.violations import (
     best_practices,
@@ -52,9 +52,7 @@ class SubscriptVisitor(base.BaseNodeVisitor):
 
         if not (lower_ok and upper_ok and step_ok):
             self.add_violation(
-                consistency.RedundantSubscriptViolation(
-                    node, text=str(node),
-                ),
+                consistency.RedundantSubscriptViolation(node),
             )
 
     def _is_none(self, component_value: ast.expr) -> bool:
@@ -91,13 +89,10 @@ class ImplicitDictGetVisitor(base.BaseNodeVisitor):
         if not isinstance(node.test.ops[0], ast.In):
             return
 
-        checked_key = source.node_to_string(node.test.left)
-        checked_collection = source.node_to_string(node.test.comparators[0])
-
-        for sub in ast.walk(node):
-            if not isinstance(sub, ast.Subscript):
-                continue
+        checked_key = node.test.left
+        checked_collection = node.test.comparators[0]
 
+        for sub in walk.get_subnodes_by_type(node, ast.Subscript):
             if slices.is_same_slice(checked_collection, checked_key, sub):
                 self.add_violation(refactoring.ImplicitDictGetViolation(sub))
 
@@ -133,10 +128,7 @@ class CorrectKeyVisitor(base.BaseNodeVisitor):
             isinstance(node.slice, ast.Index) and
             isinstance(node.slice.value, ast.BinOp) and
             isinstance(node.slice.value.op, ast.Sub) and
-            self._is_wrong_len(
-                node.slice.value,
-                source.node_to_string(node.value),
-            )
+            self._is_wrong_len(node.slice.value, node.value)
         )
 
         if is_len_call:
@@ -144,11 +136,11 @@ class CorrectKeyVisitor(base.BaseNodeVisitor):
                 refactoring.ImplicitNegativeIndexViolation(node),
             )
 
-    def _is_wrong_len(self, node: ast.BinOp, element: str) -> bool:
+    def _is_wrong_len(self, node: ast.BinOp, element: ast.expr) -> bool:
         return (
             isinstance(node.left, ast.Call) and
             bool(functions.given_function_called(node.left, {'len'})) and
-            source.node_to_string(node.left.args[0]) == element
+            fingerprints.is_same(node.left.args[0], element)
         )
 
     def _is_float_key(self, node: ast.Index) -> bool:
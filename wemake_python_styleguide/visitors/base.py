@@ -52,6 +52,10 @@ We follow these conventions:
 - We try to separate as much logic from ``visit_`` methods as possible,
   so they only route for callbacks that actually executes the checks
 - We place repeating logic into ``logic/`` package to be able to reuse it
+- Visitors list all options they read in ``used_options``,
+  so their cached violations are reused when other options change
+- ``ast`` based visitors report violations of the whole module
+  only from ``_check_statistics``, see :ref:`incremental <incremental>`
 
 There are different example of visitors in this project already.
 
@@ -63,7 +67,9 @@ Reference
 import abc
 import ast
 import tokenize
-from typing import List, Sequence, Type
+import typing
+from collections import Counter
+from typing import ClassVar, FrozenSet, Hashable, List, Sequence, Type
 
 from typing_extensions import final
 
@@ -73,6 +79,9 @@ from wemake_python_styleguide.logic.filenames import get_stem
 from wemake_python_styleguide.types import ConfigurationOptions
 from wemake_python_styleguide.violations.base import BaseViolation
 
+#: Statistics of a module part, statistics of parts are merged by addition.
+ModuleStatistics = typing.Counter[Hashable]
+
 
 class BaseVisitor(object, metaclass=abc.ABCMeta):
     """
@@ -83,9 +92,14 @@ class BaseVisitor(object, metaclass=abc.ABCMeta):
         filename: filename passed by ``flake8``, each visitor has a file name.
         violations: list of :term:`violations <violation>`
         for the specific visitor.
+        used_options: names of all options that this visitor reads.
+
+    .. versionchanged:: 0.15.0
 
     """
 
+    used_options: ClassVar[FrozenSet[str]] = frozenset()
+
     def __init__(
         self,
         options: ConfigurationOptions,
@@ -135,6 +149,24 @@ class BaseVisitor(object, metaclass=abc.ABCMeta):
         By default does nothing.
         """
 
+    def _get_statistics(self) -> ModuleStatistics:
+        """
+        Returns statistics of the visited part of the module.
+
+        Statistics must not reference any nodes,
+        since they are reused when the part has not changed.
+        By default there are no statistics.
+        """
+        return Counter()
+
+    def _check_statistics(self, statistics: ModuleStatistics) -> None:
+        """
+        Executed once with merged statistics of all parts.
+
+        This method is useful for checks of the whole module.
+        By default does nothing.
+        """
+
 
 class BaseNodeVisitor(ast.NodeVisitor, BaseVisitor, metaclass=abc.ABCMeta):
     """
@@ -143,11 +175,21 @@ class BaseNodeVisitor(ast.NodeVisitor, BaseVisitor, metaclass=abc.ABCMeta):
     This class should be used as a base class for all ``ast`` based checkers.
     Method ``visit()`` is defined in ``NodeVisitor`` class.
 
+    Module can also be checked in parts, one top-level definition at a time.
+    Then ``_post_visit`` is executed after each part,
+    and ``_check_statistics`` is executed once
+    with statistics of all parts merged together.
+
     Attributes:
         tree: ``ast`` tree to be checked.
+        module_scoped: whether this visitor can only check the whole module.
+
+    .. versionchanged:: 0.15.0
 
     """
 
+    module_scoped: ClassVar[bool] = False
+
     def __init__(
         self,
         options: ConfigurationOptions,
@@ -187,9 +229,20 @@ class BaseNodeVisitor(ast.NodeVisitor, BaseVisitor, metaclass=abc.ABCMeta):
 
     @final
     def run(self) -> None:
-        """Recursively visits all ``ast`` nodes. Then executes post hook."""
+        """Recursively visits all ``ast`` nodes. Then executes post hooks."""
         self.visit(self.tree)
+        self.check_module(self.finish_part())
+
+    @final
+    def finish_part(self) -> ModuleStatistics:
+        """Executes post hook of a visited part, returns its statistics."""
         self._post_visit()
+        return self._get_statistics()
+
+    @final
+    def check_module(self, statistics: ModuleStatistics) -> None:
+        """Checks statistics of all parts of the module."""
+        self._check_statistics(statistics)
 
 
 class BaseFilenameVisitor(BaseVisitor, metaclass=abc.ABCMeta):
@@ -222,6 +275,7 @@ class BaseFilenameVisitor(BaseVisitor, metaclass=abc.ABCMeta):
             self.stem = get_stem(self.filename)
             self.visit_filename()
             self._post_visit()
+            self._check_statistics(self._get_statistics())
 
 
 class BaseTokenVisitor(BaseVisitor, metaclass=abc.ABCMeta):
@@ -284,3 +338,4 @@ class BaseTokenVisitor(BaseVisitor, metaclass=abc.ABCMeta):
         for token in self.file_tokens:
             self.visit(token)
         self._post_visit()
+        self._check_statistics(self._get_statistics())
@@ -10,6 +10,11 @@ from wemake_python_styleguide.visitors.base import BaseFilenameVisitor
 class WrongModuleNameVisitor(BaseFilenameVisitor):
     """Checks that modules have correct names."""
 
+    used_options = frozenset((
+        'max_name_length',
+        'min_name_length',
+    ))
+
     def visit_filename(self) -> None:
         """
         Checks a single module's filename.
@@ -0,0 +1,159 @@
+"""
+Runs many ``ast`` based :term:`visitors <visitor>` in a single tree walk.
+
+Regular :class:`wemake_python_styleguide.visitors.base.BaseNodeVisitor`
+instances walk the whole tree on their own.
+It means that the walking overhead is paid once per visitor.
+
+Fused walker visits each node only once
+and sends it to every visitor method that is registered for its type.
+
+.. mermaid::
+   :caption: Fused walker relation with visitors.
+
+    graph TD
+        T[ast tree] --> W[FusedWalker]
+        W --> V1[Visitor 1]
+        W --> V2[Visitor 2]
+        W --> VN[Visitor N]
+
+We rely on a convention that all our visitors follow:
+``self.generic_visit(node)`` is the last statement of each handler.
+So, nodes are always processed in pre-order.
+When a handler does not call ``generic_visit``,
+its visitor does not receive any nodes from this subtree.
+That's exactly how the regular walk works.
+
+"""
+
+import ast
+import types
+from typing import Callable, Dict, FrozenSet, List, Optional, Sequence, Tuple
+
+from typing_extensions import final
+
+from wemake_python_styleguide.compat.routing import (
+    RouteKey,
+    get_route_key,
+    get_visit_method,
+)
+from wemake_python_styleguide.visitors.base import BaseNodeVisitor
+
+#: Bound method of a visitor that accepts a node.
+_VisitMethod = Callable[[ast.AST], None]
+
+#: We store visitors together with their methods for each node type.
+_VisitMethods = List[Tuple[BaseNodeVisitor, _VisitMethod]]
+
+#: Visitors that do not want to see any nodes from the current subtree.
+_Pruned = FrozenSet[BaseNodeVisitor]
+
+#: Called when any visitor fails, should be called inside ``except`` block.
+ErrorCallback = Callable[[BaseNodeVisitor], None]
+
+
+def _get_visit_method(
+    visitor: BaseNodeVisitor,
+    node: ast.AST,
+) -> Optional[_VisitMethod]:
+    if type(visitor).visit is not BaseNodeVisitor.visit:
+        # Some visitors redefine `visit` method to catch all nodes:
+        return visitor.visit
+
+    visit_method = get_visit_method(type(visitor), node)
+    if visit_method is None:
+        return None
+    return types.MethodType(visit_method, visitor)
+
+
+@final
+class FusedWalker(object):
+    """
+    Walks the tree once and dispatches nodes to all the visitors.
+
+    Violations are collected inside each visitor as usual.
+    And post hooks are executed in the order of visitors.
+
+    If a visitor raises an exception it is not used anymore.
+    Other visitors keep working. It is the same as running them separately.
+
+    Attributes:
+        visitors: visitors that are still working.
+
+    """
+
+    def __init__(
+        self,
+        visitors: Sequence[BaseNodeVisitor],
+        on_error: ErrorCallback,
+    ) -> None:
+        """Creates new walker for the given visitor instances."""
+        self.visitors = list(visitors)
+        self._on_error = on_error
+        self._visit_methods: Dict[RouteKey, _VisitMethods] = {}
+        self._descended = False
+
+        for visitor in self.visitors:
+            # Handlers call `generic_visit` when they want to go deeper.
+            # Here we only record this fact, we walk the tree ourselves:
+            visitor.generic_visit = self._descend  # type: ignore
+
+    def run(self, tree: ast.AST) -> None:
+        """Visits all nodes with all visitors. Then executes post hooks."""
+        self._visit(tree, frozenset())
+        for visitor in self.visitors:
+            try:
+                visitor.check_module(visitor.finish_part())
+            except Exception:
+                self._on_error(visitor)
+
+    def _visit(self, node: ast.AST, pruned: _Pruned) -> None:
+        for visitor, visit_method in self._get_visit_methods(node):
+            if pruned and visitor in pruned:
+                continue
+            if not self._dispatch(visitor, visit_method, node):
+                pruned = pruned.union((visitor,))
+
+        for subnode in ast.iter_child_nodes(node):
+            self._visit(subnode, pruned)
+
+    def _dispatch(
+        self,
+        visitor: BaseNodeVisitor,
+        visit_method: _VisitMethod,
+        node: ast.AST,
+    ) -> bool:
+        """Returns whether visitor has asked to visit the subtree."""
+        self._descended = False
+        try:
+            visit_method(node)
+        except Exception:
+            self._on_error(visitor)
+            self._remove_visitor(visitor)
+        return self._descended
+
+    def _descend(self, node: ast.AST) -> None:
+        self._descended = True
+
+    def _get_visit_methods(self, node: ast.AST) -> _VisitMethods:
+        route_key = get_route_key(node)
+        visit_methods = self._visit_methods.get(route_key)
+        if visit_methods is None:
+            visit_methods = []
+            for visitor in self.visitors:
+                visit_method = _get_visit_method(visitor, node)
+                if visit_method is not None:
+                    visit_methods.append((visitor, visit_method))
+            self._visit_methods[route_key] = visit_methods
+        return visit_methods
+
+    def _remove_visitor(self, visitor: BaseNodeVisitor) -> None:
+        self.visitors.remove(visitor)
+        self._visit_methods = {
+            route_key: [
+                visit_pair
+                for visit_pair in visit_methods
+                if visit_pair[0] is not visitor
+            ]
+            for route_key, visit_methods in self._visit_methods.items()
+        }
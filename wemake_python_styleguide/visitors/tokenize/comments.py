@@ -40,6 +40,8 @@ from wemake_python_styleguide.visitors.base import BaseTokenVisitor
 class WrongCommentVisitor(BaseTokenVisitor):
     """Checks comment tokens."""
 
+    used_options = frozenset(('max_noqa_comments',))
+
     _no_cover: ClassVar[Pattern] = re.compile(r'^pragma:\s+no\s+cover')
     _noqa_check: ClassVar[Pattern] = re.compile(r'^(noqa:?)($|[A-Z\d\,\s]+)')
     _type_check: ClassVar[Pattern] = re.compile(
@@ -0,0 +1,144 @@
+"""
+Time budgets of visitors, they contain pathological modules.
+
+Some modules, usually generated ones, make our visitors very slow.
+A single stuck module delays the whole ``flake8`` run.
+
+When ``--max-visitor-time`` option is set,
+each visitor is stopped when it checks a module for longer than that.
+When ``--max-module-time`` option is set,
+visitors are stopped when all checks of a module take longer than that.
+Other visitors still check the module.
+Each stopped visitor is reported with
+:class:`wemake_python_styleguide.violations.system.TimeoutViolation`.
+
+Visitors are interrupted by the ``SIGALRM`` signal,
+so even a single slow call inside a visitor is stopped.
+That's why budgets only work in the main thread on Unix,
+and only when nobody else uses the alarm already.
+
+Incremental checks run each visitor on its own, so they are stopped as usual.
+Fused visitors walk the ``ast`` tree together, so they share their budgets:
+the walk is stopped when it takes longer than all their budgets together,
+or than the rest of the module budget.
+Then all visitors that are still walking the tree are stopped.
+
+.. _watchdog:
+
+Watchdog API
+------------
+
+.. autoclass:: Watchdog
+   :no-undoc-members:
+
+.. autoexception:: BudgetExceeded
+
+"""
+
+import contextlib
+import signal
+import threading
+import time
+from types import FrameType
+from typing import Iterator, List, Optional, Sequence, Set, Type
+
+from typing_extensions import Final, final
+
+from wemake_python_styleguide.types import ConfigurationOptions
+from wemake_python_styleguide.violations.system import TimeoutViolation
+from wemake_python_styleguide.visitors.base import BaseVisitor
+
+#: Visitors still start, when the module is out of time.
+_MIN_DELAY: Final = 0.001
+
+
+@final
+class BudgetExceeded(BaseException):  # noqa: WPS418
+    """
+    Interrupts a visitor that has run out of time.
+
+    It is not an ``Exception``, so visitors can not catch it by accident.
+    """
+
+
+def _interrupt(signum: int, frame: Optional[FrameType]) -> None:
+    raise BudgetExceeded()
+
+
+def _can_interrupt() -> bool:
+    return (
+        getattr(signal, 'setitimer', None) is not None and
+        threading.current_thread() is threading.main_thread() and
+        not signal.getitimer(signal.ITIMER_REAL)[0]
+    )
+
+
+@contextlib.contextmanager
+def _alarm(delay: float) -> Iterator[None]:
+    """Raises ``BudgetExceeded`` inside the block after a delay."""
+    if not delay or not _can_interrupt():
+        yield
+        return
+
+    previous_handler = signal.signal(signal.SIGALRM, _interrupt)
+    signal.setitimer(signal.ITIMER_REAL, delay)
+    try:
+        yield
+    finally:
+        signal.setitimer(signal.ITIMER_REAL, 0)
+        signal.signal(signal.SIGALRM, previous_handler)
+
+
+@final
+class Watchdog(object):
+    """
+    Runs visitors of a single module within their time budgets.
+
+    Attributes:
+        stopped_visitors: visitors that have run out of time.
+
+    """
+
+    def __init__(self, options: ConfigurationOptions) -> None:
+        """Starts the time budget of a module, zero values are unlimited."""
+        self.stopped_visitors: Set[Type[BaseVisitor]] = set()
+        self._visitor_time = options.max_visitor_time
+        self._deadline: Optional[float] = None
+        if options.max_module_time:
+            self._deadline = time.monotonic() + options.max_module_time
+
+    def run(self, visitor: BaseVisitor) -> None:
+        """Runs a visitor, it is stopped when it runs out of time."""
+        with self.watch([visitor]):
+            visitor.run()
+
+    @contextlib.contextmanager
+    def watch(self, visitors: Sequence[BaseVisitor]) -> Iterator[None]:
+        """
+        Stops visitors that run together inside the block.
+
+        They share their budgets, and the rest of the module budget.
+        Visitors are stopped, when they are still in the sequence.
+        So, visitors that have already failed can be removed from it.
+        """
+        start = time.monotonic()
+        try:
+            with _alarm(self._get_delay(start, len(visitors))):
+                yield
+        except BudgetExceeded:
+            for visitor in visitors:
+                self._stop(visitor, time.monotonic() - start)
+
+    def _get_delay(self, start: float, visitors_count: int) -> float:
+        delays: List[float] = []
+        if self._visitor_time:
+            delays.append(self._visitor_time * visitors_count)
+        if self._deadline is not None:
+            delays.append(max(self._deadline - start, _MIN_DELAY))
+        return min(delays, default=0)
+
+    def _stop(self, visitor: BaseVisitor, spent_time: float) -> None:
+        self.stopped_visitors.add(type(visitor))
+        visitor.add_violation(TimeoutViolation(text='{0} {1:.3f}s'.format(
+            type(visitor).__qualname__, spent_time,
+        )))